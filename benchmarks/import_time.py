@@ -0,0 +1,59 @@
+"""
+Benchmark for the time it takes to import the client.
+
+Times ``import citrine`` and a few common first imports, each in a fresh interpreter, and
+lists the heavy modules each one loads.  The resource modules, gemd, boto3 and asyncio are
+only loaded when they are first used, so none of them should be listed for
+``import citrine``.  Run from the repository root::
+
+    python benchmarks/import_time.py
+"""
+import statistics
+import subprocess
+import sys
+
+N_RUNS = 10
+
+# Modules that should only be loaded by the code that needs them
+HEAVY_MODULES = ["citrine.resources.project", "gemd.json", "pint", "boto3", "pandas",
+                 "asyncio", "aiohttp"]
+
+_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed)
+print(','.join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def time_import(statement: str):
+    """Return the median seconds statement takes in a fresh interpreter, and what it loads."""
+    timings = []
+    loaded = ''
+    for _ in range(N_RUNS):
+        output = subprocess.run(
+            [sys.executable, "-c", _SCRIPT.format(statement=statement, heavy=HEAVY_MODULES)],
+            check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout.splitlines()
+        timings.append(float(output[0]))
+        loaded = output[1] if len(output) > 1 else ''
+    return statistics.median(timings), loaded
+
+
+def main():
+    """Print the median import time of each statement and the heavy modules it loads."""
+    statements = [
+        "import citrine",
+        "from citrine import Citrine",
+        "from citrine.resources.project import ProjectCollection",
+        "from citrine.resources.file_link import FileCollection",
+    ]
+    print("{:<58} {:>10}  {}".format("statement", "time (s)", "heavy modules loaded"))
+    for statement in statements:
+        elapsed, loaded = time_import(statement)
+        print("{:<58} {:>10.3f}  {}".format(statement, elapsed, loaded or "-"))
+
+
+if __name__ == "__main__":
+    main()
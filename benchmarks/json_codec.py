@@ -0,0 +1,81 @@
+"""
+Benchmark for decoding large listing pages with each JSON codec.
+
+Builds pages of material runs as the platform returns them when listing (each with its
+uids, tags, a process link, a spec link and measured properties), and times how long each
+installed codec takes to decode a page, and to encode a batch of the same objects as
+register_all does.  Run from the repository root::
+
+    python benchmarks/json_codec.py
+"""
+import time
+from uuid import uuid4
+
+from citrine._utils.json_codec import JsonCodec, OrjsonCodec
+
+PAGE_SIZES = (100, 1000, 10000)
+REPEATS = 5
+
+
+def _link():
+    return {'type': 'link_by_uid', 'scope': 'id', 'id': str(uuid4())}
+
+
+def material_run(i: int) -> dict:
+    """Return a material run as a listing page holds it."""
+    return {
+        'type': 'material_run',
+        'name': 'cake {}'.format(i),
+        'uids': {'id': str(uuid4()), 'lims': 'CAKE-{}'.format(i)},
+        'tags': ['batch::{}'.format(i // 100), 'recipe::chocolate'],
+        'notes': 'Baked at {} degC'.format(150 + i % 50),
+        'process': _link(),
+        'spec': _link(),
+        'sample_type': 'experimental',
+        'file_links': [],
+        'dataset': str(uuid4()),
+        'audit_info': {'created_by': str(uuid4()), 'created_at': 1600000000000 + i},
+        'properties': [{
+            'type': 'property',
+            'name': 'density',
+            'template': _link(),
+            'origin': 'measured',
+            'value': {'type': 'normal_real', 'mean': 1.0 + i / 1e4, 'std': 0.01,
+                      'units': 'gram / centimeter ** 3'},
+        }],
+    }
+
+
+def _time(func, arg) -> float:
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Print the best time of each codec to decode and encode pages of each size."""
+    codecs = [JsonCodec()]
+    try:
+        codecs.append(OrjsonCodec())
+    except ImportError:
+        print("orjson is not installed; only the standard library is timed")
+    baseline = codecs[0]
+    print("{:<8} {:>7} {:>10} {:>12} {:>12} {:>8}".format(
+        "codec", "objects", "size (kB)", "decode (ms)", "encode (ms)", "speedup"))
+    for size in PAGE_SIZES:
+        page = {'contents': [material_run(i) for i in range(size)], 'next': str(uuid4())}
+        body = baseline.dumps(page)
+        reference = _time(baseline.loads, body)
+        for codec in codecs:
+            decode = _time(codec.loads, body)
+            encode = _time(codec.dumps, {'objects': page['contents']})
+            print("{:<8} {:>7} {:>10.0f} {:>12.2f} {:>12.2f} {:>7.1f}x".format(
+                codec.name, size, len(body) / 1000, decode * 1000, encode * 1000,
+                reference / decode))
+
+
+if __name__ == "__main__":
+    main()
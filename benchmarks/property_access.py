@@ -0,0 +1,60 @@
+"""
+Microbenchmark for attribute access on built resources.
+
+Compares reading Property-backed fields with the base-class lookup recomputed on every
+access (the behavior before it was memoized) against the memoized lookup, using a plain
+Python attribute read as the reference point.  Run from the repository root::
+
+    python benchmarks/property_access.py
+"""
+import timeit
+from uuid import uuid4
+
+from citrine._serialization import properties
+from citrine.informatics.design_candidate import DesignCandidate
+from citrine.informatics.predictor_evaluation_result import PredictorEvaluationResult
+from citrine.resources.material_run import MaterialRun
+
+from serialization import design_candidate_data, predictor_evaluation_result_data
+
+N_READS = 200000
+
+
+class _Plain:
+    def __init__(self):
+        self.name = "plain"
+
+
+def _uncached_base_class(obj, key):
+    return properties._find_base_class(obj.__class__, key)
+
+
+def main():
+    """Print per-read timings for a few fields of MaterialRun, DesignCandidate and PER."""
+    run = MaterialRun("run", uids={"id": str(uuid4())}, tags=["a::b"], notes="notes")
+    candidate = DesignCandidate.build(design_candidate_data())
+    result = PredictorEvaluationResult.build(predictor_evaluation_result_data())
+    cases = [
+        ("plain attribute", _Plain(), "name"),
+        ("MaterialRun.name", run, "name"),
+        ("MaterialRun.uids", run, "uids"),
+        ("DesignCandidate.material", candidate, "material"),
+        ("DesignCandidate.primary_score", candidate, "primary_score"),
+        ("PredictorEvaluationResult.evaluator", result, "evaluator"),
+    ]
+
+    print("{:<38} {:>12} {:>12}".format("field", "before (ns)", "after (ns)"))
+    memoized = properties._get_base_class
+    for label, obj, attr in cases:
+        read = lambda: getattr(obj, attr)  # noqa: E731
+        properties._get_base_class = _uncached_base_class
+        try:
+            before = timeit.timeit(read, number=N_READS) / N_READS * 1e9
+        finally:
+            properties._get_base_class = memoized
+        after = timeit.timeit(read, number=N_READS) / N_READS * 1e9
+        print("{:<38} {:>12.0f} {:>12.0f}".format(label, before, after))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark for serializing a batch of GEMD objects for registration.
+
+Compares the multi-pass pipeline that register and register_all used to run (assign uids by
+serializing with GEMDJson and discarding the result, dump, scrub None values, replace nested
+objects with links, and strip temporary uids) against the single-pass WritePayload, on a
+batch of 10,000 material runs.  Each run has its own process run, which has no uids yet and
+references a shared spec and condition template.  Run from the repository root::
+
+    python benchmarks/register_payload.py
+"""
+import time
+from uuid import uuid4
+
+from gemd.entity.attribute import Condition
+from gemd.entity.bounds import RealBounds
+from gemd.entity.value import NominalReal
+from gemd.json import GEMDJson
+from gemd.util import recursive_foreach
+
+from citrine._utils.functions import scrub_none, replace_objects_with_links
+from citrine.resources.condition_template import ConditionTemplate
+from citrine.resources.data_concepts import DataConceptsCollection, CITRINE_SCOPE
+from citrine.resources.material_run import MaterialRun
+from citrine.resources.process_run import ProcessRun
+from citrine.resources.process_spec import ProcessSpec
+
+N_OBJECTS = 10000
+
+
+def material_runs(n: int):
+    """Return n material runs, each made by a new process run that references shared objects."""
+    template = ConditionTemplate('temperature', bounds=RealBounds(0, 1000, 'degC'),
+                                 uids={'id': str(uuid4())})
+    spec = ProcessSpec('bake', uids={'id': str(uuid4())})
+    runs = []
+    for i in range(n):
+        process = ProcessRun('bake {}'.format(i), spec=spec, tags=['batch::{}'.format(i)],
+                             conditions=[Condition('temperature', template=template,
+                                                   value=NominalReal(100 + i % 50, 'degC'))])
+        runs.append(MaterialRun('cake {}'.format(i), process=process,
+                                tags=['batch::{}'.format(i)], notes=None))
+    return runs
+
+
+def legacy_dump_for_write(models, *, dry_run: bool):
+    """The serialization that register and register_all did before WritePayload."""
+    temp_scope = str(uuid4())
+    scope = temp_scope if dry_run else CITRINE_SCOPE
+    json = GEMDJson(scope=scope)
+    [json.dumps(x) for x in models]  # This apparent no-op populates uids
+    objects = [replace_objects_with_links(scrub_none(model.dump())) for model in models]
+    recursive_foreach(models, lambda x: x.uids.pop(temp_scope, None))  # Strip temp uids
+    return objects
+
+
+def _time(func, dry_run: bool) -> float:
+    models = material_runs(N_OBJECTS)  # Fresh objects, since uids are assigned
+    start = time.perf_counter()
+    func(models, dry_run=dry_run)
+    return time.perf_counter() - start
+
+
+def main():
+    """Print the time to serialize the batch with each pipeline."""
+    print("{:<10} {:>12} {:>12} {:>8}".format("mode", "legacy (s)", "fused (s)", "speedup"))
+    for dry_run in (False, True):
+        legacy = _time(legacy_dump_for_write, dry_run)
+        fused = _time(DataConceptsCollection._dump_for_write, dry_run)
+        print("{:<10} {:>12.3f} {:>12.3f} {:>7.1f}x".format(
+            "dry run" if dry_run else "write", legacy, fused, legacy / fused))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Microbenchmark for Serializable.build and Serializable.dump.
+
+Compares a "cold" path, in which the per-class serialization plans are discarded before
+every call (which is what every call paid before plans were cached), against the normal
+"warm" path that reuses them.  Run from the repository root::
+
+    python benchmarks/serialization.py
+"""
+import timeit
+from uuid import uuid4
+
+from citrine._serialization import properties
+from citrine.informatics.design_candidate import DesignCandidate
+from citrine.informatics.predictor_evaluation_result import PredictorEvaluationResult
+
+N_CALLS = 2000
+
+
+def design_candidate_data() -> dict:
+    """A design candidate with a realistic mix of design variables."""
+    return {
+        "material_id": str(uuid4()),
+        "identifiers": ["candidate-1", "candidate-1-alias"],
+        "primary_score": 0.73,
+        "material": {
+            "vars": {
+                **{"real {}".format(i): {"type": "R", "m": 1.0 * i, "s": 0.1}
+                   for i in range(20)},
+                "category": {"type": "C", "cp": {"a": 0.6, "b": 0.3, "c": 0.1}},
+                "mixture": {"type": "M", "q": {"water": 0.7, "salt": 0.3}},
+                "formula": {"type": "F", "f": "NaCl"},
+                "smiles": {"type": "S", "s": "C1=CC=CC=C1"},
+            }
+        }
+    }
+
+
+def predictor_evaluation_result_data() -> dict:
+    """A cross-validation result with predicted-vs-actual points for two responses."""
+    real_point = {
+        "uuid": str(uuid4()), "identifiers": ["Foo"], "trial": 1, "fold": 3,
+        "predicted": {"type": "RealMetricValue", "mean": 1.0, "standard_error": 0.12},
+        "actual": {"type": "RealMetricValue", "mean": 1.2, "standard_error": 0.0}
+    }
+    categorical_point = {
+        "uuid": str(uuid4()), "identifiers": ["Foo"], "trial": 1, "fold": 3,
+        "predicted": {"salt": 0.3, "not salt": 0.7}, "actual": {"not salt": 1.0}
+    }
+    return {
+        "type": "CrossValidationResult",
+        "evaluator": {
+            "type": "CrossValidationEvaluator", "name": "Example", "description": "",
+            "responses": ["salt?", "saltiness"], "n_folds": 6, "n_trials": 8,
+            "metrics": [{"type": "PVA"}, {"type": "RMSE"}, {"type": "F1"}],
+            "ignore_when_grouping": []
+        },
+        "response_results": {
+            "salt?": {"metrics": {
+                "predicted_vs_actual": {"type": "CategoricalPredictedVsActual",
+                                        "value": [categorical_point] * 20},
+                "f1": {"type": "RealMetricValue", "mean": 0.3}
+            }},
+            "saltiness": {"metrics": {
+                "predicted_vs_actual": {"type": "RealPredictedVsActual",
+                                        "value": [real_point] * 20},
+                "rmse": {"type": "RealMetricValue", "mean": 0.4, "standard_error": 0.12}
+            }}
+        }
+    }
+
+
+def _time(func, cold: bool) -> float:
+    def run():
+        if cold:
+            properties._serialization_plans.clear()
+        func()
+    return timeit.timeit(run, number=N_CALLS)
+
+
+def main():
+    """Print cold and warm timings for build and dump of the largest resource types."""
+    cases = [
+        (DesignCandidate, design_candidate_data()),
+        (PredictorEvaluationResult, predictor_evaluation_result_data()),
+    ]
+    print("{:<28} {:<6} {:>10} {:>10} {:>8}".format("type", "op", "cold (s)", "warm (s)",
+                                                    "speedup"))
+    for klass, data in cases:
+        obj = klass.build(data)
+        for op, func in [("build", lambda: klass.build(data)), ("dump", obj.dump)]:
+            cold = _time(func, cold=True)
+            warm = _time(func, cold=False)
+            print("{:<28} {:<6} {:>10.3f} {:>10.3f} {:>7.1f}x".format(
+                klass.__name__, op, cold, warm, cold / warm))
+
+
+if __name__ == "__main__":
+    main()
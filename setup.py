@@ -28,11 +28,18 @@ setup(name='citrine',
           "boto3>=1.17.93,<2",
           "botocore>=1.20.95,<2",
           "deprecation>=2.0.7,<3",
-          "urllib3>=1.26.5,<2"
+          "urllib3>=1.26.5,<2",
+          "contextvars>=2.4,<3; python_version < '3.7'"
       ],
       extras_require={
           "builders": [
               "pandas>=1.1.0,<2"
+          ],
+          "async": [
+              "aiohttp>=3.7,<4"
+          ],
+          "fast-json": [
+              "orjson>=3.5,<4"
           ]
       },
       classifiers=[
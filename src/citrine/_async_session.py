@@ -0,0 +1,275 @@
+"""An asyncio-native counterpart to Session, for driving many requests from one event loop."""
+import asyncio
+import json as json_lib
+from logging import getLogger
+from time import monotonic
+from typing import Optional, Callable, Awaitable, AsyncIterator, List, Tuple
+
+from citrine._session import Session, _default_retry, _wire_size
+from citrine._utils.telemetry import RequestRecord, current_tags, tagged, template_path
+
+logger = getLogger(__name__)
+
+# urllib3's default cap on the delay between retries, in seconds
+_BACKOFF_MAX = 120
+
+
+class _AsyncRequest:
+    """The parts of a request that error reporting looks at."""
+
+    def __init__(self, method: str):
+        self.method = method
+
+
+class AsyncResponse:
+    """
+    A fully-read HTTP response.
+
+    This mirrors the parts of :class:`requests.Response` used by the client (``status_code``,
+    ``reason``, ``text``, ``content``, ``headers``, ``request`` and ``json()``), so that
+    response checking and the exception types are shared with the synchronous Session.
+    """
+
+    def __init__(self, method: str, status_code: int, reason: Optional[str],
+                 headers: dict, content: bytes, encoding: Optional[str] = None):
+        self.request = _AsyncRequest(method)
+        # Filled in by AsyncSession, for telemetry
+        self.request_size = 0
+        self.uncompressed_request_size = 0
+        self.retries = 0
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or 'utf-8'
+
+    @property
+    def text(self) -> str:
+        """The body of the response, decoded."""
+        return self.content.decode(self.encoding, errors='replace')
+
+    def json(self):
+        """Decode the body of the response as JSON."""
+        return json_lib.loads(self.text)
+
+
+def _encode_params(params: Optional[dict]) -> List[Tuple[str, str]]:
+    """Encode query parameters the way requests does (lists repeat the key, bools are str'd)."""
+    encoded = []
+    for key, value in (params or {}).items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        encoded.extend((key, str(v)) for v in values if v is not None)
+    return encoded
+
+
+class AsyncSession:
+    """
+    [ALPHA] An asyncio-native session for the Citrine Platform.
+
+    Requests are made with aiohttp, so a single event loop can drive many of them at once.
+    The AsyncSession wraps a synchronous :class:`Session`, and shares its access token, its
+    retry policy and its mapping from HTTP status codes to exceptions.  Token refreshes are
+    rare, so they are delegated to the synchronous session on a worker thread, and only one
+    refresh is made at a time no matter how many requests are waiting on it.
+
+    The AsyncSession must be closed when it is no longer needed, either by awaiting
+    :meth:`close` or by using it as an async context manager.
+
+    Parameters
+    ----------
+    session: Session
+        The synchronous session whose host, credentials and settings are used.
+    max_connections: int
+        The maximum number of simultaneous connections to the platform.  Default: 100
+
+    """
+
+    def __init__(self, session: Session, *, max_connections: int = 100):
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:  # pragma: no cover
+            raise ImportError('aiohttp>=3.7 is a requirement for AsyncSession')
+        self.session = session
+        self.max_connections = max_connections
+        self.retries = _default_retry()
+        self._client = None
+        self._refresh_lock = None
+
+    async def __aenter__(self) -> 'AsyncSession':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close all connections held by this session."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            import aiohttp
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self._client = aiohttp.ClientSession(connector=connector,
+                                                 headers=dict(self.session.headers))
+        return self._client
+
+    async def _send(self, method: str, uri: str, **kwargs) -> AsyncResponse:
+        """Make a single HTTP request and read its whole body."""
+        client = self._get_client()
+        async with client.request(method, uri, **kwargs) as response:
+            content = await response.read()
+            return AsyncResponse(method, response.status, response.reason,
+                                 dict(response.headers), content, response.charset)
+
+    async def _request_with_retry(self, method: str, uri: str, *,
+                                  params: Optional[dict] = None,
+                                  json: Optional[dict] = None,
+                                  **kwargs) -> AsyncResponse:
+        """Make a request, retrying on connection errors and the retryable status codes."""
+        import aiohttp
+        headers = dict(kwargs.pop('headers', None) or {})
+        if self.session.access_token is not None:
+            headers['Authorization'] = 'Bearer ' + self.session.access_token
+        body_size = None
+        if json is not None:
+            kwargs['data'], encoding, body_size = self.session._encode_json_body(json)
+            if encoding is not None:
+                headers['Content-Encoding'] = encoding
+        request_kwargs = dict(params=_encode_params(params), headers=headers, **kwargs)
+
+        connect_errors = status_errors = 0
+        while True:
+            try:
+                response = await self._send(method, uri, **request_kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                connect_errors += 1
+                if connect_errors > self.retries.connect:
+                    raise
+                logger.warning('{} seen, retrying request'.format(repr(e)))
+                await asyncio.sleep(self._backoff(connect_errors))
+                continue
+            response.request_size = len(request_kwargs.get('data') or '')
+            response.uncompressed_request_size = response.request_size if body_size is None \
+                else body_size
+            response.retries = connect_errors + status_errors
+            has_retry_after = 'Retry-After' in response.headers
+            if not self.retries.is_retry(method, response.status_code, has_retry_after):
+                return response
+            status_errors += 1
+            if status_errors > self.retries.status:
+                return response
+            await asyncio.sleep(self._backoff(status_errors))
+
+    def _backoff(self, attempt: int) -> float:
+        """Match urllib3's exponential backoff, which skips the delay on the first retry."""
+        if attempt <= 1:
+            return 0
+        return min(_BACKOFF_MAX,
+                   self.retries.backoff_factor * (2 ** (attempt - 1)))
+
+    async def _refresh_access_token(self, stale_token: Optional[str]) -> None:
+        """Refresh the shared access token, unless another task already replaced it."""
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            if self.session.access_token != stale_token and \
+                    not self.session._is_access_token_expired():
+                return
+            loop = asyncio.get_running_loop()
+            # Shares the synchronous session's single-flight refresh with its threads
+            await loop.run_in_executor(None, self.session._refresh_access_token_if_stale,
+                                       stale_token)
+
+    async def checked_request(self, method: str, path: str,
+                              version: str = 'v1', **kwargs) -> AsyncResponse:
+        """Make a request and throw the exception matching its status code, if any."""
+        logger.debug('BEGIN async request: %s %s (%s)', method, path, version)
+        start = monotonic()
+        tags = current_tags()
+        token_refreshes = 0
+        response = None
+        error = None
+        try:
+            if self.session._is_access_token_expired():
+                await self._refresh_access_token(self.session.access_token)
+                token_refreshes += 1
+            uri = self.session._versioned_base_url(version) + path.lstrip('/')
+
+            token = self.session.access_token
+            response = await self._request_with_retry(method, uri, **kwargs)
+            if response.status_code == 401:
+                try:
+                    invalid_token = response.json().get("reason") == "invalid-token"
+                except (AttributeError, ValueError):
+                    invalid_token = False
+                if invalid_token:
+                    await self._refresh_access_token(token)
+                    token_refreshes += 1
+                    response = await self._request_with_retry(method, uri, **kwargs)
+
+            return Session._check_response(method, path, response)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            telemetry = self.session.telemetry
+            if telemetry is not None:
+                measured = {}
+                if response is not None:
+                    measured = dict(
+                        status=response.status_code,
+                        bytes_sent=response.request_size,
+                        bytes_received=_wire_size(response.headers, len(response.content)),
+                        uncompressed_bytes_sent=response.uncompressed_request_size,
+                        uncompressed_bytes_received=len(response.content),
+                        retries=response.retries)
+                telemetry.record(RequestRecord(
+                    method, template_path(path), latency=monotonic() - start,
+                    token_refreshes=token_refreshes, tags=tags,
+                    error=type(error).__name__ if error is not None else None, **measured))
+
+    async def get_resource(self, path: str, **kwargs) -> dict:
+        """GET a particular resource as JSON."""
+        response = await self.checked_request('GET', path, **kwargs)
+        return self.session._extract_response_json(path, response)
+
+    async def post_resource(self, path: str, json: dict, **kwargs) -> dict:
+        """POST to a particular resource as JSON."""
+        response = await self.checked_request('POST', path, json=json, **kwargs)
+        return self.session._extract_response_json(path, response)
+
+    async def put_resource(self, path: str, json: dict, **kwargs) -> dict:
+        """PUT data given by some JSON at a particular resource."""
+        response = await self.checked_request('PUT', path, json=json, **kwargs)
+        return self.session._extract_response_json(path, response)
+
+    async def delete_resource(self, path: str, **kwargs) -> dict:
+        """DELETE a particular resource as JSON."""
+        response = await self.checked_request('DELETE', path, **kwargs)
+        return self.session._extract_response_json(path, response)
+
+    @staticmethod
+    async def cursor_paged_resource(base_method: Callable[..., Awaitable[dict]], path: str,
+                                    forward: bool = True, per_page: int = 100,
+                                    version: str = 'v2', **kwargs) -> AsyncIterator[dict]:
+        """
+        Returns a flat async generator of results for an API query.
+
+        Results are fetched in chunks of size `per_page` and loaded lazily.
+        """
+        params = kwargs.get('params', {})
+        params['forward'] = forward
+        params['ascending'] = forward
+        params['per_page'] = per_page
+        kwargs['params'] = params
+        base_method = tagged('list', base_method)
+        while True:
+            response_json = await base_method(path, version=version, **kwargs)
+            for obj in response_json['contents']:
+                yield obj
+            cursor = response_json.get('next')
+            if cursor is None:
+                break
+            params['cursor'] = cursor
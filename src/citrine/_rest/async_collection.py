@@ -0,0 +1,233 @@
+import asyncio
+from inspect import signature
+from typing import Generic, TypeVar, Optional, Union, List, AsyncIterator
+from uuid import UUID
+
+from gemd.entity.base_entity import BaseEntity
+from gemd.entity.link_by_uid import LinkByUID
+
+from citrine._async_session import AsyncSession
+from citrine._rest.collection import Collection
+from citrine._rest.pageable import Pageable
+from citrine._utils.functions import format_escaped_url
+from citrine._utils.telemetry import operation, tagged
+from citrine.exceptions import ModuleRegistrationFailedException, NonRetryableException
+from citrine.jobs.job import JobSubmissionResponse, JobStatusResponse, \
+    _async_poll_for_job_completion
+from citrine.resources.response import Response
+
+ResourceType = TypeVar('ResourceType')
+
+
+class AsyncCollection(Generic[ResourceType]):
+    """
+    [ALPHA] Asynchronous versions of the core verbs of a collection.
+
+    An AsyncCollection wraps an ordinary collection, and uses its paths, builders and
+    serialization with an :class:`~citrine._async_session.AsyncSession`.  Any collection
+    can be wrapped, though not every collection can be listed (see :meth:`list`); data
+    concepts (GEMD) collections use their cursor-paged listing and batch registration
+    endpoints.
+
+    Parameters
+    ----------
+    collection: Collection
+        The collection whose resources are being accessed.
+    session: AsyncSession
+        The session used to make requests.
+
+    """
+
+    def __init__(self, collection: Collection[ResourceType], session: AsyncSession):
+        self.collection = collection
+        self.session = session
+
+    @property
+    def _is_data_concepts(self) -> bool:
+        from citrine.resources.data_concepts import DataConceptsCollection
+        return isinstance(self.collection, DataConceptsCollection)
+
+    async def get(self, uid: Union[UUID, str, LinkByUID, BaseEntity], *,
+                  scope: Optional[str] = None) -> ResourceType:
+        """Get a particular element of the collection."""
+        collection = self.collection
+        if self._is_data_concepts:
+            # As DataConceptsCollection._fetch_by_link, through the session's object cache
+            from citrine.resources.data_concepts import _make_link_by_uid
+            link = _make_link_by_uid(uid, scope)
+            data = collection._read_cached(link)
+            if data is not None:
+                return collection.build(data)
+            data = await self.session.get_resource(collection._link_path(link))
+            return collection._build_cached(data)
+        if uid is None:
+            raise ValueError("Cannot get when uid=None.  Are you using a registered resource?")
+        data = await self.session.get_resource(collection._get_path(uid))
+        data = data[collection._individual_key] if collection._individual_key else data
+        return collection.build(data)
+
+    def _check_listable(self):
+        """Raise NotImplementedError unless list reproduces how the collection lists."""
+        from citrine.resources.data_concepts import DataConceptsCollection
+        cls = type(self.collection)
+        if self._is_data_concepts:
+            listable = cls.list is DataConceptsCollection.list
+        else:
+            # Lists that only rename or re-default page and per_page (e.g. projects) page the
+            # same way; ones that take filters or fetch pages their own way do not
+            parameters = set(signature(cls.list).parameters)
+            listable = cls._fetch_page is Pageable._fetch_page and \
+                parameters <= {'self', 'page', 'per_page'}
+        if not listable:
+            raise NotImplementedError(
+                "{} lists its elements its own way; use its synchronous list".format(
+                    cls.__name__))
+
+    async def list(self, *, per_page: int = 100,
+                   forward: bool = True) -> AsyncIterator[ResourceType]:
+        """
+        Iterate over every element of the collection.
+
+        This supports data concepts (GEMD) collections, and the collections that list every
+        element a page at a time with ``Collection.list``.  Collections whose listing takes
+        filters or fetches its pages in its own way raise NotImplementedError.
+
+        Parameters
+        ----------
+        per_page: int, optional
+            Max number of results to request at a time. Default is 100.
+        forward: bool
+            Set to False to reverse the order of results of a data concepts collection.
+
+        Returns
+        -------
+        AsyncIterator[ResourceType]
+            An async iterator over the resources in this collection.
+
+        """
+        self._check_listable()
+        collection = self.collection
+        if self._is_data_concepts:
+            params = {}
+            if collection.dataset_id is not None:
+                params['dataset_id'] = str(collection.dataset_id)
+            raw_objects = self.session.cursor_paged_resource(
+                self.session.get_resource,
+                collection._get_path(ignore_dataset=True),
+                forward=forward,
+                per_page=per_page,
+                params=params)
+            async for raw in raw_objects:
+                yield collection._build_cached(raw)
+            return
+
+        # Offset pagination, following Paginator: stop on the last page or a repeated element
+        get_resource = tagged('list', self.session.get_resource)
+        path = collection._get_path()
+        module_type = getattr(collection, '_module_type', None)
+        first_uid = None
+        uids = set()
+        page = 1
+        while True:
+            params = collection._page_params(page, per_page, module_type)
+            elements, next_uri = collection._page_contents(
+                await get_resource(path, params=params))
+
+            count = 0
+            for element in collection._build_collection_elements(elements):
+                uid = getattr(element, 'uid', None)
+                if uid is not None and uid == first_uid:
+                    return
+                if first_uid is None:
+                    first_uid = uid
+                if uid is None or uid not in uids:
+                    uids.add(uid)
+                    yield element
+                count += 1
+            if next_uri == "" and count < per_page:
+                return
+            page += 1
+
+    async def register(self, model: ResourceType, *, dry_run: bool = False) -> ResourceType:
+        """Create or update an element of the collection."""
+        collection = self.collection
+        path = collection._get_path()
+        if self._is_data_concepts:
+            if collection.dataset_id is None:
+                raise RuntimeError("Must specify a dataset in order to register a data "
+                                   "model object.")
+            dumped_data, = collection._dump_for_write([model], dry_run=dry_run)
+            data = await self.session.post_resource(path, dumped_data,
+                                                    params={'dry_run': dry_run})
+            return collection.build(data) if dry_run else collection._build_cached(data)
+        try:
+            data = await self.session.post_resource(path, model.dump())
+            data = data[collection._individual_key] if collection._individual_key else data
+            collection._check_experimental(data)
+            return collection.build(data)
+        except NonRetryableException as e:
+            raise ModuleRegistrationFailedException(model.__class__.__name__, e)
+
+    async def register_all(self, models: List[ResourceType], *,
+                           dry_run: bool = False) -> List[ResourceType]:
+        """
+        Create or update each model in models, with the semantics of the wrapped collection.
+
+        For a collection of a single GEMD type, this is one batch request.  For a
+        :class:`~citrine.resources.gemd_resource.GEMDResourceCollection`, models are
+        registered in batches, in an order that stores linked objects before the objects that
+        reference them, and the uids of the inputs are updated with their on-platform uids.
+        """
+        from citrine.resources.gemd_resource import GEMDResourceCollection, \
+            _write_batches_by_tier
+        collection = self.collection
+        if isinstance(collection, GEMDResourceCollection):
+            resources = []
+            for tier in _write_batches_by_tier(models):
+                # Batches within a tier are independent, so they are sent together
+                results = await asyncio.gather(*[
+                    AsyncCollection(collection._collection_for(batch[0]), self.session)
+                    .register_all(batch, dry_run=dry_run)
+                    for batch in tier])
+                for batch, registered in zip(tier, results):
+                    for prewrite, postwrite in zip(batch, registered):
+                        if isinstance(postwrite, BaseEntity):
+                            prewrite.uids = postwrite.uids
+                    resources.extend(registered)
+            return resources
+
+        if not self._is_data_concepts:
+            raise NotImplementedError("Batch registration is only supported for GEMD objects")
+        if collection.dataset_id is None:
+            raise RuntimeError("Must specify a dataset in order to register a data model object.")
+        objects = collection._dump_for_write(models, dry_run=dry_run)
+        with operation('register_all'):
+            response_data = await self.session.put_resource(collection._get_path() + '/batch',
+                                                            json={'objects': objects},
+                                                            params={'dry_run': dry_run})
+        build = collection.build if dry_run else collection._build_cached
+        return [build(obj) for obj in response_data['objects']]
+
+    async def delete(self, uid: Union[UUID, str, LinkByUID, BaseEntity], *,
+                     dry_run: bool = False) -> Response:
+        """Delete a particular element of the collection."""
+        collection = self.collection
+        if self._is_data_concepts:
+            from citrine.resources.data_concepts import _make_link_by_uid
+            link = _make_link_by_uid(uid)
+            path = collection._get_path() + format_escaped_url("/{}/{}", link.scope, link.id)
+            await self.session.delete_resource(path, params={'dry_run': dry_run})
+            if not dry_run:
+                collection._invalidate_cached(link)
+            return Response(status_code=200)  # delete succeeded
+        data = await self.session.delete_resource(collection._get_path(uid))
+        return Response(body=data)
+
+    async def poll_for_job_completion(self,
+                                      job: Union[JobSubmissionResponse, UUID, str], *,
+                                      timeout: float = 2 * 60,
+                                      polling_delay: float = 2.0) -> JobStatusResponse:
+        """Wait for a job in this collection's project to finish, without blocking the loop."""
+        return await _async_poll_for_job_completion(self.session, self.collection.project_id,
+                                                    job, timeout=timeout,
+                                                    polling_delay=polling_delay)
@@ -100,7 +100,9 @@ class Collection(Generic[ResourceType], Pageable):
         return self._paginator.paginate(page_fetcher=self._fetch_page,
                                         collection_builder=self._build_collection_elements,
                                         page=page,
-                                        per_page=per_page)
+                                        per_page=per_page,
+                                        concurrency=self.session.page_fetch_concurrency,
+                                        session=self.session)
 
     def update(self, model: CreationType) -> CreationType:
         """Update a particular element of the collection."""
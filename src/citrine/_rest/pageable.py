@@ -75,7 +75,10 @@ class Pageable():
         params.update(additional_params or {})
 
         data = fetch_func(path, params=params, **json_body)
+        return self._page_contents(data)
 
+    def _page_contents(self, data) -> Tuple[Iterable[dict], str]:
+        """Split a page of results into its elements and the next uri (empty if none)."""
         try:
             next_uri = data.get('next', "")
         except AttributeError:
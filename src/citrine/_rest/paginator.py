@@ -1,7 +1,15 @@
 import warnings
-from typing import TypeVar, Generic, Callable, Optional, Iterable, Any, Tuple, Iterator
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar, Generic, Callable, Optional, Iterable, Any, Tuple, Iterator, \
+    TYPE_CHECKING
 from uuid import uuid4
 
+from citrine._utils.telemetry import tagged
+
+if TYPE_CHECKING:  # pragma: no cover
+    from citrine._session import Session
+
 ResourceType = TypeVar('ResourceType')
 
 
@@ -19,7 +27,9 @@ class Paginator(Generic[ResourceType]):
                  page: Optional[int] = None,
                  per_page: int = 100,
                  search_params: Optional[dict] = None,
-                 deduplicate: bool = True) -> Iterator[ResourceType]:
+                 deduplicate: bool = True,
+                 concurrency: int = 1,
+                 session: Optional['Session'] = None) -> Iterator[ResourceType]:
         """
         A generic support class to paginate requests into an iterable of a built object.
 
@@ -50,6 +60,14 @@ class Paginator(Generic[ResourceType]):
         deduplicate: bool, optional
             Whether or not to deduplicate the yielded resources by their uid.  The default
             is true.
+        concurrency: int, optional
+            How many pages to request at once.  Pages are requested ahead of time through a
+            thread pool, but results are still yielded in page order.  Once the last page has
+            been seen, any pages still in flight are discarded.  The default of 1 requests
+            each page only after the previous one has been consumed.
+        session: Session, optional
+            The session that page_fetcher makes requests with.  If pages are requested
+            concurrently, its connection pool is grown to match `concurrency`.
 
         Returns
         -------
@@ -66,13 +84,16 @@ class Paginator(Generic[ResourceType]):
                           DeprecationWarning)
 
         first_entity = None
-        page_idx = page
         uids = set()
 
-        while True:
-            subset_collection, next_uri = page_fetcher(page=page_idx, per_page=per_page,
-                                                       **search_params)
+        if page is not None:
+            # Only a single page will be read
+            concurrency = 1
+        if concurrency > 1 and session is not None:
+            session.ensure_pool_size(concurrency)
+        pages = self._fetch_pages(page_fetcher, page, per_page, search_params, concurrency)
 
+        for subset_collection, next_uri in pages:
             subset = collection_builder(subset_collection)
 
             count = 0
@@ -112,10 +133,40 @@ class Paginator(Generic[ResourceType]):
             if next_uri == "" and count < per_page:
                 break
 
-            if page_idx is None:
-                page_idx = 2
-            else:
-                page_idx += 1
+        # Release any pages that were requested ahead but are no longer needed.  If the caller
+        # stops iterating early, the same happens when `pages` is garbage collected.
+        pages.close()
+
+    @staticmethod
+    def _fetch_pages(page_fetcher: Callable[..., Tuple[Iterable[dict], str]],
+                     page: Optional[int],
+                     per_page: int,
+                     search_params: dict,
+                     concurrency: int) -> Iterator[Tuple[Iterable[dict], str]]:
+        """Fetch successive pages starting from `page`, up to `concurrency` at a time."""
+        def next_page(page_idx: Optional[int]) -> int:
+            return 2 if page_idx is None else page_idx + 1
+
+        page_fetcher = tagged('list', page_fetcher)
+        page_idx = page
+        if concurrency <= 1:
+            while True:
+                yield page_fetcher(page=page_idx, per_page=per_page, **search_params)
+                page_idx = next_page(page_idx)
+        else:
+            executor = ThreadPoolExecutor(max_workers=concurrency)
+            in_flight = deque()
+            try:
+                while True:
+                    while len(in_flight) < concurrency:
+                        in_flight.append(executor.submit(page_fetcher, page=page_idx,
+                                                         per_page=per_page, **search_params))
+                        page_idx = next_page(page_idx)
+                    yield in_flight.popleft().result()
+            finally:
+                for future in in_flight:
+                    future.cancel()
+                executor.shutdown(wait=False)
 
     def _comparison_fields(self, entity: ResourceType) -> Any:
         """
@@ -37,6 +37,17 @@ class Property(typing.Generic[DeserializedType, SerializedType]):
         self.optional = False
         self.override = override
 
+    @property
+    def serialization_path(self) -> typing.Optional[str]:
+        """Dot-separated sequence of nested dictionary keys at which this property is stored."""
+        return self._serialization_path
+
+    @serialization_path.setter
+    def serialization_path(self, value: typing.Optional[str]):
+        self._serialization_path = value
+        # Split once here rather than on every (de)serialization
+        self._path_fields = value.split('.') if isinstance(value, str) else None
+
     @property
     @abstractmethod
     def underlying_types(self) -> typing.Union[DeserializedType, typing.Tuple[DeserializedType]]:
@@ -83,8 +94,7 @@ class Property(typing.Generic[DeserializedType, SerializedType]):
     def deserialize_from_dict(self, data: dict) -> DeserializedType:
         value = data
         # `serialization_path` is expected to be a sequence of nested dictionary keys
-        fields = self.serialization_path.split('.')
-        for field in fields:
+        for field in self._path_fields:
             next_value = value.get(field)
             if next_value is None:
                 if self.default is None and not self.optional:
@@ -108,7 +118,7 @@ class Property(typing.Generic[DeserializedType, SerializedType]):
         else:
             base_class = _get_base_class(data, self.serialization_path)
             _data = data
-            fields = self.serialization_path.split('.')
+            fields = self._path_fields
             for field in fields[:-1]:
                 _data = _data.setdefault(field, {})
             _data[fields[-1]] = self.serialize(value, base_class=base_class)
@@ -116,11 +126,11 @@ class Property(typing.Generic[DeserializedType, SerializedType]):
 
     def __get__(self, obj, objtype=None) -> DeserializedType:
         """Property getter, deferring to the getter of the parent class, if applicable."""
-        base_class = _get_base_class(obj, self.serialization_path)
-        if base_class is not None and self.override:
-            return getattr(base_class, self.serialization_path).fget(obj)
-        else:
-            return getattr(obj, self._key, self.default)
+        if self.override:
+            base_class = _get_base_class(obj, self.serialization_path)
+            if base_class is not None:
+                return getattr(base_class, self.serialization_path).fget(obj)
+        return getattr(obj, self._key, self.default)
 
     def __set__(self, obj, value: typing.Union[SerializedType, DeserializedType]):
         """Property setter, deferring to the setter of the parent class, if applicable."""
@@ -169,14 +179,29 @@ class PropertyCollection(Property[DeserializedType, SerializedType]):
         """
 
 
+_base_class_memo: typing.Dict[typing.Tuple[type, typing.Any], typing.Optional[type]] = {}
+
+
 def _get_base_class(obj: object, key: str) -> type:
     """
     Return the base class that has key as an attribute, if it exists.
 
     If there are no base classes with key as an attribute, OR if there are multiple base classes
     with key as an attribute, return None.
+
+    This is called on every property access, so the result is memoized per (class, key).
     """
-    base_classes = obj.__class__.__bases__  # Tuple of all base classes of obj
+    memo_key = (obj.__class__, key)
+    try:
+        return _base_class_memo[memo_key]
+    except KeyError:
+        base_class = _base_class_memo[memo_key] = _find_base_class(obj.__class__, key)
+        return base_class
+
+
+def _find_base_class(klass: type, key: str) -> type:
+    """Search the direct base classes of klass for the one that has key as an attribute."""
+    base_classes = klass.__bases__  # Tuple of all base classes of klass
     try:
         classes_with_key = [base_class for base_class in base_classes if hasattr(base_class, key)]
     except TypeError:
@@ -187,6 +212,44 @@ def _get_base_class(obj: object, key: str) -> type:
         return None
 
 
+class _SerializationPlan:
+    """
+    The (de)serialization plan for a single class, compiled once and then reused.
+
+    Discovering the Property fields of a class means walking its bases and their __dict__s,
+    which is far more expensive than the (de)serialization of most objects.  Plans are
+    cached per class by `_plan_for`, so every `Object` property for a class shares one.
+    """
+
+    def __init__(self, klass: type):
+        self.klass = klass
+        # We need to use __dict__ here because other access methods will invoke __get__
+        # Start with the fields from the parent classes, overwriting with any newer classes
+        self.fields: typing.Dict[str, Property] = {
+            k: v for x in klass.__bases__ for k, v in x.__dict__.items()
+            if isinstance(v, Property)}
+        self.fields.update(
+            {k: v for k, v in klass.__dict__.items() if isinstance(v, Property)})
+        self.serializable_fields: typing.Tuple[typing.Tuple[str, Property], ...] = tuple(
+            (k, v) for k, v in self.fields.items() if v.serializable)
+        self.deserializable_fields: typing.Tuple[typing.Tuple[str, Property], ...] = tuple(
+            (k, v) for k, v in self.fields.items() if v.deserializable)
+        self.polymorphic: bool = "get_type" in klass.__dict__ and \
+            issubclass(klass, PolymorphicSerializable)
+        self.root: typing.Optional['Object'] = None
+
+
+_serialization_plans: typing.Dict[type, _SerializationPlan] = {}
+
+
+def _plan_for(klass: type) -> _SerializationPlan:
+    """Return the cached serialization plan for klass, compiling it on first use."""
+    plan = _serialization_plans.get(klass)
+    if plan is None:
+        plan = _serialization_plans.setdefault(klass, _SerializationPlan(klass))
+    return plan
+
+
 class Integer(Property[int, SerializedInteger]):
 
     @property
@@ -623,15 +686,22 @@ class Object(PropertyCollection[typing.Any, dict]):
                          default,
                          override)
         self.klass = klass
-        # We need to use __dict__ here because other access methods will invoke __get__
-        # Start with the fields from the parent classes, overwriting with any newer classes
-        self.fields = {k: v
-                       for x in self.klass.__bases__
-                       for k, v in x.__dict__.items() if isinstance(v, Property)}
-        self.fields.update(
-            {k: v for k, v in self.klass.__dict__.items() if isinstance(v, Property)})
-        self.polymorphic = "get_type" in self.klass.__dict__ and\
-                           issubclass(self.klass, PolymorphicSerializable)
+        self._plan = _plan_for(klass)
+        self.fields = self._plan.fields
+        self.polymorphic = self._plan.polymorphic
+
+    @classmethod
+    def for_class(cls, klass: typing.Type[typing.Any]) -> 'Object':
+        """
+        Return a shared, path-less Object property for klass.
+
+        This is what `Serializable.build` and `Serializable.dump` use, so that the property
+        (and its plan) is constructed once per class rather than once per call.
+        """
+        plan = _plan_for(klass)
+        if plan.root is None:
+            plan.root = cls(klass)
+        return plan.root
 
     @property
     def underlying_types(self):
@@ -652,10 +722,9 @@ class Object(PropertyCollection[typing.Any, dict]):
                                  " explicitly serializable class".format(self.klass))
 
         instance = self.klass.__new__(self.klass, {})
-        for property_name, field in self.fields.items():
-            if field.deserializable:
-                value = field.deserialize_from_dict(data)
-                setattr(instance, property_name, value)
+        for property_name, field in self._plan.deserializable_fields:
+            value = field.deserialize_from_dict(data)
+            setattr(instance, property_name, value)
         return instance
 
     def _serialize(self, obj: typing.Any) -> dict:
@@ -676,10 +745,9 @@ class Object(PropertyCollection[typing.Any, dict]):
             except AttributeError:
                 raise AttributeError("Tried to serialize object {!r} of type {}, which has "
                                      "neither fields not a dump() method.".format(obj, type(obj)))
-        for property_name, field in self.fields.items():
-            if field.serializable:
-                value = getattr(obj, property_name)
-                serialized = field.serialize_to_dict(serialized, value)
+        for property_name, field in self._plan.serializable_fields:
+            value = getattr(obj, property_name)
+            serialized = field.serialize_to_dict(serialized, value)
         return serialized
 
     def __str__(self):
@@ -17,12 +17,12 @@ class Serializable(Generic[Self]):
         """Build an instance of this object from given data."""
         from citrine._serialization import properties
         pre_built = cls._pre_build(data)
-        return properties.Object(cls).deserialize(pre_built)
+        return properties.Object.for_class(cls).deserialize(pre_built)
 
     def dump(self) -> dict:
         """Dump this instance."""
         from citrine._serialization import properties
-        serialized = properties.Object(type(self)).serialize(self)
+        serialized = properties.Object.for_class(type(self)).serialize(self)
         return self._post_dump(serialized)
 
     def _post_dump(self, data: dict) -> dict:
@@ -0,0 +1,157 @@
+"""Serialization of GEMD objects into the bodies of the requests that register them."""
+import typing
+from uuid import uuid4
+
+from gemd.entity.base_entity import BaseEntity
+from gemd.entity.dict_serializable import DictSerializable
+from gemd.entity.link_by_uid import LinkByUID
+from gemd.enumeration.base_enumeration import BaseEnumeration
+
+from citrine._serialization import properties
+from citrine._serialization.serializable import Serializable
+
+_JSON_SCALARS = (str, int, float, bool)
+
+
+class WritePayload:
+    """
+    Serializes data concepts objects for registration in a single traversal.
+
+    This produces what ``replace_objects_with_links(scrub_none(model.dump()))`` does once uids
+    have been assigned: keys with the value None are dropped, and the data objects nested in
+    a model are replaced by links.  But nested objects are never serialized, only linked, and
+    the models are not modified.  An object without any uids is given a new one in `scope`,
+    which is used for every link to it; the new uids are collected in :attr:`new_uids` for
+    the caller to keep or discard.
+
+    Parameters
+    ----------
+    scope: str
+        The scope of the uids given to objects that have none.
+    link_scope: str
+        The scope that links use, if the object has a uid in it.  Otherwise links use the
+        first of the object's uids.
+
+    """
+
+    def __init__(self, scope: str, *, link_scope: str):
+        self.scope = scope
+        self.link_scope = link_scope
+        self._new_uids: typing.Dict[int, typing.Tuple[BaseEntity, str]] = {}
+
+    @property
+    def new_uids(self) -> typing.List[typing.Tuple[BaseEntity, str]]:
+        """The (object, uid) pairs for the objects that were given a uid in `scope`."""
+        return list(self._new_uids.values())
+
+    def dump(self, model: typing.Union[Serializable, DictSerializable]) -> dict:
+        """Serialize a model, with the objects it references replaced by links."""
+        if isinstance(model, Serializable):
+            plan = properties.Object.for_class(type(model))._plan
+            data = model._post_dump(self._object(plan, model))
+        else:
+            data = self._gemd(model.as_dict())  # A gemd object
+        if isinstance(model, BaseEntity) and not model.uids:
+            data['uids'] = {self.scope: self._new_uid(model)}
+        return data
+
+    def link(self, entity: BaseEntity) -> dict:
+        """Return the serialized link to an object."""
+        uids = entity.uids
+        if not uids:
+            return LinkByUID(self.scope, self._new_uid(entity)).as_dict()
+        scope = self.link_scope if self.link_scope in uids else next(iter(uids))
+        return LinkByUID(scope, uids[scope]).as_dict()
+
+    def _new_uid(self, entity: BaseEntity) -> str:
+        # Keyed on identity, since objects compare (and hash) by their uids
+        entry = self._new_uids.get(id(entity))
+        if entry is None:
+            entry = self._new_uids[id(entity)] = (entity, str(uuid4()))
+        return entry[1]
+
+    def _object(self, plan, obj) -> dict:
+        serialized = {}
+        for property_name, field in plan.serializable_fields:
+            value = self._value(field, getattr(obj, property_name))
+            if value is None:
+                continue
+            data = serialized
+            fields = field._path_fields
+            for key in fields[:-1]:
+                data = data.setdefault(key, {})
+            data[fields[-1]] = value
+        return serialized
+
+    def _value(self, prop: properties.Property, value: typing.Any) -> typing.Any:
+        """Serialize value as prop does, but linking data objects and dropping None."""
+        kind = type(prop)
+        if kind is properties.Optional:
+            return None if value is None else self._value(prop.prop, value)
+        if not isinstance(value, prop.underlying_types):
+            return prop.serialize(value)  # Raises the usual error
+        if isinstance(value, BaseEntity):
+            return self.link(value)
+        if kind is properties.List:
+            return [self._value(prop.element_type, element) for element in value]
+        if kind is properties.Set:
+            serialized = [self._value(prop.element_type, element) for element in value]
+            try:
+                return sorted(serialized)
+            except TypeError:
+                return serialized
+        if kind is properties.Object:
+            return self._nested_object(prop, value)
+        if kind is properties.LinkOrElse:
+            if isinstance(value, LinkByUID):
+                return value.as_dict()
+            plan = properties.Object.for_class(type(value))._plan
+            return value._post_dump(self._object(plan, value))
+        if kind is properties.Union:
+            for element_type in prop.element_types:
+                try:
+                    return self._value(element_type, value)
+                except ValueError:
+                    pass
+            return prop.serialize(value)  # Raises the usual error
+        if kind is properties.SpecifiedMixedList:
+            if len(value) > len(prop.element_types):
+                return prop.serialize(value)  # Raises the usual error
+            serialized = [self._value(element_type, element)
+                          for element, element_type in zip(value, prop.element_types)]
+            serialized.extend(self._value(element_type, element_type.default)
+                              for element_type in prop.element_types[len(value):])
+            return serialized
+        if kind is properties.Mapping:
+            pairs = ((prop.keys_type.serialize(key), self._value(prop.values_type, item))
+                     for key, item in value.items())
+            if prop.ser_as_list_of_pairs:
+                return list(pairs)
+            return {key: item for key, item in pairs if item is not None}
+        return prop.serialize(value)
+
+    def _nested_object(self, prop: properties.Object, value: typing.Any) -> dict:
+        if type(value) is not prop.klass and isinstance(value, Serializable):
+            # A subclass, which may have more fields
+            return value._post_dump(
+                self._object(properties.Object.for_class(type(value))._plan, value))
+        if prop.fields:
+            return self._object(prop._plan, value)
+        return self._gemd(value)
+
+    def _gemd(self, value: typing.Any) -> typing.Any:
+        """Serialize a gemd object (or part of one) as its own dump() does."""
+        if isinstance(value, BaseEnumeration):
+            return value.value
+        if value is None or isinstance(value, _JSON_SCALARS):
+            return value
+        if isinstance(value, BaseEntity):
+            return self.link(value)
+        if isinstance(value, DictSerializable):
+            value = value.as_dict()
+        if isinstance(value, dict):
+            return {key: self._gemd(item) for key, item in value.items() if item is not None}
+        if isinstance(value, (list, tuple)):
+            return [self._gemd(item) for item in value]
+        raise TypeError("Object of type {} is not JSON serializable".format(
+            type(value).__name__))
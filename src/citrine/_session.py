@@ -1,23 +1,31 @@
+import gzip
 from os import environ
 import platform
-from typing import Optional, Callable, Iterator
+import zlib
+from typing import Optional, Callable, Iterator, Tuple, Mapping
 from logging import getLogger
 from datetime import datetime, timedelta
+from threading import Event, Lock, Thread, local
+from time import monotonic
 
 from requests import Response
+from requests.structures import CaseInsensitiveDict
 from json.decoder import JSONDecodeError
 from urllib.parse import urlunsplit
 from urllib3.util.retry import Retry
 
 import citrine
+from citrine._utils.concurrency import read_ahead
 from citrine._utils.functions import format_escaped_url
+from citrine._utils.json_codec import EncodedJson, JsonCodec
+from citrine._utils.telemetry import RequestRecord, current_tags, tagged, template_path
 from citrine.exceptions import (
     NotFound,
     Unauthorized,
     UnauthorizedRefreshToken,
     WorkflowConflictException,
     WorkflowNotReadyException,
-    BadRequest, CitrineException)
+    BadRequest, PayloadTooLarge, CitrineException)
 
 import jwt
 import requests
@@ -26,23 +34,87 @@ import requests.auth
 # Choose a 5 second buffer so that there's no chance of the access token
 # expiring during the check for expiration
 EXPIRATION_BUFFER_MILLIS: timedelta = timedelta(milliseconds=5000)
+# The background token refresher never refreshes more often than this, in seconds
+_MIN_TOKEN_REFRESH_INTERVAL = 10.0
 logger = getLogger(__name__)
 
+# Requests retried by Session._request_with_retry (after a connection error) in this thread
+_connection_retries = local()
+
+# How to compress a request body with each Content-Encoding that Session.request_compression
+# may be set to.  Level 6 compresses JSON nearly as well as 9, in a fraction of the time.
+_REQUEST_COMPRESSORS = {
+    'gzip': lambda body: gzip.compress(body, compresslevel=6),
+    'deflate': lambda body: zlib.compress(body, 6),
+}
+
+
+def _wire_size(headers: Mapping[str, str], content_size: int) -> int:
+    """The size of a response body as received, given its size after decompression."""
+    headers = CaseInsensitiveDict(headers)
+    if headers.get('Content-Encoding', 'identity') != 'identity' and 'Content-Length' in headers:
+        return int(headers['Content-Length'])
+    # Compressed responses without a Content-Length are counted at their decompressed size
+    return content_size
+
+
+def _default_retry() -> Retry:
+    """
+    Build the retry policy used for HTTP requests to the platform.
+
+    The default HTTP status codes for retries are [503, 413, 429]. We're using status_force list
+    to add additional codes to retry on, focusing on specific CloudFlare 5XX errors.
+    """
+    return Retry(total=10,
+                 connect=5,
+                 read=5,
+                 status=5,
+                 backoff_factor=0.25,
+                 status_forcelist=[500, 502, 504, 520, 521, 522, 524, 527])
+
 
 class Session(requests.Session):
-    """Wrapper around requests.Session that is both refresh-token and schema aware."""
+    """
+    Wrapper around requests.Session that is both refresh-token and schema aware.
+
+    Connections to the platform are pooled.  Operations that make requests from several
+    threads at once grow the pool to match (see :meth:`ensure_pool_size`).
+
+    Parameters
+    ----------
+    pool_maxsize: int
+        The number of connections to keep open to the platform.  Default: 10
+    pool_block: bool
+        Whether a request waits for a free connection once `pool_maxsize` connections are in
+        use, rather than opening a connection that is discarded afterwards.  Default: False
+    keep_alive: bool
+        Whether to reuse connections between requests.  Default: True
+
+    """
 
     def __init__(self,
                  refresh_token: str = environ.get('CITRINE_API_KEY'),
                  scheme: str = 'https',
                  host: str = environ.get('CITRINE_API_HOST'),
-                 port: Optional[str] = None):
+                 port: Optional[str] = None,
+                 *,
+                 pool_maxsize: int = 10,
+                 pool_block: bool = False,
+                 keep_alive: bool = True):
         super().__init__()
+        if pool_maxsize < 1:
+            raise ValueError("pool_maxsize must be positive, got {}".format(pool_maxsize))
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self._pool_lock = Lock()
         self.scheme: str = scheme
         self.authority = ':'.join(([host] if host else []) + ([port] if port else []))
         self.refresh_token: str = refresh_token
         self.access_token: Optional[str] = None
         self.access_token_expiration: datetime = datetime.utcnow()
+        # Held while the access token is refreshed, so that only one thread refreshes it
+        self._token_lock = Lock()
+        self._token_refresher: Optional[Tuple[Thread, Event]] = None
 
         agent = "{}/{} python-requests/{} citrine-python/{}".format(
             platform.python_implementation(),
@@ -64,18 +136,42 @@ class Session(requests.Session):
         # in a future release.
         self.use_idempotent_dataset_put = False
 
-        # Custom adapter so we can use custom retry parameters. The default HTTP status
-        # codes for retries are [503, 413, 429]. We're using status_force list to add
-        # additional codes to retry on, focusing on specific CloudFlare 5XX errors.
-        retries = Retry(total=10,
-                        connect=5,
-                        read=5,
-                        status=5,
-                        backoff_factor=0.25,
-                        status_forcelist=[500, 502, 504, 520, 521, 522, 524, 527])
-        adapter = requests.adapters.HTTPAdapter(max_retries=retries)
-        self.mount('https://', adapter)
-        self.mount('http://', adapter)
+        # Number of cursor pages to fetch ahead on a background thread while the current
+        # page is being consumed. 0 (the default) fetches each page only when it is needed.
+        self.cursor_prefetch_pages = 0
+
+        # Number of offset-paginated pages (projects, modules, candidates, ...) to request at
+        # once when listing. 1 (the default) requests each page after the previous one.
+        # Listings that request pages concurrently grow the connection pool to match.
+        self.page_fetch_concurrency = 1
+
+        # Optional ObjectCache (see citrine._utils.object_cache) that data concepts
+        # collections read GEMD objects through. None (the default) disables caching.
+        self.object_cache = None
+
+        # Optional TableCache (see citrine._utils.table_cache) that GEM Table contents are
+        # read through. None (the default) downloads a table every time it is read.
+        self.table_cache = None
+
+        # Optional RequestTelemetry (see citrine._utils.telemetry), or any other object with a
+        # record(RequestRecord) method, that is told about every request. None (the default)
+        # records nothing.
+        self.telemetry = None
+
+        # Content-Encoding ('gzip' or 'deflate') that JSON request bodies of at least
+        # request_compression_threshold bytes are compressed with. None (the default) sends
+        # every body uncompressed. Responses are always requested compressed.
+        self.request_compression = None
+        self.request_compression_threshold = 64 * 1024
+
+        # JsonCodec (see citrine._utils.json_codec) that request bodies are encoded with and
+        # responses decoded with. Defaults to the standard library; assign an OrjsonCodec to
+        # use orjson (the fast-json extra) instead.
+        self.json_codec = JsonCodec()
+
+        self._mount_adapter()
+        if not keep_alive:
+            self.headers['Connection'] = 'close'
 
         # Requests has it's own set of exceptions that do not inherit from the
         # built-in exceptions. The built-in ConnectionError handles 4 different
@@ -84,6 +180,63 @@ class Session(requests.Session):
                            requests.exceptions.ConnectionError,
                            requests.exceptions.ChunkedEncodingError)
 
+    @property
+    def request_compression(self) -> Optional[str]:
+        """Content-Encoding that large JSON request bodies are compressed with, if any."""
+        return self._request_compression
+
+    @request_compression.setter
+    def request_compression(self, value: Optional[str]):
+        if value is not None and value not in _REQUEST_COMPRESSORS:
+            raise ValueError("request_compression must be one of {} or None, got {}".format(
+                sorted(_REQUEST_COMPRESSORS), value))
+        self._request_compression = value
+
+    def _encode_json_body(self, body) -> Tuple[bytes, Optional[str], int]:
+        """
+        Serialize a JSON request body, compressing it if it is large enough.
+
+        An :class:`~citrine._utils.json_codec.EncodedJson` body is used as it is.
+
+        Returns the body, the Content-Encoding it was compressed with (None if it was not),
+        and its size before compression.
+        """
+        data = body.data if isinstance(body, EncodedJson) else self.json_codec.dumps(body)
+        encoding = self.request_compression
+        if encoding is None or len(data) < self.request_compression_threshold:
+            return data, None, len(data)
+        return _REQUEST_COMPRESSORS[encoding](data), encoding, len(data)
+
+    def _mount_adapter(self):
+        # Custom adapter so we can use custom retry parameters.
+        self._adapter = requests.adapters.HTTPAdapter(max_retries=_default_retry(),
+                                                      pool_maxsize=self.pool_maxsize,
+                                                      pool_block=self.pool_block)
+        self.mount('https://', self._adapter)
+        self.mount('http://', self._adapter)
+
+    def ensure_pool_size(self, connections: int) -> None:
+        """
+        Grow the connection pool to hold at least `connections` connections.
+
+        Operations that make requests from several threads call this with their concurrency,
+        so that connections are reused rather than opened and discarded.  The pool is never
+        shrunk.
+        """
+        with self._pool_lock:
+            if connections <= self.pool_maxsize:
+                return
+            logger.debug('Growing the connection pool from %s to %s connections',
+                         self.pool_maxsize, connections)
+            self.pool_maxsize = connections
+            # The adapter stays mounted and gets a larger pool.  Requests in flight finish on
+            # connections of the old pool, which are closed (rather than pooled) when released.
+            adapter = self._adapter
+            retired = adapter.poolmanager
+            adapter.init_poolmanager(adapter._pool_connections, connections,
+                                     block=self.pool_block)
+            retired.clear()
+
     def _versioned_base_url(self, version: str = 'v1'):
         return urlunsplit((
             self.scheme,
@@ -96,6 +249,78 @@ class Session(requests.Session):
     def _is_access_token_expired(self):
         return self.access_token_expiration - EXPIRATION_BUFFER_MILLIS <= datetime.utcnow()
 
+    def _refresh_access_token_if_stale(self, stale_token: Optional[str]) -> bool:
+        """
+        Refresh the access token, unless another thread already replaced `stale_token`.
+
+        Only one thread refreshes at a time, and threads that were waiting on it use the token
+        it fetched.  Returns whether this call refreshed the token.
+        """
+        with self._token_lock:
+            if self.access_token != stale_token and not self._is_access_token_expired():
+                return False
+            self._refresh_access_token()
+            return True
+
+    def start_token_refresher(self, *, lead_time: float = 60.0) -> None:
+        """
+        Refresh the access token on a background thread, before requests would need to.
+
+        The token is renewed `lead_time` seconds before it would otherwise be refreshed, so
+        requests made around its expiry do not wait on a refresh.  The thread is a daemon, and
+        is stopped by :meth:`stop_token_refresher` or :meth:`close`.
+
+        Parameters
+        ----------
+        lead_time: float
+            How long (in seconds) before the token expires to renew it.  Default: 60
+
+        """
+        if self._token_refresher is not None:
+            return
+        stop = Event()
+        thread = Thread(target=self._run_token_refresher, args=(stop, lead_time),
+                        name='citrine-token-refresher', daemon=True)
+        self._token_refresher = (thread, stop)
+        thread.start()
+
+    def stop_token_refresher(self) -> None:
+        """Stop the background token refresher, if it is running."""
+        if self._token_refresher is None:
+            return
+        thread, stop = self._token_refresher
+        self._token_refresher = None
+        stop.set()
+        thread.join()
+
+    def _run_token_refresher(self, stop: Event, lead_time: float) -> None:
+        refreshed = False
+        while True:
+            refresh_at = self.access_token_expiration - EXPIRATION_BUFFER_MILLIS \
+                - timedelta(seconds=lead_time)
+            delay = (refresh_at - datetime.utcnow()).total_seconds()
+            if refreshed:
+                # Tokens that live for less than the lead time are not refreshed continuously
+                delay = max(delay, _MIN_TOKEN_REFRESH_INTERVAL)
+            if stop.wait(max(delay, 0.0)):
+                return
+            token = self.access_token
+            try:
+                with self._token_lock:
+                    if self.access_token == token:  # Unless a request just refreshed it
+                        self._refresh_access_token()
+                refreshed = True
+            except Exception as e:
+                logger.warning('Background refresh of the access token failed: {}'
+                               .format(repr(e)))
+                if stop.wait(_MIN_TOKEN_REFRESH_INTERVAL):
+                    return
+
+    def close(self) -> None:
+        """Stop the background token refresher, if any, and close all connections."""
+        self.stop_token_refresher()
+        super().close()
+
     def _refresh_access_token(self) -> None:
         """Optionally refresh our access token (if the previous one is about to expire)."""
         data = {'refresh_token': self.refresh_token}
@@ -122,6 +347,7 @@ class Session(requests.Session):
             response = self.request(method, uri, **kwargs)
         except self.retry_errs as e:
             logger.warning('{} seen, retrying request'.format(repr(e)))
+            _connection_retries.count = getattr(_connection_retries, 'count', 0) + 1
             response = self.request(method, uri, **kwargs)
 
         return response
@@ -134,36 +360,88 @@ class Session(requests.Session):
         logger.debug('\tpath: {}'.format(path))
         logger.debug('\tversion: {}'.format(version))
 
-        if self._is_access_token_expired():
-            self._refresh_access_token()
-        uri = self._versioned_base_url(version) + path.lstrip('/')
-
-        logger.debug('\turi: {}'.format(uri))
-
-        for k, v in kwargs.items():
-            logger.debug('\t{}: {}'.format(k, v))
-        logger.debug('END request details.')
-
-        response = self._request_with_retry(method, uri, **kwargs)
-
+        start = monotonic()
+        _connection_retries.count = 0
+        token_refreshes = 0
+        body_size = None
+        response = None
+        error = None
         try:
-            if response.status_code == 401 and response.json().get("reason") == "invalid-token":
-                self._refresh_access_token()
-                response = self._request_with_retry(method, uri, **kwargs)
-        except AttributeError:
-            # Catch AttributeErrors and log response
-            # The 401 status will be handled further down
-            logger.error("Failed to decode json from response: {}".format(response.text))
-        except ValueError:
-            # Ignore ValueErrors thrown by attempting to decode json bodies. This
-            # might occur if we get a 401 response without a JSON body
-            pass
-
+            if self._is_access_token_expired():
+                token_refreshes += self._refresh_access_token_if_stale(self.access_token)
+            uri = self._versioned_base_url(version) + path.lstrip('/')
+
+            logger.debug('\turi: {}'.format(uri))
+
+            for k, v in kwargs.items():
+                logger.debug('\t{}: {}'.format(k, v))
+            logger.debug('END request details.')
+
+            if kwargs.get('json') is not None:
+                kwargs['data'], encoding, body_size = self._encode_json_body(kwargs.pop('json'))
+                if encoding is not None:
+                    kwargs['headers'] = dict(kwargs.get('headers') or {},
+                                             **{'Content-Encoding': encoding})
+
+            token = self.access_token
+            response = self._request_with_retry(method, uri, **kwargs)
+
+            try:
+                if response.status_code == 401 and \
+                        response.json().get("reason") == "invalid-token":
+                    token_refreshes += self._refresh_access_token_if_stale(token)
+                    response = self._request_with_retry(method, uri, **kwargs)
+            except AttributeError:
+                # Catch AttributeErrors and log response
+                # The 401 status will be handled further down
+                logger.error("Failed to decode json from response: {}".format(response.text))
+            except ValueError:
+                # Ignore ValueErrors thrown by attempting to decode json bodies. This
+                # might occur if we get a 401 response without a JSON body
+                pass
+
+            return self._check_response(method, path, response)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            if self.telemetry is not None:
+                self._record_request(method, path, response, kwargs.get('stream', False),
+                                     latency=monotonic() - start, body_size=body_size,
+                                     token_refreshes=token_refreshes, error=error)
+
+    def _record_request(self, method: str, path: str, response: Optional[Response],
+                        stream: bool, *, latency: float, body_size: Optional[int],
+                        token_refreshes: int, error: Optional[Exception]):
+        """Pass the telemetry of a finished request to self.telemetry."""
+        bytes_sent = bytes_received = content_size = retries = 0
+        if response is not None:
+            body = response.request.body if response.request is not None else None
+            bytes_sent = len(body) if body else 0
+            if stream:
+                # The body has not been read, so only its size on the wire is known
+                bytes_received = content_size = int(response.headers.get('Content-Length', 0))
+            else:
+                content_size = len(response.content or b'')
+                bytes_received = _wire_size(response.headers, content_size)
+            retry_state = getattr(response.raw, 'retries', None)
+            retries = len(getattr(retry_state, 'history', ())) + _connection_retries.count
+        self.telemetry.record(RequestRecord(
+            method, template_path(path),
+            status=response.status_code if response is not None else None,
+            latency=latency, bytes_sent=bytes_sent, bytes_received=bytes_received,
+            uncompressed_bytes_sent=body_size, uncompressed_bytes_received=content_size,
+            retries=retries, token_refreshes=token_refreshes, tags=current_tags(),
+            error=type(error).__name__ if error is not None else None))
+
+    @classmethod
+    def _check_response(cls, method: str, path: str, response: Response) -> Response:
+        """Return a successful response, or raise the exception matching its status code."""
         if 200 <= response.status_code <= 299:
             logger.info('%s %s %s', response.status_code, method, path)
             return response
         else:
-            stacktrace = self._extract_response_stacktrace(response)
+            stacktrace = cls._extract_response_stacktrace(response)
             if stacktrace is not None:
                 logger.error('Response arrived with stacktrace:')
                 logger.error(stacktrace)
@@ -183,6 +461,9 @@ class Session(requests.Session):
             elif response.status_code == 409:
                 logger.debug('%s %s %s', response.status_code, method, path)
                 raise WorkflowConflictException(response.text)
+            elif response.status_code == 413:
+                logger.error('%s %s %s', response.status_code, method, path)
+                raise PayloadTooLarge(path, response)
             elif response.status_code == 425:
                 logger.debug('%s %s %s', response.status_code, method, path)
                 msg = 'Cant execute at this time. Try again later. Error: {}'.format(response.text)
@@ -221,11 +502,10 @@ class Session(requests.Session):
         response = self.checked_delete(path, **kwargs)
         return self._extract_response_json(path, response)
 
-    @staticmethod
-    def _extract_response_json(path, response) -> dict:
+    def _extract_response_json(self, path, response) -> dict:
         """Extract json from the response or log and return an empty dict if extraction fails."""
         try:
-            return response.json()
+            return self.json_codec.loads(response.content)
         except JSONDecodeError as err:
             logger.info('Response at path %s with status code %s failed json parsing with'
                         ' exception %s. Returning empty value.',
@@ -237,25 +517,35 @@ class Session(requests.Session):
     @staticmethod
     def cursor_paged_resource(base_method: Callable[..., dict], path: str,
                               forward: bool = True, per_page: int = 100,
-                              version: str = 'v2', **kwargs) -> Iterator[dict]:
+                              version: str = 'v2', prefetch: int = 0,
+                              **kwargs) -> Iterator[dict]:
         """
         Returns a flat generator of results for an API query.
 
-        Results are fetched in chunks of size `per_page` and loaded lazily.
+        Results are fetched in chunks of size `per_page` and loaded lazily.  If `prefetch`
+        is positive, up to that many pages are fetched ahead on a background thread while
+        the caller consumes the current one.
         """
         params = kwargs.get('params', {})
         params['forward'] = forward
         params['ascending'] = forward
         params['per_page'] = per_page
         kwargs['params'] = params
-        while True:
-            response_json = base_method(path, version=version, **kwargs)
-            for obj in response_json['contents']:
+        base_method = tagged('list', base_method)
+
+        def pages():
+            while True:
+                response_json = base_method(path, version=version, **kwargs)
+                yield response_json['contents']
+                cursor = response_json.get('next')
+                if cursor is None:
+                    break
+                params['cursor'] = cursor
+
+        contents = read_ahead(pages(), prefetch) if prefetch > 0 else pages()
+        for page in contents:
+            for obj in page:
                 yield obj
-            cursor = response_json.get('next')
-            if cursor is None:
-                break
-            params['cursor'] = cursor
 
     def checked_post(self, path: str, json: dict, **kwargs) -> Response:
         """Execute a POST request to a URL and utilize error filtering on the response."""
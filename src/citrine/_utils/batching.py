@@ -0,0 +1,71 @@
+"""Helpers for sizing the batches of bulk write requests."""
+from threading import Lock
+from typing import List, Sequence, TypeVar
+
+T = TypeVar('T')
+
+
+class AdaptiveBatchLimit:
+    """
+    A limit on the number of objects per batch that follows the observed server latency.
+
+    The limit starts at the ceiling.  A batch that takes longer than the target latency (or
+    that has to be split) halves the limit, and a full batch that comes back well within the
+    target grows it again by a quarter, up to the ceiling.  It is safe to share between the
+    threads that send batches.
+
+    Parameters
+    ----------
+    max_objects: int
+        The ceiling on the number of objects per batch.
+    target_latency: float
+        The round-trip time (in seconds) a batch should take.
+
+    """
+
+    def __init__(self, max_objects: int, target_latency: float):
+        if max_objects < 1:
+            raise ValueError("max_objects must be positive, got {}".format(max_objects))
+        self.max_objects = max_objects
+        self.target_latency = target_latency
+        self._limit = max_objects
+        self._lock = Lock()
+
+    @property
+    def limit(self) -> int:
+        """The current number of objects per batch."""
+        return self._limit
+
+    def record(self, n_objects: int, latency: float):
+        """Adjust the limit after a batch of n_objects took latency seconds."""
+        with self._lock:
+            if latency > self.target_latency:
+                self._limit = max(1, min(self._limit, n_objects // 2))
+            elif n_objects >= self._limit and latency < self.target_latency / 2:
+                self._limit = min(self.max_objects, self._limit + max(1, self._limit // 4))
+
+    def shrink(self, n_objects: int):
+        """Adjust the limit after a batch of n_objects was rejected as too large or too slow."""
+        with self._lock:
+            self._limit = max(1, min(self._limit, n_objects // 2))
+
+
+def split_by_size(items: Sequence[T], sizes: Sequence[int], max_size: int) -> List[List[T]]:
+    """
+    Split items into consecutive chunks whose sizes add up to at most max_size.
+
+    An item that is larger than max_size on its own is put in a chunk by itself.
+    """
+    chunks = []
+    chunk = []
+    chunk_size = 0
+    for item, size in zip(items, sizes):
+        if chunk and chunk_size + size > max_size:
+            chunks.append(chunk)
+            chunk = []
+            chunk_size = 0
+        chunk.append(item)
+        chunk_size += size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
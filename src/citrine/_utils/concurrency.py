@@ -0,0 +1,92 @@
+"""Small threading helpers shared by the client's concurrent code paths."""
+from queue import Queue, Empty, Full
+from threading import Thread, Event
+from typing import Iterator, TypeVar
+
+T = TypeVar('T')
+
+# How often (in seconds) a blocked producer checks whether its consumer went away
+_POLL_INTERVAL = 0.1
+
+
+class _Done:
+    """Sentinel marking the end of a read-ahead stream."""
+
+
+class _Raised:
+    """Wrapper for an exception raised by a read-ahead producer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def read_ahead(source: Iterator[T], depth: int) -> Iterator[T]:
+    """
+    Consume an iterator on a background thread, keeping up to `depth` items buffered.
+
+    Items are yielded in the order `source` produces them.  The buffer is bounded, so the
+    producer blocks once it is `depth` items ahead of the consumer.  An exception raised by
+    `source` is re-raised to the consumer at the point it occurred in the stream.  If the
+    consumer stops iterating early, the producer is signalled to stop as soon as it next
+    tries to hand over an item.
+
+    Parameters
+    ----------
+    source: Iterator[T]
+        The iterator to consume.  It must be safe to advance it from another thread.
+    depth: int
+        Maximum number of items to buffer ahead of the consumer.  Must be positive.
+
+    Returns
+    -------
+    Iterator[T]
+        The items produced by `source`.
+
+    """
+    if depth < 1:
+        raise ValueError("Read-ahead depth must be positive, got {}".format(depth))
+    buffer = Queue(maxsize=depth)
+    stopped = Event()
+
+    def hand_over(item) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in source:
+                if not hand_over(item):
+                    # The consumer went away; let a generator source clean up now
+                    close = getattr(source, 'close', None)
+                    if close is not None:
+                        close()
+                    return
+        except BaseException as e:
+            # Re-raised on the consumer's thread
+            hand_over(_Raised(e))
+        else:
+            hand_over(_Done)
+
+    producer = Thread(target=produce, name="citrine-read-ahead", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _Done:
+                return
+            if isinstance(item, _Raised):
+                raise item.error
+            yield item
+    finally:
+        stopped.set()
+        # Unblock a producer waiting on a full buffer
+        try:
+            while True:
+                buffer.get_nowait()
+        except Empty:
+            pass
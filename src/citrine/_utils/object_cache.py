@@ -0,0 +1,144 @@
+"""A read-through cache of serialized GEMD objects, shared by the collections of a session."""
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Optional, Iterable, Tuple, Callable
+from uuid import UUID
+
+
+class CacheStats:
+    """Counts of the lookups and removals made by an :class:`ObjectCache`."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that were served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __repr__(self):
+        return 'CacheStats(hits={}, misses={}, evictions={}, expirations={}, ' \
+               'invalidations={})'.format(self.hits, self.misses, self.evictions,
+                                          self.expirations, self.invalidations)
+
+
+class _Entry:
+    """A cached object, and every (scope, id) key it is stored under."""
+
+    __slots__ = ('data', 'keys', 'expires')
+
+    def __init__(self, data: dict, keys: Tuple[tuple, ...], expires: float):
+        self.data = data
+        self.keys = keys
+        self.expires = expires
+
+
+class ObjectCache:
+    """
+    A size-bounded LRU cache of GEMD objects, keyed on their (scope, id) pairs.
+
+    Once attached to a session (``session.object_cache = ObjectCache()``), data concepts
+    collections look objects up here in ``get``, store the objects returned by ``get``, the
+    ``list`` methods, ``register`` and ``register_all``, and drop objects that are updated
+    or deleted.  Objects are stored in serialized form, so every lookup builds a new object.
+
+    The cache only sees changes made through this client.  The time-to-live bounds how stale
+    an object can be if it is changed some other way.
+
+    Parameters
+    ----------
+    max_size: int
+        The most (scope, id) keys to hold.  The least recently used are evicted first.
+        Default: 10000
+    ttl: float, optional
+        How long (in seconds) an object is served from the cache after it was stored.
+        None means until it is evicted.  Default: 600
+
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: Optional[float] = 600.0):
+        if max_size < 1:
+            raise ValueError("max_size must be positive, got {}".format(max_size))
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(project_id: UUID, scope: str, uid: str) -> tuple:
+        # Scopes are case-insensitive, and ids outside the Citrine scope are only unique
+        # within a project
+        return str(project_id), scope.lower(), str(uid)
+
+    def get(self, project_id: UUID, scope: str, uid: str, *,
+            accept: Optional[Callable[[dict], bool]] = None) -> Optional[dict]:
+        """
+        Return the serialized object stored under (scope, uid), or None.
+
+        If `accept` is given, an object it returns False for is treated as a miss.
+        """
+        key = self._key(project_id, scope, uid)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and entry.expires <= monotonic():
+                self._remove(entry)
+                self.stats.expirations += 1
+                entry = None
+            if entry is None or (accept is not None and not accept(entry.data)):
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry.data
+
+    def put(self, project_id: UUID, data: dict):
+        """Store a serialized object under each of its uids."""
+        uids = data.get('uids') or {}
+        keys = tuple(self._key(project_id, scope, uid) for scope, uid in uids.items())
+        if not keys:
+            return
+        expires = monotonic() + self.ttl if self.ttl is not None else 0.0
+        entry = _Entry(data, keys, expires)
+        with self._lock:
+            for key in keys:
+                previous = self._entries.get(key)
+                if previous is not None:
+                    self._remove(previous)
+            for key in keys:
+                self._entries[key] = entry
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, project_id: UUID, scope: str, uid: str):
+        """Drop the object stored under (scope, uid), under all of its keys."""
+        with self._lock:
+            entry = self._entries.get(self._key(project_id, scope, uid))
+            if entry is not None:
+                self._remove(entry)
+                self.stats.invalidations += 1
+
+    def invalidate_all(self, project_id: UUID, uids: Iterable[Tuple[str, str]]):
+        """Drop each of the objects stored under the given (scope, uid) pairs."""
+        for scope, uid in uids:
+            self.invalidate(project_id, scope, uid)
+
+    def clear(self):
+        """Drop every object."""
+        with self._lock:
+            self._entries.clear()
+
+    def _remove(self, entry: _Entry):
+        for key in entry.keys:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
@@ -0,0 +1,63 @@
+"""Polling many things at once, each on its own schedule."""
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, sleep
+from typing import Callable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+def poll_as_completed(count: int,
+                      poll: Callable[[int], T],
+                      next_delay: Callable[[int, T], Optional[float]], *,
+                      first_delay: Callable[[int], float],
+                      timeout: float,
+                      concurrency: int,
+                      timeout_error: Callable[[List[int]], Exception],
+                      clock: Callable[[], float] = monotonic,
+                      sleep: Callable[[float], None] = sleep) -> Iterator[Tuple[int, T]]:
+    """
+    Poll `count` things until each has finished, yielding (position, result) as they do.
+
+    Each thing is first polled `first_delay(position)` seconds from now.  After each poll,
+    ``next_delay(position, result)`` returns how long to wait before polling it again, or
+    None if it has finished.  Things that are due at the same time are polled together, up to
+    `concurrency` at once on a thread pool.  Once `timeout` seconds have passed, every thing
+    that has not finished is polled one last time, and then the exception returned by
+    ``timeout_error(positions)`` is raised with the positions still unfinished, in order.
+
+    `clock` and `sleep` are the time functions to schedule polls with.
+    """
+    deadline = clock() + timeout
+    # Entries are (time of next poll, position)
+    schedule = [(clock() + first_delay(i), i) for i in range(count)]
+    heapq.heapify(schedule)
+
+    executor = ThreadPoolExecutor(max_workers=concurrency) if concurrency > 1 else None
+    try:
+        while schedule:
+            now = clock()
+            if now < deadline and schedule[0][0] > now:
+                sleep(min(schedule[0][0], deadline) - now)
+                continue
+            # Once the deadline has passed, everything gets one last poll
+            due = []
+            while schedule and (now >= deadline or schedule[0][0] <= now):
+                due.append(heapq.heappop(schedule)[1])
+            if executor is None:
+                results = list(map(poll, due))
+            else:
+                results = list(executor.map(poll, due))
+
+            for position, result in zip(due, results):
+                delay = next_delay(position, result)
+                if delay is None:
+                    yield position, result
+                else:
+                    heapq.heappush(schedule, (clock() + delay, position))
+
+            if schedule and now >= deadline:
+                raise timeout_error(sorted(position for _, position in schedule))
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
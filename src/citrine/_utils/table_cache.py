@@ -0,0 +1,134 @@
+"""An on-disk cache of GEM Table contents, which can be shared by processes on one machine."""
+import hashlib
+import os
+import tempfile
+from threading import Lock
+from typing import Optional, Union, BinaryIO, Iterable
+from uuid import UUID
+
+_SUFFIX = '.csv'
+_TEMP_PREFIX = '.tmp-'
+
+
+def _default_directory() -> str:
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join('~', '.cache')
+    return os.path.join(os.path.expanduser(cache_home), 'citrine', 'tables')
+
+
+class TableCache:
+    """
+    A size-bounded LRU cache of the contents of GEM Table versions, stored on local disk.
+
+    A version of a GEM Table never changes once it is built, so its contents can be served
+    from disk for as long as they are kept.  Once attached to a session
+    (``session.table_cache = TableCache()``), ``GemTableCollection.read`` and
+    ``read_to_memory`` only download a version the first time it is read.
+
+    Each version is stored in a file named for the hash of its (uid, version) key.  Files are
+    written to a temporary name and then renamed into place, so several processes can share
+    a directory without ever seeing a partly written table.  The least recently read tables
+    are removed once the directory holds more than `max_size` bytes.
+
+    Parameters
+    ----------
+    directory: str, optional
+        Where to store the tables.  Default: ``$XDG_CACHE_HOME/citrine/tables``, or
+        ``~/.cache/citrine/tables``
+    max_size: int
+        The most bytes of table contents to keep.  Default: 1 GiB
+
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_size: int = 1024 ** 3):
+        if max_size < 1:
+            raise ValueError("max_size must be positive, got {}".format(max_size))
+        self.directory = directory or _default_directory()
+        self.max_size = max_size
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(uid: Union[UUID, str], version: int) -> str:
+        return hashlib.sha256('{}/{}'.format(uid, version).encode('utf-8')).hexdigest()
+
+    def _path(self, uid: Union[UUID, str], version: int) -> str:
+        return os.path.join(self.directory, self._key(uid, version) + _SUFFIX)
+
+    def get(self, uid: Union[UUID, str], version: int) -> Optional[bytes]:
+        """Return the contents stored for a table version, or None."""
+        f = self.open(uid, version)
+        if f is None:
+            return None
+        with f:
+            return f.read()
+
+    def open(self, uid: Union[UUID, str], version: int) -> Optional[BinaryIO]:
+        """Open the contents stored for a table version for reading, or return None."""
+        path = self._path(uid, version)
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)  # Mark it as recently used
+        except OSError:
+            pass  # Evicted by another process since it was opened
+        return f
+
+    def put(self, uid: Union[UUID, str], version: int, content: bytes):
+        """Store the contents of a table version, then evict tables down to the size limit."""
+        self.put_stream(uid, version, [content])
+
+    def put_stream(self, uid: Union[UUID, str], version: int, chunks: Iterable[bytes]):
+        """Store the contents of a table version as they are read from an iterable of chunks."""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(temp_path, self._path(uid, version))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        self._evict()
+
+    def clear(self):
+        """Remove every stored table."""
+        for entry in self._entries():
+            _remove(entry.path)
+
+    @property
+    def size(self) -> int:
+        """The total number of bytes of table contents stored."""
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def _entries(self):
+        try:
+            with os.scandir(self.directory) as it:
+                return [entry for entry in it
+                        if entry.name.endswith(_SUFFIX) and not entry.name.startswith('.')]
+        except FileNotFoundError:
+            return []
+
+    def _evict(self):
+        with self._lock:
+            files = []
+            for entry in self._entries():
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue  # Evicted by another process
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.max_size:
+                    break
+                _remove(path)
+                total -= size
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
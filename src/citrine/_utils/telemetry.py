@@ -0,0 +1,245 @@
+"""Per-request telemetry, aggregated by endpoint and by the client operation that made it."""
+import re
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from inspect import iscoroutinefunction
+from threading import Lock
+from typing import Optional, Tuple, Callable, Iterable, Iterator, List
+
+# Upper bounds (in seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_ID_SEGMENT = re.compile(
+    r'^(?:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|\d+)$')
+
+# The operations of the current thread or asyncio task, outermost first.  asyncio tasks
+# start with the operations of the task that created them; threads start with none.
+_tags = ContextVar('citrine_operations', default=())
+
+
+def template_path(path: str) -> str:
+    """Replace the uuids and numbers in the segments of a request path with ``{id}``."""
+    return '/'.join('{id}' if _ID_SEGMENT.match(segment) else segment
+                    for segment in path.strip('/').split('/'))
+
+
+def current_tags() -> Tuple[str, ...]:
+    """The operations that requests made by this thread or task are currently attributed to."""
+    return _tags.get()
+
+
+@contextmanager
+def operation(name: str, *, parents: Optional[Tuple[str, ...]] = None) -> Iterator[None]:
+    """
+    Attribute the requests made by this thread or task within the block to the operation `name`.
+
+    Operations nest, so a request is attributed to each operation that encloses it.  asyncio
+    tasks inherit the operations of the task that created them, but threads do not; pass
+    `parents` (from :func:`current_tags`) to continue the operations of another thread.
+
+    The block must not span a ``yield`` of a generator, or the operation would also apply to
+    the consumer of the generator while it is suspended.
+    """
+    token = _tags.set((current_tags() if parents is None else parents) + (name,))
+    try:
+        yield
+    finally:
+        _tags.reset(token)
+
+
+def tagged(name: str, func: Callable) -> Callable:
+    """
+    Wrap func so that the requests it makes, from any thread, are attributed to `name`.
+
+    func may be a coroutine function, in which case so is the wrapper.
+    """
+    parents = current_tags()
+
+    if iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with operation(name, parents=parents):
+                return await func(*args, **kwargs)
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with operation(name, parents=parents):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+class RequestRecord:
+    """
+    A single request to the platform, as seen by a Session.
+
+    Attributes
+    ----------
+    method: str
+        The HTTP method
+    path: str
+        The request path, with ids replaced by ``{id}`` (see :func:`template_path`)
+    status: int, optional
+        The final HTTP status code, or None if no response was received
+    latency: float
+        Seconds from the start of the request to its final response, including retries and
+        token refreshes
+    bytes_sent: int
+        The size of the request body, as sent (after any compression)
+    bytes_received: int
+        The size of the response body, as received (before it is decompressed)
+    uncompressed_bytes_sent: int
+        The size of the request body before compression; the same as `bytes_sent` if it
+        was not compressed
+    uncompressed_bytes_received: int
+        The size of the response body after decompression; the same as `bytes_received` if
+        it was not compressed
+    retries: int
+        The number of times the request was retried
+    token_refreshes: int
+        The number of times the access token was refreshed to make the request
+    tags: Tuple[str, ...]
+        The client operations (e.g. ``register_all``) that made the request, outermost first
+    error: str, optional
+        The name of the exception the request raised, if any
+
+    """
+
+    __slots__ = ('method', 'path', 'status', 'latency', 'bytes_sent', 'bytes_received',
+                 'uncompressed_bytes_sent', 'uncompressed_bytes_received', 'retries',
+                 'token_refreshes', 'tags', 'error')
+
+    def __init__(self, method: str, path: str, *, status: Optional[int] = None,
+                 latency: float = 0.0, bytes_sent: int = 0, bytes_received: int = 0,
+                 uncompressed_bytes_sent: Optional[int] = None,
+                 uncompressed_bytes_received: Optional[int] = None,
+                 retries: int = 0, token_refreshes: int = 0, tags: Tuple[str, ...] = (),
+                 error: Optional[str] = None):
+        self.method = method
+        self.path = path
+        self.status = status
+        self.latency = latency
+        self.bytes_sent = bytes_sent
+        self.bytes_received = bytes_received
+        self.uncompressed_bytes_sent = bytes_sent if uncompressed_bytes_sent is None \
+            else uncompressed_bytes_sent
+        self.uncompressed_bytes_received = bytes_received if uncompressed_bytes_received is None \
+            else uncompressed_bytes_received
+        self.retries = retries
+        self.token_refreshes = token_refreshes
+        self.tags = tags
+        self.error = error
+
+    def __repr__(self):
+        return 'RequestRecord({} {} -> {} in {:.3f}s)'.format(
+            self.method, self.path, self.status, self.latency)
+
+
+class RequestStats:
+    """Counters and a latency histogram for a group of requests."""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.latency_histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.uncompressed_bytes_sent = 0
+        self.uncompressed_bytes_received = 0
+        self.retries = 0
+        self.token_refreshes = 0
+        self.statuses = {}
+
+    def add(self, record: RequestRecord):
+        """Count a request."""
+        self.count += 1
+        if record.error is not None:
+            self.errors += 1
+        self.total_latency += record.latency
+        self.max_latency = max(self.max_latency, record.latency)
+        self.latency_histogram[bisect_left(LATENCY_BUCKETS, record.latency)] += 1
+        self.bytes_sent += record.bytes_sent
+        self.bytes_received += record.bytes_received
+        self.uncompressed_bytes_sent += record.uncompressed_bytes_sent
+        self.uncompressed_bytes_received += record.uncompressed_bytes_received
+        self.retries += record.retries
+        self.token_refreshes += record.token_refreshes
+        self.statuses[record.status] = self.statuses.get(record.status, 0) + 1
+
+    def as_dict(self) -> dict:
+        """Return the stats as plain, JSON-serializable data."""
+        bounds = [str(bound) for bound in LATENCY_BUCKETS] + ['inf']
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'total_latency': self.total_latency,
+            'mean_latency': self.total_latency / self.count if self.count else 0.0,
+            'max_latency': self.max_latency,
+            'latency_histogram': dict(zip(bounds, self.latency_histogram)),
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'uncompressed_bytes_sent': self.uncompressed_bytes_sent,
+            'uncompressed_bytes_received': self.uncompressed_bytes_received,
+            'retries': self.retries,
+            'token_refreshes': self.token_refreshes,
+            'statuses': {str(status): n for status, n in self.statuses.items()},
+        }
+
+
+class RequestTelemetry:
+    """
+    Aggregates the requests made by a session, by endpoint and by client operation.
+
+    Attach it to a session (``session.telemetry = RequestTelemetry()``) to record every
+    request that the session makes.  Any object with a ``record(RequestRecord)`` method can
+    be attached instead, to send the records somewhere else.
+
+    Parameters
+    ----------
+    listeners: Iterable[Callable[[RequestRecord], None]]
+        Functions that are also called with each record, e.g. to export it to a metrics
+        service.
+
+    """
+
+    def __init__(self, listeners: Iterable[Callable[[RequestRecord], None]] = ()):
+        self.listeners: List[Callable[[RequestRecord], None]] = list(listeners)
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget every request recorded so far."""
+        with self._lock:
+            self.total = RequestStats()
+            self.endpoints = {}
+            self.operations = {}
+
+    def record(self, record: RequestRecord):
+        """Add a request to the aggregates, and pass it to the listeners."""
+        with self._lock:
+            self.total.add(record)
+            endpoint = '{} {}'.format(record.method, record.path)
+            self.endpoints.setdefault(endpoint, RequestStats()).add(record)
+            for tag in set(record.tags):
+                self.operations.setdefault(tag, RequestStats()).add(record)
+        for listener in self.listeners:
+            listener(record)
+
+    def snapshot(self) -> dict:
+        """
+        Return the aggregates as plain, JSON-serializable data.
+
+        The result has the stats of all requests under ``total``, of the requests to each
+        endpoint (e.g. ``"GET projects/{id}/material-runs"``) under ``endpoints``, and of the
+        requests made by each client operation under ``operations``.
+        """
+        with self._lock:
+            return {
+                'total': self.total.as_dict(),
+                'endpoints': {key: stats.as_dict() for key, stats in self.endpoints.items()},
+                'operations': {key: stats.as_dict() for key, stats in self.operations.items()},
+            }
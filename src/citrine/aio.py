@@ -0,0 +1,3 @@
+"""[ALPHA] asyncio-native access to the Citrine Platform.  Requires aiohttp."""
+from citrine._async_session import AsyncSession, AsyncResponse  # noqa: F401
+from citrine._rest.async_collection import AsyncCollection  # noqa: F401
@@ -1,9 +1,13 @@
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from os import environ
 
 from citrine._session import Session
-from citrine.resources.project import ProjectCollection
-from citrine.resources.user import UserCollection
+
+if TYPE_CHECKING:  # pragma: no cover
+    # These modules are only loaded when they are first used, to keep imports fast
+    from citrine._async_session import AsyncSession
+    from citrine.resources.project import ProjectCollection
+    from citrine.resources.user import UserCollection
 
 
 class Citrine:
@@ -19,6 +23,14 @@ class Citrine:
         Host URL, generally '<your_site>.citrine-platform.com'
     port: Optional[str]
         Optional networking port
+    pool_maxsize: int
+        The number of connections to keep open to the platform.  Operations that make
+        requests from several threads grow this as needed.  Default: 10
+    pool_block: bool
+        Whether a request waits for a free connection once `pool_maxsize` connections are in
+        use, rather than opening a connection that is discarded afterwards.  Default: False
+    keep_alive: bool
+        Whether to reuse connections between requests.  Default: True
 
     """
 
@@ -26,15 +38,39 @@ class Citrine:
                  api_key: str = environ.get('CITRINE_API_KEY'),
                  scheme: str = 'https',
                  host: str = environ.get('CITRINE_API_HOST'),
-                 port: Optional[str] = None):
-        self.session: Session = Session(api_key, scheme, host, port)
+                 port: Optional[str] = None,
+                 *,
+                 pool_maxsize: int = 10,
+                 pool_block: bool = False,
+                 keep_alive: bool = True):
+        self.session: Session = Session(api_key, scheme, host, port,
+                                        pool_maxsize=pool_maxsize, pool_block=pool_block,
+                                        keep_alive=keep_alive)
 
     @property
-    def projects(self) -> ProjectCollection:
+    def projects(self) -> 'ProjectCollection':
         """Return a resource representing all visible projects."""
+        from citrine.resources.project import ProjectCollection
         return ProjectCollection(self.session)
 
     @property
-    def users(self) -> UserCollection:
+    def users(self) -> 'UserCollection':
         """Return the collection of all users."""
+        from citrine.resources.user import UserCollection
         return UserCollection(self.session)
+
+    def async_session(self, *, max_connections: int = 100) -> 'AsyncSession':
+        """
+        [ALPHA] Return an asyncio-native session that shares this client's credentials.
+
+        Wrap any collection in an :class:`~citrine.aio.AsyncCollection` with this session
+        to use it from an event loop.  Requires aiohttp.
+
+        Parameters
+        ----------
+        max_connections: int
+            The maximum number of simultaneous connections to the platform.  Default: 100
+
+        """
+        from citrine._async_session import AsyncSession
+        return AsyncSession(self.session, max_connections=max_connections)
@@ -97,6 +97,12 @@ class BadRequest(NonRetryableHttpException):
     pass
 
 
+class PayloadTooLarge(NonRetryableHttpException):
+    """The body of the request is larger than the server accepts. (http status 413)."""
+
+    pass
+
+
 class WorkflowConflictException(NonRetryableException):
     """There is a conflict preventing the workflow from being executed. (http status 409)."""
 
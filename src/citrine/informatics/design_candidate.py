@@ -129,3 +129,76 @@ class DesignCandidate(Serializable["DesignCandidate"]):
 
     def __init__(self):
         pass  # pragma: no cover
+
+
+class _CandidateColumns:
+    """Gathers serialized design candidates into columns, without building DesignCandidates.
+
+    Each descriptor becomes one or more columns, named by the descriptor key and (after a '~')
+    the part of the value they hold:
+
+    * :class:`MeanAndStd` values become ``key~mean`` and ``key~std``
+    * :class:`TopCategories` values become a ``key~category`` probability per category, which
+      is NaN for candidates whose top categories do not include it
+    * :class:`Mixture` values become a ``key~component`` quantity per component, which is 0
+      for candidates that do not contain it
+    * :class:`ChemicalFormula` and :class:`MolecularStructure` values become a ``key`` column
+      of strings
+
+    Values are stored sparsely until :meth:`arrays` is called, so that columns can appear
+    partway through (e.g., a category that is only in the top categories of later candidates).
+    """
+
+    def __init__(self):
+        self.material_ids = []
+        self.primary_scores = []
+        # column name -> (is_real, fill value, row indices, values)
+        self._columns = {}
+
+    def __len__(self):
+        return len(self.material_ids)
+
+    def _set(self, name: str, row: int, value, *, real: bool = True, fill=float('nan')):
+        column = self._columns.get(name)
+        if column is None:
+            column = self._columns[name] = (real, fill, [], [])
+        column[2].append(row)
+        column[3].append(value)
+
+    def add(self, candidate: dict):
+        """Add a serialized candidate."""
+        row = len(self.material_ids)
+        self.material_ids.append(candidate['material_id'])
+        self.primary_scores.append(candidate['primary_score'])
+        for key, value in candidate['material']['vars'].items():
+            typ = value['type']
+            if typ == 'R':
+                self._set(key + '~mean', row, value['m'])
+                self._set(key + '~std', row, value['s'])
+            elif typ == 'C':
+                for category, probability in value['cp'].items():
+                    self._set(key + '~' + category, row, probability)
+            elif typ == 'M':
+                for component, quantity in value['q'].items():
+                    self._set(key + '~' + component, row, quantity, fill=0.0)
+            elif typ == 'F':
+                self._set(key, row, value['f'], real=False, fill=None)
+            elif typ == 'S':
+                self._set(key, row, value['s'], real=False, fill=None)
+            else:
+                raise ValueError("Unrecognized design variable type: {}".format(typ))
+
+    def arrays(self) -> dict:
+        """Return a dict of column name to NumPy array, in the order columns first appeared."""
+        import numpy as np
+        n = len(self.material_ids)
+        arrays = {
+            'material_id': np.array(self.material_ids, dtype=object),
+            'rank': np.arange(1, n + 1),
+            'primary_score': np.array(self.primary_scores, dtype=float),
+        }
+        for name, (real, fill, rows, values) in self._columns.items():
+            array = np.full(n, fill, dtype=float if real else object)
+            array[rows] = values
+            arrays[name] = array
+        return arrays
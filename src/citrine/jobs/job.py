@@ -1,16 +1,21 @@
+import random
 from logging import getLogger
-from typing import Union
+from typing import Union, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
 from uuid import UUID
-
-from time import time, sleep
+from time import time, sleep, monotonic
 
 from citrine._serialization.properties import Set as PropertySet, String, Object
 from citrine._rest.resource import Resource
 from citrine._serialization import properties
 from citrine._session import Session
 from citrine._utils.functions import format_escaped_url
+from citrine._utils.polling import poll_as_completed
+from citrine._utils.telemetry import operation, tagged
 from citrine.exceptions import PollingTimeoutError, JobFailureError
 
+if TYPE_CHECKING:  # pragma: no cover
+    from citrine._async_session import AsyncSession
+
 logger = getLogger(__name__)
 
 
@@ -104,7 +109,8 @@ def _poll_for_job_completion(session: Session, project_id: Union[UUID, str],
     params = {'job_id': job_id}
     start_time = time()
     while True:
-        response = session.get_resource(path=path, params=params)
+        with operation('poll_job'):
+            response = session.get_resource(path=path, params=params)
         status: JobStatusResponse = JobStatusResponse.build(response)
         if status.status in ['Success', 'Failure']:
             break
@@ -117,6 +123,160 @@ def _poll_for_job_completion(session: Session, project_id: Union[UUID, str],
             logger.error('Job exceeded user timeout of {} seconds.'.format(timeout))
             logger.debug('Last status: {}'.format(status.dump()))
             raise PollingTimeoutError('Job {} timed out.'.format(job_id))
+    return _check_job_result(status, job_id)
+
+
+async def _async_poll_for_job_completion(session: 'AsyncSession', project_id: Union[UUID, str],
+                                         job: Union[JobSubmissionResponse, UUID, str], *,
+                                         timeout: float = 2 * 60,
+                                         polling_delay: float = 2.0) -> JobStatusResponse:
+    """
+    Polls for job completion without blocking the event loop.
+
+    This is the asyncio counterpart of `_poll_for_job_completion`, and takes the same
+    arguments except that `session` is an AsyncSession.
+    """
+    import asyncio
+    if isinstance(job, JobSubmissionResponse):
+        job_id = job.job_id
+    else:
+        job_id = job
+    path = format_escaped_url('projects/{}/execution/job-status', project_id)
+    params = {'job_id': job_id}
+    start_time = time()
+    while True:
+        with operation('poll_job'):
+            response = await session.get_resource(path=path, params=params)
+        status: JobStatusResponse = JobStatusResponse.build(response)
+        if status.status in ['Success', 'Failure']:
+            break
+        elif time() - start_time < timeout:
+            logger.info('Job still in progress, polling status again in {:.2f} seconds.'
+                        .format(polling_delay))
+            await asyncio.sleep(polling_delay)
+        else:
+            logger.error('Job exceeded user timeout of {} seconds.'.format(timeout))
+            logger.debug('Last status: {}'.format(status.dump()))
+            raise PollingTimeoutError('Job {} timed out.'.format(job_id))
+    return _check_job_result(status, job_id)
+
+
+class JobGroup:
+    """
+    [ALPHA] Waits on many jobs in a project at once.
+
+    Each job is polled on its own schedule, starting after `initial_delay` seconds and backing
+    off exponentially (with random jitter, so that jobs submitted together are not all polled
+    together) up to `max_delay` seconds between polls.  Jobs that are due at the same time
+    are polled in parallel.
+
+    Any job that returns a job ID can be added, e.g. table builds
+    (:meth:`~citrine.resources.gemtables.GemTableCollection.initiate_build`), asynchronous
+    updates of data objects, and file ingestion.
+
+    Parameters
+    ----------
+    session: Session
+        The session used to poll the jobs.
+    project_id: UUID
+        The project the jobs were submitted in.
+    jobs: Iterable[Union[JobSubmissionResponse, UUID, str]]
+        The jobs to wait on.  More can be added with :meth:`add`.
+    timeout: float
+        Amount of time to wait on all of the jobs (in seconds) before giving up.  Defaults
+        to 2 minutes.  Note that this number has no effect on the underlying jobs themselves,
+        which can also time out server-side.
+    initial_delay: float
+        How long to wait (in seconds) before first polling each job.  Default: 1
+    max_delay: float
+        The longest delay (in seconds) between polls of a job.  Default: 30
+    backoff_factor: float
+        How much the delay between polls of a job grows each time.  Default: 2
+    concurrency: int
+        The most jobs to poll at once.  Default: 8
+
+    """
+
+    def __init__(self, session: Session, project_id: Union[UUID, str],
+                 jobs: Iterable[Union[JobSubmissionResponse, UUID, str]] = (), *,
+                 timeout: float = 2 * 60,
+                 initial_delay: float = 1.0,
+                 max_delay: float = 30.0,
+                 backoff_factor: float = 2.0,
+                 concurrency: int = 8):
+        self.session = session
+        self.project_id = project_id
+        self.timeout = timeout
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.backoff_factor = backoff_factor
+        self.concurrency = concurrency
+        self.job_ids: List[Union[UUID, str]] = []
+        for job in jobs:
+            self.add(job)
+
+    def add(self, job: Union[JobSubmissionResponse, UUID, str]):
+        """Add a job to the group."""
+        self.job_ids.append(job.job_id if isinstance(job, JobSubmissionResponse) else job)
+
+    def _jitter(self, delay: float) -> float:
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def _poll(self, job_id: Union[UUID, str]) -> JobStatusResponse:
+        path = format_escaped_url('projects/{}/execution/job-status', self.project_id)
+        response = self.session.get_resource(path=path, params={'job_id': job_id})
+        return JobStatusResponse.build(response)
+
+    def as_completed(self) -> Iterator[Tuple[Union[UUID, str], JobStatusResponse]]:
+        """
+        Yield (job ID, status) for each job in the group, in the order that they finish.
+
+        The status of a failed job is yielded like any other, with a status of "Failure".
+        If any jobs are still running once the timeout has passed, this raises a
+        PollingTimeoutError after yielding every job that did finish.
+        """
+        # The delay before the poll after the next one, of each job
+        delays = [self.initial_delay] * len(self.job_ids)
+
+        def next_delay(position: int, status: JobStatusResponse) -> Optional[float]:
+            if status.status in ['Success', 'Failure']:
+                return None
+            delay = delays[position]
+            delays[position] = min(self.max_delay, delay * self.backoff_factor)
+            return self._jitter(delay)
+
+        def timeout_error(running: List[int]) -> PollingTimeoutError:
+            logger.error('Jobs exceeded user timeout of {} seconds.'.format(self.timeout))
+            return PollingTimeoutError('Jobs {} timed out.'.format(
+                ', '.join(str(self.job_ids[position]) for position in running)))
+
+        poll = tagged('poll_job', self._poll)
+        self.session.ensure_pool_size(self.concurrency)
+        finished = poll_as_completed(len(self.job_ids), lambda i: poll(self.job_ids[i]),
+                                     next_delay,
+                                     first_delay=lambda i: self._jitter(self.initial_delay),
+                                     timeout=self.timeout, concurrency=self.concurrency,
+                                     timeout_error=timeout_error, clock=monotonic, sleep=sleep)
+        for position, status in finished:
+            yield self.job_ids[position], status
+
+    def wait(self) -> List[JobStatusResponse]:
+        """
+        Wait for every job in the group to finish, failing with an exception if any failed.
+
+        Returns
+        -------
+        List[JobStatusResponse]
+            The statuses of the jobs, in the order they were added.
+
+        """
+        statuses = dict(self.as_completed())
+        return [_check_job_result(statuses[job_id], job_id) for job_id in self.job_ids]
+
+
+def _check_job_result(status: JobStatusResponse,
+                      job_id: Union[UUID, str]) -> JobStatusResponse:
+    """Return the status of a finished job, or raise JobFailureError if it failed."""
     if status.status == 'Failure':
         logger.debug('Job terminated with Failure status: {}'.format(status.dump()))
         failure_reasons = []
@@ -1,9 +1,11 @@
 import time
 from pprint import pprint
-from typing import Union
+from typing import Union, Iterable, Iterator, List, Optional, Tuple
 
 from citrine._rest.collection import Collection
 from citrine._rest.asynchronous_object import AsynchronousObject
+from citrine._utils.polling import poll_as_completed
+from citrine._utils.telemetry import operation, tagged
 from citrine.informatics.executions.design_execution import DesignExecution
 from citrine.informatics.executions import PredictorEvaluationExecution
 from citrine.informatics.modules import Module
@@ -65,7 +67,8 @@ def wait_for_asynchronous_object(
     start = time.time()
 
     def is_finished():
-        current_resource = collection.get(resource.uid)
+        with operation('poll_status'):
+            current_resource = collection.get(resource.uid)
         if print_status_info:
             _print_string_status(current_resource.status, start)
         return not current_resource.in_progress()
@@ -79,13 +82,181 @@ def wait_for_asynchronous_object(
                 timeout_length=timeout, uid=resource.uid)
         )
 
-    current_resource = collection.get(resource.uid)
+    with operation('poll_status'):
+        current_resource = collection.get(resource.uid)
     if print_status_info and hasattr(current_resource, 'status_info'):
         print("\nStatus info:")
         pprint(current_resource.status_info)
     return current_resource
 
 
+class AsynchronousObjectMonitor:
+    """
+    Waits on many asynchronous objects at once, which can be in different collections.
+
+    Each object is fetched from its collection on its own schedule.  The delay between
+    fetches starts at `interval`, grows by `backoff_factor` each time the object's status is
+    unchanged (up to `max_interval`), and drops back to `interval` when the status changes.
+    Objects that are due at the same time are fetched in parallel, with at most
+    `max_concurrent_requests` requests in flight across all of them.
+
+    Parameters
+    ----------
+    resources: Iterable[Tuple[AsynchronousObject, Collection[AsynchronousObject]]]
+        Pairs of an object to monitor and the collection containing it.  More can be added
+        with :meth:`add`.
+    timeout: float
+        Maximum time spent waiting on all of the objects, in seconds, by default 1800.0
+    interval: float
+        Shortest inquiry interval in seconds, by default 3.0
+    max_interval: float
+        Longest inquiry interval in seconds, by default 60.0
+    backoff_factor: float
+        How much the inquiry interval grows while an object's status is unchanged, by
+        default 1.5
+    max_concurrent_requests: int
+        The most inquiries to make at once, by default 8
+
+    """
+
+    def __init__(
+        self,
+        resources: Iterable[Tuple[AsynchronousObject, Collection[AsynchronousObject]]] = (),
+        *,
+        timeout: float = 1800.0,
+        interval: float = 3.0,
+        max_interval: float = 60.0,
+        backoff_factor: float = 1.5,
+        max_concurrent_requests: int = 8
+    ):
+        self.timeout = timeout
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.max_concurrent_requests = max_concurrent_requests
+        self.resources: List[Tuple[AsynchronousObject, Collection[AsynchronousObject]]] = []
+        for resource, collection in resources:
+            self.add(resource, collection)
+
+    def add(self, resource: AsynchronousObject, collection: Collection[AsynchronousObject]):
+        """Add an object to monitor, along with the collection containing it."""
+        self.resources.append((resource, collection))
+
+    def as_completed(self) -> Iterator[AsynchronousObject]:
+        """
+        Yield each object, as freshly fetched from its collection, once it has finished.
+
+        Objects are yielded in the order that they are seen to finish, whether they
+        succeeded or failed.  If any are still in progress once the timeout has passed, this
+        raises a ConditionTimeoutError after yielding every object that did finish.
+        """
+        for _, resource in self._as_completed():
+            yield resource
+
+    def _as_completed(self) -> Iterator[Tuple[int, AsynchronousObject]]:
+        """Yield (position, object) for each object once it has finished."""
+        # The current inquiry interval and last seen status, of each object
+        intervals = [self.interval] * len(self.resources)
+        statuses = [None] * len(self.resources)
+
+        def fetch(position: int) -> AsynchronousObject:
+            resource, collection = self.resources[position]
+            return collection.get(resource.uid)
+        fetch = tagged('poll_status', fetch)
+
+        def next_delay(position: int, resource: AsynchronousObject) -> Optional[float]:
+            if not resource.in_progress():
+                return None
+            if resource.status == statuses[position]:
+                intervals[position] = min(self.max_interval,
+                                          intervals[position] * self.backoff_factor)
+            else:
+                intervals[position] = self.interval
+            statuses[position] = resource.status
+            return intervals[position]
+
+        def timeout_error(running: List[int]) -> ConditionTimeoutError:
+            return ConditionTimeoutError(
+                "Timeout of {timeout_length} seconds reached, but tasks {uids} are "
+                "still in progress".format(
+                    timeout_length=self.timeout,
+                    uids=", ".join(str(self.resources[position][0].uid)
+                                   for position in running)))
+
+        for _, collection in self.resources:
+            session = getattr(collection, 'session', None)
+            if session is not None:
+                session.ensure_pool_size(self.max_concurrent_requests)
+        return poll_as_completed(len(self.resources), fetch, next_delay,
+                                 first_delay=lambda position: 0.0, timeout=self.timeout,
+                                 concurrency=self.max_concurrent_requests,
+                                 timeout_error=timeout_error, clock=time.time,
+                                 sleep=time.sleep)
+
+    def wait(self) -> List[AsynchronousObject]:
+        """
+        Wait until every object has finished.
+
+        Returns
+        -------
+        List[AsynchronousObject]
+            The objects after the asynchronous work has finished, in the order they were
+            added.
+
+        Raises
+        ------
+        ConditionTimeoutError
+            If any fail to finish within the timeout
+
+        """
+        finished = dict(self._as_completed())
+        return [finished[position] for position in range(len(self.resources))]
+
+
+def wait_for_asynchronous_objects(
+    *,
+    resources: Iterable[Tuple[AsynchronousObject, Collection[AsynchronousObject]]],
+    timeout: float = 1800.0,
+    interval: float = 3.0,
+    max_interval: float = 60.0,
+    max_concurrent_requests: int = 8
+) -> List[AsynchronousObject]:
+    """
+    Wait until several asynchronous objects have finished, polling them concurrently.
+
+    This could be any mix of modules, workflows, workflow executions, or reports.  See
+    :class:`AsynchronousObjectMonitor` for how they are polled, and to handle each one as soon
+    as it finishes.
+
+    Parameters
+    ----------
+    resources: Iterable[Tuple[AsynchronousObject, Collection[AsynchronousObject]]]
+        Pairs of an object to monitor and the collection containing it
+    timeout : float
+        Maximum time spent waiting on all of the objects, in seconds, by default 1800.0
+    interval: float
+        Shortest inquiry interval in seconds, by default 3.0
+    max_interval: float
+        Longest inquiry interval in seconds, by default 60.0
+    max_concurrent_requests: int
+        The most inquiries to make at once, by default 8
+
+    Returns
+    -------
+    List[AsynchronousObject]
+        The objects after the asynchronous work has finished, in the order they were given.
+
+    Raises
+    ------
+    ConditionTimeoutError
+        If any fail to finish within timeout
+
+    """
+    return AsynchronousObjectMonitor(resources, timeout=timeout, interval=interval,
+                                     max_interval=max_interval,
+                                     max_concurrent_requests=max_concurrent_requests).wait()
+
+
 def wait_while_validating(
     *,
     collection: Collection[Module],
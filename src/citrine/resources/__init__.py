@@ -1,2 +1,12 @@
 """Resources that allow for interaction with the Citrine platform."""
-from citrine.resources.project import ProjectCollection  # noqa: F401
+import sys
+
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        # Importing a single resource module should not load every other one
+        if name == 'ProjectCollection':
+            from citrine.resources import project
+            return project.ProjectCollection
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+else:  # pragma: no cover
+    from citrine.resources.project import ProjectCollection  # noqa: F401
@@ -1,7 +1,8 @@
 """Top-level class for all data concepts objects and collections thereof."""
 from abc import abstractmethod, ABC
+from concurrent.futures import ThreadPoolExecutor
 from warnings import warn
-from typing import TypeVar, Type, List, Union, Optional, Iterator
+from typing import TypeVar, Type, List, Union, Optional, Iterator, Iterable, Dict, Tuple
 from uuid import UUID, uuid4
 import deprecation
 
@@ -9,17 +10,18 @@ from gemd.entity.dict_serializable import DictSerializable
 from gemd.entity.base_entity import BaseEntity
 from gemd.entity.link_by_uid import LinkByUID
 from gemd.json import GEMDJson
-from gemd.util import recursive_foreach
 
 from citrine._rest.collection import Collection
 from citrine._serialization import properties
 from citrine._serialization.polymorphic_serializable import PolymorphicSerializable
 from citrine._serialization.properties import Property as SerializableProperty
 from citrine._serialization.serializable import Serializable
+from citrine._serialization.write_payload import WritePayload
 from citrine._session import Session
-from citrine._utils.functions import scrub_none, replace_objects_with_links, \
-    format_escaped_url
-from citrine.exceptions import BadRequest
+from citrine._utils.functions import format_escaped_url
+from citrine._utils.json_codec import EncodedJson
+from citrine._utils.telemetry import operation, tagged
+from citrine.exceptions import BadRequest, NotFound
 from citrine.resources.audit_info import AuditInfo
 from citrine.jobs.job import _poll_for_job_completion
 from citrine.resources.response import Response
@@ -401,8 +403,9 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             self._get_path(ignore_dataset=True),
             forward=forward,
             per_page=per_page,
+            prefetch=self.session.cursor_prefetch_pages,
             params=params)
-        return (self.build(raw) for raw in raw_objects)
+        return (self._build_cached(raw) for raw in raw_objects)
 
     def register(self, model: ResourceType, *, dry_run=False):
         """
@@ -437,15 +440,11 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             raise RuntimeError("Must specify a dataset in order to register a data model object.")
         path = self._get_path()
         params = {'dry_run': dry_run}
-
-        temp_scope = str(uuid4())
-        scope = temp_scope if dry_run else CITRINE_SCOPE
-        GEMDJson(scope=scope).dumps(model)  # This apparent no-op populates uids
-        dumped_data = replace_objects_with_links(scrub_none(model.dump()))
-        recursive_foreach(model, lambda x: x.uids.pop(temp_scope, None))  # Strip temp uids
-
+        dumped_data, = self._dump_for_write([model], dry_run=dry_run)
         data = self.session.post_resource(path, dumped_data, params=params)
-        return self.build(data)
+        if dry_run:
+            return self.build(data)
+        return self._build_cached(data)
 
     def register_all(self, models: List[ResourceType], *, dry_run=False) -> List[ResourceType]:
         """
@@ -474,27 +473,90 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
         """
         if self.dataset_id is None:
             raise RuntimeError("Must specify a dataset in order to register a data model object.")
+        with operation('register_all'):
+            encode = self.session.json_codec.dumps
+            objects = [encode(obj) for obj in self._dump_for_write(models, dry_run=dry_run)]
+            return self._put_batch(objects, dry_run=dry_run)
+
+    def _put_batch(self, objects: List[bytes], *, dry_run: bool) -> List[ResourceType]:
+        """Write objects that were serialized by `_dump_for_write` and encoded, in one request."""
         path = self._get_path()
         params = {'dry_run': dry_run}
-
-        temp_scope = str(uuid4())
-        scope = temp_scope if dry_run else CITRINE_SCOPE
-        json = GEMDJson(scope=scope)
-        [json.dumps(x) for x in models]  # This apparent no-op populates uids
-
-        objects = [replace_objects_with_links(scrub_none(model.dump())) for model in models]
-
-        recursive_foreach(models, lambda x: x.uids.pop(temp_scope, None))  # Strip temp uids
-
         response_data = self.session.put_resource(
             path + '/batch',
-            json={'objects': objects},
+            json=EncodedJson(b'{"objects":[' + b','.join(objects) + b']}'),
             params=params
         )
-        return [self.build(obj) for obj in response_data['objects']]
+        if dry_run:
+            return [self.build(obj) for obj in response_data['objects']]
+        return [self._build_cached(obj) for obj in response_data['objects']]
+
+    def _build_cached(self, data: dict) -> ResourceType:
+        """Build an object from a response, and store it in the session's object cache."""
+        cache = self.session.object_cache
+        if cache is not None:
+            cache.put(self.project_id, data)
+        return self.build(data)
+
+    def _read_cached(self, link: LinkByUID) -> Optional[dict]:
+        """Return the data of an object from the session's object cache, if it is there."""
+        cache = self.session.object_cache
+        if cache is None:
+            return None
+        return cache.get(self.project_id, link.scope, link.id, accept=self._accepts_cached)
+
+    def _link_path(self, link: LinkByUID) -> str:
+        """The path to read an object at."""
+        return self._get_path(ignore_dataset=self.dataset_id is None) \
+            + format_escaped_url("/{}/{}", link.scope, link.id)
+
+    def _fetch_by_link(self, link: LinkByUID) -> dict:
+        """Read the data of an object, through the session's object cache."""
+        data = self._read_cached(link)
+        if data is None:
+            data = self.session.get_resource(self._link_path(link))
+            cache = self.session.object_cache
+            if cache is not None:
+                cache.put(self.project_id, data)
+        return data
+
+    def _accepts_cached(self, data: dict) -> bool:
+        """Whether a cached object is one that this collection's `get` could return."""
+        response_key = getattr(self.get_type(), '_response_key', None)
+        if response_key is not None and data.get('type') != response_key:
+            return False
+        return self.dataset_id is None or data.get('dataset') == str(self.dataset_id)
+
+    def _invalidate_cached(self, uid: Union[BaseEntity, LinkByUID]):
+        """Drop an object that is being changed from the session's object cache."""
+        cache = self.session.object_cache
+        if cache is None:
+            return
+        if isinstance(uid, BaseEntity):
+            cache.invalidate_all(self.project_id, uid.uids.items())
+        else:
+            cache.invalidate(self.project_id, uid.scope, uid.id)
+
+    @staticmethod
+    def _dump_for_write(models: List[ResourceType], *, dry_run: bool) -> List[dict]:
+        """
+        Serialize models into the request bodies used to register them.
+
+        Models without any uids, and the objects they link to that have none, are assigned
+        a Citrine id (unless this is a dry run, in which case the ids are temporary and the
+        models are left as they were).  Nested data objects are replaced by links.
+        """
+        scope = str(uuid4()) if dry_run else CITRINE_SCOPE
+        payload = WritePayload(scope, link_scope=CITRINE_SCOPE)
+        objects = [payload.dump(model) for model in models]
+        if not dry_run:
+            for entity, uid in payload.new_uids:
+                entity.add_uid(CITRINE_SCOPE, uid)
+        return objects
 
     def update(self, model: ResourceType) -> ResourceType:
         """Update a data object model."""
+        self._invalidate_cached(model)
         try:
             return self.register(model, dry_run=False)
         except BadRequest:
@@ -551,10 +613,8 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             method.
 
         """
-        temp_scope = str(uuid4())
-        GEMDJson(scope=temp_scope).dumps(model)  # This apparent no-op populates uids
-        dumped_data = replace_objects_with_links(scrub_none(model.dump()))
-        recursive_foreach(model, lambda x: x.uids.pop(temp_scope, None))  # Strip temp uids
+        # Objects without uids are linked by temporary ids, as in a dry run
+        dumped_data, = self._dump_for_write([model], dry_run=True)
 
         scope = CITRINE_SCOPE
         id = dumped_data['uids'][scope]
@@ -566,6 +626,8 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             "/" + scope + "/" + id + "/async"
 
         response_json = self.session.put_resource(url, dumped_data, params={'dry_run': dry_run})
+        if not dry_run:
+            self._invalidate_cached(model)
 
         job_id = response_json["job_id"]
 
@@ -638,11 +700,69 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             An object with specified scope and uid
 
         """
-        link = _make_link_by_uid(uid, scope)
-        path = self._get_path(ignore_dataset=self.dataset_id is None) \
-            + format_escaped_url("/{}/{}", link.scope, link.id)
-        data = self.session.get_resource(path)
-        return self.build(data)
+        return self.build(self._fetch_by_link(_make_link_by_uid(uid, scope)))
+
+    def get_many(self, uids: Iterable[Union[UUID, str, LinkByUID, BaseEntity]], *,
+                 concurrency: int = 8) -> List[Union[ResourceType, NotFound]]:
+        """
+        [ALPHA] Get many elements of the collection by their ids.
+
+        There is no endpoint for reading a batch of objects, so the objects that are not in
+        the session's object cache are fetched individually, up to `concurrency` at a time.
+        Each distinct object is fetched only once, even if it appears more than once in uids.
+
+        Parameters
+        ----------
+        uids: Iterable[Union[UUID, str, LinkByUID, BaseEntity]]
+            Representations of the objects (Citrine id, LinkByUID, or the object itself)
+        concurrency: int
+            The maximum number of objects to fetch at once.
+
+        Returns
+        -------
+        List[Union[ResourceType, NotFound]]
+            The objects, in the same order as uids.  An object that does not exist is
+            represented by the NotFound exception for its request, rather than raising it.
+            Any other error is raised.
+
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive, got {}".format(concurrency))
+        links = [_make_link_by_uid(uid) for uid in uids]
+        keys = [(link.scope.lower(), link.id) for link in links]
+        found: Dict[Tuple[str, str], Union[dict, NotFound]] = {}
+        for key, link in zip(keys, links):
+            if key not in found:
+                data = self._read_cached(link)
+                if data is not None:
+                    found[key] = data
+        missing = {key: link for key, link in zip(keys, links) if key not in found}
+
+        def fetch(link: LinkByUID) -> Union[dict, NotFound]:
+            try:
+                return self._fetch_by_link(link)
+            except NotFound as e:
+                return e
+        fetch = tagged('get_many', fetch)
+
+        if concurrency > 1 and len(missing) > 1:
+            self.session.ensure_pool_size(concurrency)
+            executor = ThreadPoolExecutor(max_workers=concurrency)
+            futures = {}
+            try:
+                futures = {key: executor.submit(fetch, link) for key, link in missing.items()}
+                found.update((key, future.result()) for key, future in futures.items())
+            finally:
+                # Don't start any more requests if one of them failed
+                for future in futures.values():
+                    future.cancel()
+                executor.shutdown(wait=True)
+        else:
+            found.update((key, fetch(link)) for key, link in missing.items())
+
+        # Build each position separately, so that repeated ids are not the same object
+        return [found[key] if isinstance(found[key], NotFound) else self.build(found[key])
+                for key in keys]
 
     def list_by_name(self, name: str, *, exact: bool = False,
                      forward: bool = True, per_page: int = 100) -> Iterator[ResourceType]:
@@ -678,8 +798,9 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             self._get_path(ignore_dataset=True) + "/filter-by-name",
             forward=forward,
             per_page=per_page,
+            prefetch=self.session.cursor_prefetch_pages,
             params=params)
-        return (self.build(raw) for raw in raw_objects)
+        return (self._build_cached(raw) for raw in raw_objects)
 
     @deprecation.deprecated(deprecated_in="0.133.0", removed_in="1.0.0",
                             details="Please use list instead of list_all")
@@ -740,8 +861,9 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
             self.session.get_resource,
             self._get_path(ignore_dataset=True),
             per_page=per_page,
+            prefetch=self.session.cursor_prefetch_pages,
             params=params)
-        return (self.build(raw) for raw in raw_objects)
+        return (self._build_cached(raw) for raw in raw_objects)
 
     def delete(self, uid: Union[UUID, str, LinkByUID, BaseEntity], *,
                scope: Optional[str] = None, dry_run: bool = False):
@@ -764,6 +886,8 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
         path = self._get_path() + format_escaped_url("/{}/{}", link.scope, link.id)
         params = {'dry_run': dry_run}
         self.session.delete_resource(path, params=params)
+        if not dry_run:
+            self._invalidate_cached(link)
         return Response(status_code=200)  # delete succeeded
 
     def _get_relation(self, relation: str, uid: Union[UUID, str, LinkByUID, BaseEntity],
@@ -811,6 +935,7 @@ class DataConceptsCollection(Collection[ResourceType], ABC):
                                ),
             forward=forward,
             per_page=per_page,
+            prefetch=self.session.cursor_prefetch_pages,
             params=params,
             version='v1')
-        return (self.build(raw) for raw in raw_objects)
+        return (self._build_cached(raw) for raw in raw_objects)
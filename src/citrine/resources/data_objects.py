@@ -131,6 +131,7 @@ class DataObjectCollection(DataConceptsCollection[DataObjectResourceType], ABC):
             json=body,
             forward=forward,
             per_page=per_page,
+            prefetch=self.session.cursor_prefetch_pages,
             params=params)
         return (self.build(raw) for raw in raw_objects)
 
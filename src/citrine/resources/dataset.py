@@ -293,6 +293,8 @@ class Dataset(Resource['Dataset']):
                 print(f'"{user_response}" is not a valid response')
 
         response = self.session.delete_resource(path)
+        if self.session.object_cache is not None:
+            self.session.object_cache.clear()
         job_id = response["job_id"]
 
         return _poll_for_async_batch_delete_result(self.project_id, self.session, job_id, timeout,
@@ -77,6 +77,14 @@ def _async_gemd_batch_delete(
                               )
     response = session.post_resource(path, body)
 
+    if session.object_cache is not None:
+        for uid in id_list:
+            if isinstance(uid, BaseEntity):
+                session.object_cache.invalidate_all(project_id, uid.uids.items())
+            else:
+                link_by_uid = _make_link_by_uid(uid)
+                session.object_cache.invalidate(project_id, link_by_uid.scope, link_by_uid.id)
+
     job_id = response["job_id"]
 
     return _poll_for_async_batch_delete_result(project_id, session, job_id, timeout, polling_delay)
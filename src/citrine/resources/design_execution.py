@@ -108,7 +108,9 @@ class DesignExecutionCollection(Collection["DesignExecution"]):
         return self._paginator.paginate(page_fetcher=self._fetch_page,
                                         collection_builder=self._build_collection_elements,
                                         page=page,
-                                        per_page=per_page)
+                                        per_page=per_page,
+                                        concurrency=self.session.page_fetch_concurrency,
+                                        session=self.session)
 
     def delete(self, uid: Union[UUID, str]) -> Response:
         """Design Workflow Executions cannot be deleted or archived."""
@@ -74,4 +74,6 @@ class DesignWorkflowCollection(Collection[DesignWorkflow]):
         return self._paginator.paginate(page_fetcher=fetcher,
                                         collection_builder=self._build_collection_elements,
                                         page=page,
-                                        per_page=per_page)
+                                        per_page=per_page,
+                                        concurrency=self.session.page_fetch_concurrency,
+                                        session=self.session)
@@ -1,15 +1,18 @@
 """A collection of FileLink objects."""
+import hashlib
 import mimetypes
 import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
+from itertools import islice
 from logging import getLogger
 from typing import Iterable, Optional, Tuple, Union, List, Dict
 from uuid import UUID
 
 import requests
-from boto3 import client as boto3_client
-from boto3.session import Config
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
 from gemd.entity.bounds.base_bounds import BaseBounds
 from gemd.entity.file_link import FileLink as GEMDFileLink
 
@@ -20,12 +23,29 @@ from citrine._serialization.properties import Optional as PropertyOptional
 from citrine._serialization.properties import String, Object, Integer
 from citrine._serialization.serializable import Serializable
 from citrine._session import Session
-from citrine._utils.functions import write_file_locally, format_escaped_url
+from citrine._utils.functions import format_escaped_url
 from citrine.jobs.job import JobSubmissionResponse, _poll_for_job_completion
 from citrine.resources.response import Response
 
 logger = getLogger(__name__)
 
+# S3 limits on the parts of a multipart upload
+_MIN_PART_SIZE = 5 * 1024 * 1024
+_MAX_PARTS = 10000
+
+# How many times to retry uploading a single part, and the base delay (in seconds) between tries
+_PART_RETRIES = 3
+_PART_RETRY_DELAY = 0.5
+
+# How much of a download to read into memory at a time
+_CHUNK_SIZE = 1024 * 1024
+
+
+def boto3_client(*args, **kwargs):
+    """Create a boto3 client.  boto3 is slow to import, so it is only loaded to upload."""
+    import boto3
+    return boto3.client(*args, **kwargs)
+
 
 class _Uploader:
     """Holds the many parameters that are generated and used during file upload."""
@@ -42,6 +62,10 @@ class _Uploader:
         self.s3_endpoint_url = None
         self.s3_use_ssl = True
         self.s3_addressing_style = 'auto'
+        # State of a multipart upload: S3's id for it, and the ETag of each stored part
+        self.multipart_upload_id = ''
+        self.part_size = 0
+        self.parts = {}
 
 
 class FileProcessingType(Enum):
@@ -229,10 +253,16 @@ class FileCollection(Collection[FileLink]):
         }
         return file_dict
 
-    def upload(self, *, file_path: str, dest_name: str = None) -> FileLink:
+    def upload(self, *, file_path: str, dest_name: str = None,
+               part_size: int = 16 * 1024 * 1024,
+               concurrency: int = 4) -> FileLink:
         """
         Uploads a file to the dataset.
 
+        Files larger than `part_size` are uploaded in parts, several at a time, and each part
+        is retried on failure.  If the upload still fails (or is interrupted), the parts that
+        were stored are discarded, and uploading the file again starts from the beginning.
+
         Parameters
         ----------
         file_path: str
@@ -243,6 +273,12 @@ class FileCollection(Collection[FileLink]):
             with the name "diagram.pdf". File names **must be unique** within a dataset. If a file
             is uploaded with the same `dest_name` as an existing file it will be considered
             a new version of the existing file.
+        part_size: int, optional
+            The size, in bytes, of each part of a multipart upload.  Must be at least 5 MiB,
+            and is increased if the file would otherwise have more than 10,000 parts.
+            Default: 16 MiB
+        concurrency: int, optional
+            How many parts to upload at once.  Default: 4
 
         Returns
         -------
@@ -252,13 +288,29 @@ class FileCollection(Collection[FileLink]):
         """
         if not os.path.isfile(file_path):
             raise ValueError("No file at specified path {}".format(file_path))
+        if part_size < _MIN_PART_SIZE:
+            raise ValueError("part_size must be at least {} bytes".format(_MIN_PART_SIZE))
 
         if not dest_name:
             # Use the file name as a default dest_name
             dest_name = os.path.basename(file_path)
 
-        uploader = self._make_upload_request(file_path, dest_name)
-        uploader = self._upload_file(file_path, uploader)
+        file_stat = os.stat(file_path)
+        if file_stat.st_size <= part_size:
+            uploader = self._make_upload_request(file_path, dest_name)
+            uploader = self._upload_file(file_path, uploader)
+        else:
+            uploader = self._make_upload_request(file_path, dest_name)
+            uploader.part_size = max(part_size, -(-file_stat.st_size // _MAX_PARTS))
+            try:
+                uploader = self._upload_file(file_path, uploader,
+                                             file_size=file_stat.st_size,
+                                             concurrency=concurrency)
+            except BaseException:
+                # Otherwise S3 keeps (and bills for) the stored parts
+                if uploader.multipart_upload_id:
+                    self._abort_multipart_upload(uploader)
+                raise
         return self._complete_upload(dest_name, uploader)
 
     def _make_upload_request(self, file_path: str, dest_name: str):
@@ -327,16 +379,57 @@ class FileCollection(Collection[FileLink]):
         return mime_type
 
     @staticmethod
-    def _upload_file(file_path: str, uploader: _Uploader):
+    def _s3_client(uploader: _Uploader, *, max_connections: int = 10):
+        """Create an S3 client with the credentials and settings of an upload request."""
+        from botocore.config import Config
+        additional_s3_opts = {
+            'use_ssl': uploader.s3_use_ssl,
+            'config': Config(s3={'addressing_style': uploader.s3_addressing_style},
+                             max_pool_connections=max(10, max_connections))
+        }
+
+        if uploader.s3_endpoint_url is not None:
+            additional_s3_opts['endpoint_url'] = uploader.s3_endpoint_url
+
+        return boto3_client('s3',
+                            region_name=uploader.region_name,
+                            aws_access_key_id=uploader.aws_access_key_id,
+                            aws_secret_access_key=uploader.aws_secret_access_key,
+                            aws_session_token=uploader.aws_session_token,
+                            **additional_s3_opts)
+
+    @staticmethod
+    def _abort_multipart_upload(uploader: _Uploader):
+        """Discard the stored parts of a multipart upload that failed."""
+        try:
+            FileCollection._s3_client(uploader).abort_multipart_upload(
+                Bucket=uploader.bucket,
+                Key=uploader.object_key,
+                UploadId=uploader.multipart_upload_id)
+        except (BotoCoreError, ClientError) as e:
+            logger.warning('Could not abort the incomplete upload to {}: {}'
+                           .format(uploader.object_key, repr(e)))
+
+    @staticmethod
+    def _upload_file(file_path: str, uploader: _Uploader, *,
+                     file_size: Optional[int] = None,
+                     concurrency: int = 1):
         """
         Upload a file to S3.
 
+        The file is sent in a single request, unless the uploader has a part size for a
+        multipart upload (in which case file_size is required).
+
         Parameters
         ----------
         file_path: str
             The path to the file on the local computer.
         uploader: _Uploader
             Holds the parameters returned by the upload request.
+        file_size: int, optional
+            The size of the file, in bytes.
+        concurrency: int
+            How many parts of a multipart upload to send at once.
 
         Returns
         -------
@@ -344,25 +437,13 @@ class FileCollection(Collection[FileLink]):
             The input uploader object with its s3_version field now populated.
 
         """
-        additional_s3_opts = {
-            'use_ssl': uploader.s3_use_ssl,
-            'config': Config(s3={'addressing_style': uploader.s3_addressing_style})
-        }
-
-        if uploader.s3_endpoint_url is not None:
-            additional_s3_opts['endpoint_url'] = uploader.s3_endpoint_url
-
-        s3_client = boto3_client('s3',
-                                 region_name=uploader.region_name,
-                                 aws_access_key_id=uploader.aws_access_key_id,
-                                 aws_secret_access_key=uploader.aws_secret_access_key,
-                                 aws_session_token=uploader.aws_session_token,
-                                 **additional_s3_opts)
+        s3_client = FileCollection._s3_client(uploader, max_connections=concurrency)
+        if uploader.part_size:
+            return FileCollection._upload_file_multipart(s3_client, file_path, uploader,
+                                                         file_size=file_size,
+                                                         concurrency=concurrency)
         with open(file_path, 'rb') as f:
             try:
-                # NOTE: This is only using the simple PUT logic, not the more sophisticated
-                # multipart upload approach that is also available (providing parallel
-                # uploads, etc).
                 upload_response = s3_client.put_object(
                     Bucket=uploader.bucket,
                     Key=uploader.object_key,
@@ -374,6 +455,66 @@ class FileCollection(Collection[FileLink]):
         uploader.s3_version = upload_response['VersionId']
         return uploader
 
+    @staticmethod
+    def _upload_file_multipart(s3_client, file_path: str, uploader: _Uploader, *,
+                               file_size: int, concurrency: int) -> _Uploader:
+        """Upload the parts of a file, and then assemble them."""
+        try:
+            response = s3_client.create_multipart_upload(
+                Bucket=uploader.bucket,
+                Key=uploader.object_key,
+                Metadata={"X-Citrine-Upload-Id": uploader.upload_id})
+            uploader.multipart_upload_id = response['UploadId']
+        except (BotoCoreError, ClientError) as e:
+            raise RuntimeError("Upload of file {} failed with the following "
+                               "exception: {}".format(file_path, e))
+
+        def upload_part(part_number: int) -> str:
+            with open(file_path, 'rb') as f:
+                f.seek((part_number - 1) * uploader.part_size)
+                body = f.read(uploader.part_size)
+            for attempt in range(_PART_RETRIES + 1):
+                try:
+                    response = s3_client.upload_part(Bucket=uploader.bucket,
+                                                     Key=uploader.object_key,
+                                                     UploadId=uploader.multipart_upload_id,
+                                                     PartNumber=part_number,
+                                                     Body=body)
+                    return response['ETag']
+                except (BotoCoreError, ClientError) as e:
+                    if attempt == _PART_RETRIES:
+                        raise
+                    logger.warning('{} seen, retrying part {} of {}'
+                                   .format(repr(e), part_number, file_path))
+                    time.sleep(_PART_RETRY_DELAY * 2 ** attempt)
+
+        part_count = max(1, -(-file_size // uploader.part_size))
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            futures = {executor.submit(upload_part, n): n for n in range(1, part_count + 1)}
+            try:
+                for future in as_completed(futures):
+                    uploader.parts[futures[future]] = future.result()
+            except (BotoCoreError, ClientError) as e:
+                raise RuntimeError("Upload of file {} failed with the following "
+                                   "exception: {}".format(file_path, e))
+            finally:
+                # Don't send any more parts once one has failed
+                for future in futures:
+                    future.cancel()
+
+        parts = [{'PartNumber': n, 'ETag': uploader.parts[n]} for n in range(1, part_count + 1)]
+        try:
+            upload_response = s3_client.complete_multipart_upload(
+                Bucket=uploader.bucket,
+                Key=uploader.object_key,
+                UploadId=uploader.multipart_upload_id,
+                MultipartUpload={'Parts': parts})
+        except (BotoCoreError, ClientError) as e:
+            raise RuntimeError("Upload of file {} failed with the following "
+                               "exception: {}".format(file_path, e))
+        uploader.s3_version = upload_response['VersionId']
+        return uploader
+
     def _complete_upload(self, dest_name: str, uploader: _Uploader):
         """
         Indicate that the upload has finished and determine the file URL.
@@ -405,10 +546,21 @@ class FileCollection(Collection[FileLink]):
         url = self._get_path(file_id) + format_escaped_url('/versions/{}', version)
         return FileLink(filename=dest_name, url=url)
 
-    def download(self, *, file_link: FileLink, local_path: str):
+    def download(self, *, file_link: FileLink, local_path: str,
+                 part_size: int = 16 * 1024 * 1024,
+                 concurrency: int = 4,
+                 resume: bool = False,
+                 checksum: Optional[str] = None,
+                 checksum_algorithm: str = 'sha256'):
         """
         Download the file associated with a given FileLink to the local computer.
 
+        The file is streamed to disk, so it is never held in memory as a whole.  Large files
+        are fetched as several byte ranges at once.  Until it is complete, the download is
+        written to `local_path` with ".part" appended, which is then renamed, and the ETag of
+        the file is kept with ".part.etag" appended so that a resumed download can tell
+        whether the file has changed.
+
         Parameters
         ----------
         file_link: FileLink
@@ -416,19 +568,51 @@ class FileCollection(Collection[FileLink]):
         local_path: str
             Path to save file on the local computer. If `local_path` is a directory,
             then the filename of this FileLink object will be appended to the path.
+        part_size: int, optional
+            The size, in bytes, of each range requested at once.  Default: 16 MiB
+        concurrency: int, optional
+            How many ranges to download at once.  With 1, the file is downloaded in a single
+            request.  Default: 4
+        resume: bool, optional
+            Whether to continue from a ".part" file left by an earlier download of the same
+            file that failed.  Default: False
+        checksum: str, optional
+            The expected hex digest of the file.  If given and the download does not match,
+            a RuntimeError is raised and nothing is saved.
+        checksum_algorithm: str, optional
+            The :mod:`hashlib` algorithm that produced `checksum`.  Default: sha256
 
         """
         directory, filename = os.path.split(local_path)
         if not filename:
             filename = file_link.filename
         local_path = os.path.join(directory, filename)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
 
         # The "/content-link" route returns a pre-signed url to download the file.
         content_link_path = file_link.url + '/content-link'
         content_link_response = self.session.get_resource(content_link_path)
         pre_signed_url = content_link_response['pre_signed_read_link']
-        download_response = requests.get(pre_signed_url)
-        write_file_locally(download_response.content, local_path)
+
+        partial_path = local_path + '.part'
+        if not resume:
+            _discard_partial(partial_path)
+        _download_to_file(pre_signed_url, partial_path,
+                          part_size=part_size, concurrency=concurrency)
+
+        if checksum is not None:
+            digest = hashlib.new(checksum_algorithm)
+            with open(partial_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+            if digest.hexdigest().lower() != checksum.lower():
+                _discard_partial(partial_path)
+                raise RuntimeError("Download of {} failed: expected {} checksum {}, but got {}"
+                                   .format(file_link.filename, checksum_algorithm, checksum,
+                                           digest.hexdigest()))
+        os.replace(partial_path, local_path)
+        _discard_partial(partial_path)  # Which only leaves its ETag now
 
     def process(self, *, file_link: FileLink,
                 processing_type: FileProcessingType,
@@ -548,3 +732,125 @@ class FileCollection(Collection[FileLink]):
         file_id = split_url[-3]
         data = self.session.delete_resource(self._get_path(file_id))
         return Response(body=data)
+
+
+def _content_range_total(response: requests.Response) -> Optional[int]:
+    """Read the total size of an object from a Content-Range header, e.g. 'bytes 0-9/100'."""
+    total = response.headers.get('Content-Range', '').rpartition('/')[2]
+    return int(total) if total.isdigit() else None
+
+
+def _write_response(response: requests.Response, f) -> int:
+    """Stream the body of a response into a file, and return the number of bytes written."""
+    written = 0
+    for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+        f.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def _validator_path(path: str) -> str:
+    """The file that holds the ETag of the object that a partial download is a prefix of."""
+    return path + '.etag'
+
+
+def _discard_partial(path: str):
+    """Remove a partial download and its ETag, if they exist."""
+    for leftover in (path, _validator_path(path)):
+        if os.path.exists(leftover):
+            os.remove(leftover)
+
+
+def _download_to_file(url: str, path: str, *, part_size: int, concurrency: int):
+    """
+    Download url to path, keeping whatever path already holds as the start of the object.
+
+    The object is only ever appended to path in order, so however the download stops, path
+    holds a prefix of the object and calling this again resumes it.  The ETag of the object
+    is kept next to path and sent as If-Range when resuming, so that the prefix is discarded
+    if the object has changed since.  A prefix without a recorded ETag cannot be checked, and
+    is downloaded again.  The first request also determines the size of the object; if there
+    is more than part_size left after it, the remaining ranges are fetched on a thread pool,
+    holding up to `concurrency` ranges in memory until the ones before them are written.
+    """
+    recorded = None
+    if os.path.isfile(_validator_path(path)):
+        with open(_validator_path(path)) as f:
+            recorded = f.read() or None
+    etag = recorded
+    offset = os.path.getsize(path) if os.path.isfile(path) and etag is not None else 0
+    if not offset:
+        _discard_partial(path)
+    if concurrency > 1:
+        headers = {'Range': 'bytes={}-{}'.format(offset, offset + part_size - 1)}
+    elif offset:
+        headers = {'Range': 'bytes={}-'.format(offset)}
+    else:
+        headers = {}
+    if offset:
+        headers['If-Range'] = etag
+
+    with requests.get(url, headers=headers, stream=True) as response:
+        if response.status_code == 416 and _content_range_total(response) == offset:
+            return  # Everything was already downloaded
+        response.raise_for_status()
+        etag = response.headers.get('ETag')
+        if response.status_code != 206:
+            # Ranges are not supported, or the object changed, so this is the whole object
+            _discard_partial(path)
+            with open(path, 'wb') as f:
+                _write_response(response, f)
+            return
+        changed = offset and etag != recorded
+        if not changed:
+            if etag is not None and not offset:
+                with open(_validator_path(path), 'w') as f:
+                    f.write(etag)
+            total = _content_range_total(response)
+            with open(path, 'ab') as f:
+                _write_response(response, f)
+    if changed:
+        # The server sent the rest of a different object, ignoring If-Range
+        _discard_partial(path)
+        return _download_to_file(url, path, part_size=part_size, concurrency=concurrency)
+
+    start = offset + part_size
+    if concurrency <= 1 or total is None or start >= total:
+        return
+
+    def fetch(first: int, last: int) -> bytes:
+        range_headers = {'Range': 'bytes={}-{}'.format(first, last)}
+        if etag is not None:
+            range_headers['If-Range'] = etag
+        with requests.get(url, headers=range_headers) as range_response:
+            range_response.raise_for_status()
+            if range_response.status_code != 206:
+                raise RuntimeError("Expected bytes {}-{} of {}, but got status {}".format(
+                    first, last, url, range_response.status_code))
+            content = range_response.content
+        if len(content) != last - first + 1:
+            raise RuntimeError("Expected {} bytes from {}, but got {}".format(
+                last - first + 1, url, len(content)))
+        return content
+
+    ranges = iter([(first, min(first + part_size, total) - 1)
+                   for first in range(start, total, part_size)])
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    in_flight = deque()
+    interrupted = False
+    try:
+        with open(path, 'ab') as f:
+            while True:
+                for first, last in islice(ranges, concurrency - len(in_flight)):
+                    in_flight.append(executor.submit(fetch, first, last))
+                if not in_flight:
+                    return
+                f.write(in_flight.popleft().result())
+    except BaseException as e:
+        interrupted = not isinstance(e, Exception)
+        raise
+    finally:
+        for future in in_flight:
+            future.cancel()
+        # Let the ranges in flight finish after an error, but not after an interruption
+        executor.shutdown(wait=not interrupted)
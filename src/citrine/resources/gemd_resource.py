@@ -1,16 +1,31 @@
 """Collection class for generic GEMD objects and templates."""
 from collections import defaultdict
-from typing import Type, Union, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from logging import getLogger
+from time import monotonic
+from typing import Type, Union, Optional, List, Tuple, Callable, Iterator, Iterable
 from uuid import UUID
+from weakref import WeakValueDictionary
 
 from gemd.util import writable_sort_order
 from gemd.entity.base_entity import BaseEntity
+from gemd.entity.dict_serializable import DictSerializable
 from gemd.entity.link_by_uid import LinkByUID
+from requests.exceptions import RetryError, Timeout
 
+from citrine.exceptions import PayloadTooLarge
 from citrine.resources.api_error import ApiError
-from citrine.resources.data_concepts import DataConcepts, DataConceptsCollection
+from citrine.resources.data_concepts import DataConcepts, DataConceptsCollection, CITRINE_SCOPE
 from citrine.resources.delete import _async_gemd_batch_delete
 from citrine._session import Session
+from citrine._utils.batching import AdaptiveBatchLimit, split_by_size
+from citrine._utils.telemetry import tagged
+
+logger = getLogger(__name__)
+
+# Errors after which a batch is split and retried: the server rejected it as too large, or it
+# timed out (either on the client, or at a gateway until the retries were exhausted)
+_SPLITTABLE_ERRORS = (PayloadTooLarge, Timeout, RetryError)
 
 
 class GEMDResourceCollection(DataConceptsCollection[DataConcepts]):
@@ -76,7 +91,11 @@ class GEMDResourceCollection(DataConceptsCollection[DataConcepts]):
         """Register a GEMD object to the appropriate collection."""
         return self._collection_for(model).register(model, dry_run=dry_run)
 
-    def register_all(self, models: List[DataConcepts], *, dry_run=False) -> List[DataConcepts]:
+    def register_all(self, models: List[DataConcepts], *, dry_run=False,
+                     concurrency: int = 1,
+                     max_batch_objects: int = 50,
+                     max_batch_bytes: int = 4 * 1024 * 1024,
+                     target_batch_latency: float = 10.0) -> List[DataConcepts]:
         """
         Register multiple GEMD objects to each of their appropriate collections.
 
@@ -86,6 +105,11 @@ class GEMDResourceCollection(DataConceptsCollection[DataConcepts]):
         The uids of the input data concepts resources are updated with their on-platform uids.
         This supports storing an object that has a reference to an object that doesn't have a uid.
 
+        Objects are sent in batches of a single type.  Batches are kept under both a byte and
+        an object ceiling, and the number of objects per batch is reduced if the server is slow
+        to respond.  A batch that is rejected as too large (http status 413) or that times out
+        is split in half and retried.
+
         Parameters
         ----------
         models: List[DataConcepts]
@@ -95,31 +119,151 @@ class GEMDResourceCollection(DataConceptsCollection[DataConcepts]):
             Whether to actually register the item or run a dry run of the register operation.
             Dry run is intended to be used for validation. Default: false
 
+        concurrency: int
+            How many batches to send at once.  Batches of objects of the same type do not
+            depend on each other, so they are sent in parallel; all batches of one type are
+            stored before any batch of the next type is sent.  Default: 1
+
+        max_batch_objects: int
+            The most objects to send in a single request.  Default: 50
+
+        max_batch_bytes: int
+            The most bytes of serialized objects to send in a single request.  Default: 4 MiB
+
+        target_batch_latency: float
+            The round-trip time (in seconds) to aim for when sending a batch.  Batches that
+            take longer reduce the number of objects per batch.  Default: 10
+
         Returns
         -------
         List[DataConcepts]
-            The registered versions
+            The registered versions, in the same order as with concurrency=1
 
         """
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive, got {}".format(concurrency))
+        self.session.ensure_pool_size(concurrency)
+        batch_limit = AdaptiveBatchLimit(max_batch_objects, target_batch_latency)
+        encode = self.session.json_codec.dumps
+
+        def put_batch(collection: DataConceptsCollection, objects: List[bytes]):
+            start = monotonic()
+            try:
+                registered = collection._put_batch(objects, dry_run=dry_run)
+            except _SPLITTABLE_ERRORS as e:
+                if len(objects) == 1:
+                    raise
+                logger.info('Splitting a batch of %s objects after %s', len(objects), repr(e))
+                batch_limit.shrink(len(objects))
+                half = len(objects) // 2
+                return put_batch(collection, objects[:half]) + \
+                    put_batch(collection, objects[half:])
+            batch_limit.record(len(objects), monotonic() - start)
+            return registered
+
+        def register_batch(batch: List[DataConcepts]) -> List[DataConcepts]:
+            collection = self._collection_for(batch[0])
+            if collection.dataset_id is None:
+                raise RuntimeError("Must specify a dataset in order to register a data model "
+                                   "object.")
+            # Encoded once, both to measure the objects and to send them
+            objects = [encode(obj) for obj in collection._dump_for_write(batch, dry_run=dry_run)]
+            registered = []
+            for chunk in split_by_size(objects, [len(obj) for obj in objects], max_batch_bytes):
+                registered.extend(put_batch(collection, chunk))
+            return registered
+        register_batch = tagged('register_all', register_batch)
+
         resources = list()
-        by_type = defaultdict(list)
-        for obj in models:
-            by_type[obj.typ].append(obj)
-        typ_groups = sorted(list(by_type.values()), key=lambda x: writable_sort_order(x[0]))
-        batch_size = 50
-        for typ_group in typ_groups:
-            num_batches = len(typ_group) // batch_size
-            for batch_num in range(num_batches + 1):
-                batch = typ_group[batch_num * batch_size: (batch_num + 1) * batch_size]
-                if batch:  # final batch is empty when batch_size divides len(typ_group)
-                    registered = self._collection_for(batch[0]) \
-                        .register_all(batch, dry_run=dry_run)
+        executor = ThreadPoolExecutor(max_workers=concurrency) if concurrency > 1 else None
+        sent = []
+        try:
+            for tier in _write_tiers(models):
+                # Each batch is cut as it is sent, so that it follows the latest limit
+                batches = _batches(tier, lambda: batch_limit.limit)
+                if executor is None:
+                    results = ((batch, register_batch(batch)) for batch in batches)
+                else:
+                    sent = []
+                    in_flight = set()
+                    while True:
+                        # Wait for a free worker before cutting the next batch
+                        if len(in_flight) >= concurrency:
+                            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                future.result()  # Raises if the batch failed
+                        batch = next(batches, None)
+                        if batch is None:
+                            break
+                        future = executor.submit(register_batch, batch)
+                        sent.append((batch, future))
+                        in_flight.add(future)
+                    # Wait for the whole tier, since the next one may reference any object in it
+                    results = [(batch, future.result()) for batch, future in sent]
+                for batch, registered in results:
                     for prewrite, postwrite in zip(batch, registered):
                         if isinstance(postwrite, BaseEntity):
                             prewrite.uids = postwrite.uids
                     resources.extend(registered)
+        finally:
+            if executor is not None:
+                # Don't start any more batches if one of them failed
+                for _, future in sent:
+                    future.cancel()
+                executor.shutdown(wait=True)
         return resources
 
+    def register_stream(self, models: Iterable[DataConcepts], *, dry_run=False,
+                        batch_size: int = 50,
+                        max_pending: int = 10000) -> Iterator[DataConcepts]:
+        """
+        Register a stream of GEMD objects, writing them as soon as their links can be resolved.
+
+        Unlike :meth:`register_all`, the objects need not all be in memory at once.  An object
+        is written once every object it links to has been written (or already has a Citrine
+        id and is not part of the stream), in batches of a single type.  So memory is bounded
+        by the objects still waiting on a link, rather than by the whole dataset.  Objects that
+        are still waiting when the stream ends are written as by :meth:`register_all`.
+
+        Objects are only written as the returned iterator is consumed.  As with register_all,
+        the uids of the input objects are updated with their on-platform uids.
+
+        Parameters
+        ----------
+        models: Iterable[DataConcepts]
+            The data model objects to register. Can be different types, in any order.
+
+        dry_run: bool
+            Whether to actually register the item or run a dry run of the register operation.
+            Dry run is intended to be used for validation. Default: false
+
+        batch_size: int
+            The most objects to write in a single request.  Default: 50
+
+        max_pending: int
+            Once more than this many objects have been read but not written, partial batches
+            are written too, rather than waiting for them to fill up.  And objects stop
+            waiting on links to objects that are not in the stream yet but already have uids
+            (in any scope), on the assumption that those are already stored.  Default: 10000
+
+        Returns
+        -------
+        Iterator[DataConcepts]
+            The registered versions, in the order they were written
+
+        """
+        registrar = _StreamingRegistrar(self, dry_run=dry_run, batch_size=batch_size)
+        for model in models:
+            registrar.add(model)
+            full_only = len(registrar.pending) <= max_pending
+            if not full_only:
+                registrar.release()
+            yield from registrar.flush(full_only=full_only)
+        yield from registrar.flush(full_only=False)
+        if registrar.pending:
+            yield from self.register_all(list(registrar.pending.values()), dry_run=dry_run,
+                                         max_batch_objects=batch_size)
+
     def async_update(self, model: DataConcepts, *,
                      dry_run: bool = False,
                      wait_for_response: bool = True,
@@ -221,3 +365,148 @@ class GEMDResourceCollection(DataConceptsCollection[DataConcepts]):
         """
         return _async_gemd_batch_delete(id_list, self.project_id, self.session, self.dataset_id,
                                         timeout=timeout, polling_delay=polling_delay)
+
+
+class _StreamingRegistrar:
+    """The bookkeeping for GEMDResourceCollection.register_stream."""
+
+    def __init__(self, collection: GEMDResourceCollection, *, dry_run: bool, batch_size: int):
+        self.collection = collection
+        self.dry_run = dry_run
+        self.batch_size = batch_size
+        # Objects (by id) that have been read but not written
+        self.pending = {}
+        # The ids of the objects each waiting object links to, that have not been written
+        self.blockers = {}
+        # The objects waiting on each blocker, by id of the blocker
+        self.waiters = defaultdict(list)
+        # The blockers, by id
+        self.referents = {}
+        # Objects whose links have all been written, by type
+        self.ready = defaultdict(list)
+        # Objects written so far, for as long as anything else refers to them
+        self.written = WeakValueDictionary()
+
+    def _is_stored(self, obj: BaseEntity) -> bool:
+        key = id(obj)
+        if self.written.get(key) is obj:
+            return True
+        return key not in self.pending and CITRINE_SCOPE in obj.uids
+
+    def add(self, model: DataConcepts):
+        """Read an object from the stream."""
+        key = id(model)
+        if key in self.pending or self.written.get(key) is model:
+            return
+        self.pending[key] = model
+        blockers = set()
+        for linked in _linked_entities(model):
+            if id(linked) not in blockers and not self._is_stored(linked):
+                blockers.add(id(linked))
+                self.waiters[id(linked)].append(model)
+                self.referents[id(linked)] = linked
+        if blockers:
+            self.blockers[key] = blockers
+        else:
+            self.ready[model.typ].append(model)
+
+    def release(self):
+        """Stop waiting on the blockers that have not been read but already have uids."""
+        for key in [key for key, obj in self.referents.items()
+                    if obj.uids and key not in self.pending]:
+            self._unblock(key)
+
+    def _unblock(self, key: int):
+        del self.referents[key]
+        for waiter in self.waiters.pop(key, ()):
+            blockers = self.blockers[id(waiter)]
+            blockers.discard(key)
+            if not blockers:
+                del self.blockers[id(waiter)]
+                self.ready[waiter.typ].append(waiter)
+
+    def flush(self, *, full_only: bool) -> Iterator[DataConcepts]:
+        """Write ready objects, in writable order, until there are no (full) batches left."""
+        while True:
+            batches = [objs for objs in self.ready.values()
+                       if objs and (len(objs) >= self.batch_size or not full_only)]
+            if not batches:
+                return
+            objs = min(batches, key=lambda x: writable_sort_order(x[0]))
+            batch = objs[:self.batch_size]
+            del objs[:self.batch_size]
+            yield from self._write(batch)
+
+    def _write(self, batch: List[DataConcepts]) -> List[DataConcepts]:
+        # Serializing assigns ids to the objects in the batch and the objects they link to
+        # that have none, including ones that are yet to be read.  Take those back, so they
+        # are not mistaken for stored objects.
+        in_batch = {id(x) for x in batch}
+        unidentified = [linked for obj in batch for linked in _linked_entities(obj)
+                        if not linked.uids and id(linked) not in in_batch]
+        registered = self.collection._collection_for(batch[0]).register_all(
+            batch, dry_run=self.dry_run)
+        for obj in unidentified:
+            obj.uids.clear()
+
+        for prewrite, postwrite in zip(batch, registered):
+            if isinstance(postwrite, BaseEntity):
+                prewrite.uids = postwrite.uids
+            key = id(prewrite)
+            del self.pending[key]
+            self.written[key] = prewrite
+            if key in self.referents:
+                self._unblock(key)
+        return registered
+
+
+def _linked_entities(obj: BaseEntity) -> List[BaseEntity]:
+    """The entities that the serialized form of obj links to (so not its back-references)."""
+    linked = []
+    queue = list(obj.as_dict().values())
+    while queue:
+        value = queue.pop()
+        if isinstance(value, BaseEntity):
+            linked.append(value)
+        elif isinstance(value, DictSerializable):
+            queue.extend(value.as_dict().values())
+        elif isinstance(value, (list, tuple)):
+            queue.extend(value)
+        elif isinstance(value, dict):
+            queue.extend(value.values())
+    return linked
+
+
+def _write_tiers(models: List[DataConcepts]) -> List[List[DataConcepts]]:
+    """
+    Split models into tiers of a single type, in writable order.
+
+    Every object in a tier can be written once the tiers before it have been written, so the
+    objects within a tier do not depend on each other.
+    """
+    by_type = defaultdict(list)
+    for obj in models:
+        by_type[obj.typ].append(obj)
+    return sorted(by_type.values(), key=lambda x: writable_sort_order(x[0]))
+
+
+def _batches(objs: List[DataConcepts],
+             batch_size: Union[int, Callable[[], int]]) -> Iterator[List[DataConcepts]]:
+    """
+    Split objs into consecutive batches.
+
+    batch_size may be a callable, in which case it is consulted as each batch is cut, after
+    the batches before it have been handed out.
+    """
+    start = 0
+    while start < len(objs):
+        size = batch_size() if callable(batch_size) else batch_size
+        yield objs[start:start + size]
+        start += size
+
+
+def _write_batches_by_tier(models: List[DataConcepts],
+                           batch_size: int = 50) -> Iterator[List[List[DataConcepts]]]:
+    """Split models into batches of a single type, grouped into tiers in writable order."""
+    for tier in _write_tiers(models):
+        yield list(_batches(tier, batch_size))
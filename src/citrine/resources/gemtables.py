@@ -1,6 +1,9 @@
+import csv
+import io
 import json
+from contextlib import contextmanager
 from logging import getLogger
-from typing import Union, Iterable, Optional, Any, Tuple
+from typing import Union, Iterable, Iterator, Optional, Any, Tuple, List, Callable, BinaryIO
 from uuid import uuid4
 from warnings import warn
 
@@ -14,11 +17,38 @@ from citrine._serialization.properties import UUID
 from citrine._session import Session
 from citrine._utils.functions import rewrite_s3_links_locally, write_file_locally, \
     format_escaped_url
-from citrine.jobs.job import JobSubmissionResponse, _poll_for_job_completion
+from citrine.gemtables.columns import Column, MeanColumn, StdDevColumn, QuantileColumn, \
+    MostLikelyProbabilityColumn, ComponentQuantityColumn, NthBiggestComponentQuantityColumn
+from citrine.jobs.job import JobSubmissionResponse, JobStatusResponse, JobGroup, \
+    _poll_for_job_completion, _check_job_result
 from citrine.resources.table_config import TableConfig, TableConfigCollection
 
 logger = getLogger(__name__)
 
+# Columns whose values are real numbers; every other column holds strings
+_NUMERIC_COLUMNS = (MeanColumn, StdDevColumn, QuantileColumn, MostLikelyProbabilityColumn,
+                    ComponentQuantityColumn, NthBiggestComponentQuantityColumn)
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _parse_real(value: str) -> Optional[float]:
+    return float(value) if value else None
+
+
+def _parse_text(value: str) -> Optional[str]:
+    return value if value else None
+
+
+def _column_converters(headers: List[str],
+                       columns: List[Column]) -> List[Callable[[str], Any]]:
+    """Pick a parser for each CSV column, from the config column in the same position."""
+    if len(headers) != len(columns):
+        logger.warning('Table has {} columns but its config defines {}; reading every column '
+                       'as text.'.format(len(headers), len(columns)))
+        columns = [None] * len(headers)
+    return [_parse_real if isinstance(column, _NUMERIC_COLUMNS) else _parse_text
+            for column in columns]
+
 
 class GemTable(Resource['Table']):
     """A 2-dimensional projection of data.
@@ -138,7 +168,9 @@ class GemTableCollection(Collection[GemTable]):
 
         return self._paginator.paginate(
             # Don't deduplicate on uid since uids are shared between versions
-            _fetch_versions, _build_versions, page, per_page, deduplicate=False)
+            _fetch_versions, _build_versions, page, per_page, deduplicate=False,
+            concurrency=self.session.page_fetch_concurrency,
+            session=self.session)
 
     def list_by_config(self,
                        table_config_uid: UUID,
@@ -175,7 +207,9 @@ class GemTableCollection(Collection[GemTable]):
 
         return self._paginator.paginate(
             # Don't deduplicate on uid since uids are shared between versions
-            _fetch_versions, _build_versions, page, per_page, deduplicate=False)
+            _fetch_versions, _build_versions, page, per_page, deduplicate=False,
+            concurrency=self.session.page_fetch_concurrency,
+            session=self.session)
 
     def initiate_build(self, config: Union[TableConfig, str, UUID], *,
                        version: Union[str, UUID] = None) -> JobSubmissionResponse:
@@ -253,7 +287,37 @@ class GemTableCollection(Collection[GemTable]):
 
         """
         status = _poll_for_job_completion(self.session, self.project_id, job, timeout=timeout)
+        return self._get_built_table(status)
+
+    def get_by_build_jobs(self, jobs: Iterable[Union[JobSubmissionResponse, UUID]], *,
+                          timeout: float = 15 * 60) -> Iterator[GemTable]:
+        """
+        [ALPHA] Gets the tables built by several build jobs, as each of them completes.
+
+        The jobs are waited on together with a :class:`~citrine.jobs.job.JobGroup`, so this
+        takes about as long as the slowest of the builds.
+
+        Parameters
+        ----------
+        jobs
+            The job submission objects or job IDs for the table builds.
+        timeout
+            Amount of time to wait on all of the build jobs (in seconds) before giving up.
+            Defaults to 15 minutes. Note that this number has no effect on the build jobs
+            themselves, which can also time out server-side.
+
+        Returns
+        -------
+        Iterator[GemTable]
+            The tables built by the specified jobs, in the order that the builds finish.
+
+        """
+        group = JobGroup(self.session, self.project_id, jobs, timeout=timeout)
+        for job_id, status in group.as_completed():
+            yield self._get_built_table(_check_job_result(status, job_id))
 
+    def _get_built_table(self, status: JobStatusResponse) -> GemTable:
+        """Get the table that a successful build job produced, logging any build warnings."""
         table_id = status.output['display_table_id']
         table_version = status.output['display_table_version']
         warning_blob = status.output.get('table_warnings')
@@ -321,7 +385,7 @@ class GemTableCollection(Collection[GemTable]):
     table_type = Union[GemTable, UUID, str]
     obsolete_table_type = Union[table_type, Tuple[Union[str, UUID], Union[str, int]]]
 
-    def _read_raw(self, table: table_type) -> requests.Response:
+    def _read_raw(self, table: table_type, *, stream: bool = False) -> requests.Response:
         """
         Read the Table file from S3 into local memory.
 
@@ -332,6 +396,8 @@ class GemTableCollection(Collection[GemTable]):
         ----------
         table:
             The persisted table config from which to build a table (or its ID and version number).
+        stream:
+            Whether to defer downloading the body until it is read from the response.
 
         Returns
         -------
@@ -344,7 +410,7 @@ class GemTableCollection(Collection[GemTable]):
 
         data_location = table.download_url
         data_location = rewrite_s3_links_locally(data_location, self.session.s3_endpoint_url)
-        return requests.get(data_location)
+        return requests.get(data_location, stream=stream)
 
     def read_to_memory(self, table: table_type) -> str:
         """
@@ -364,7 +430,9 @@ class GemTableCollection(Collection[GemTable]):
             The contents of the file from S3, which is expected to be formatted as a CSV
 
         """
-        return self._read_raw(table).text
+        if self.session.table_cache is None:
+            return self._read_raw(table).text
+        return self._read_content(table).decode('utf-8')
 
     def read(self, *, table: obsolete_table_type, local_path: str):
         """
@@ -388,5 +456,123 @@ class GemTableCollection(Collection[GemTable]):
                  "Please pass a GemTable object.", DeprecationWarning)
             table = self.get(uid=table[0], version=table[1])
 
-        response = self._read_raw(table)
-        write_file_locally(response.content, local_path)
+        write_file_locally(self._read_content(table), local_path)
+
+    def _read_content(self, table: table_type) -> bytes:
+        """Read the contents of a Table, through the session's table cache if it has one."""
+        cache = self.session.table_cache
+        if cache is None:
+            return self._read_raw(table).content
+        if not isinstance(table, GemTable):
+            table = self.get(uid=table)
+        if table.version is None:
+            return self._read_raw(table).content
+
+        content = cache.get(table.uid, table.version)
+        if content is None:
+            response = self._read_raw(table)
+            content = response.content
+            if response.ok:
+                cache.put(table.uid, table.version, content)
+        return content
+
+    def read_batches(self, table: table_type, *,
+                     batch_size: int = 10000,
+                     as_data_frame: bool = False,
+                     config: Optional[TableConfig] = None
+                     ) -> Iterator[Union[List[dict], 'pandas.DataFrame']]:  # noqa: F821
+        """
+        [ALPHA] Parse a Table in batches of rows, as it is downloaded.
+
+        Unlike ``read_to_memory``, the whole table is never held in memory at once, so very
+        large tables can be processed with memory proportional to the batch size.  Values are
+        typed by the config column in the same position: columns of real numbers (such as
+        :class:`~citrine.gemtables.columns.MeanColumn` and
+        :class:`~citrine.gemtables.columns.StdDevColumn`) are parsed as floats, and all other
+        columns (such as :class:`~citrine.gemtables.columns.IdentityColumn`) are left as
+        strings.  Empty cells are None (or NaN in a DataFrame).
+
+        If the session has a table cache, the table is read through it.
+
+        Parameters
+        ----------
+        table:
+            The Table object to read (or its ID, to read the most recent version).
+        batch_size: int
+            The number of rows per batch.  Default: 10000
+        as_data_frame: bool
+            Whether to yield each batch as a pandas DataFrame, rather than as a list of dicts
+            keyed by column header.  Requires pandas.
+        config: TableConfig, optional
+            The config the table was built from.  If omitted, it is fetched from the platform.
+
+        Returns
+        -------
+        Iterator[Union[List[dict], pandas.DataFrame]]
+            The batches of rows, in order.
+
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive, got {}".format(batch_size))
+        if as_data_frame:
+            try:
+                import pandas  # noqa: F401
+            except ImportError:  # pragma: no cover
+                raise ImportError('pandas>=1.1.0 is a requirement for reading tables as '
+                                  'DataFrames')
+        if not isinstance(table, GemTable):
+            table = self.get(uid=table)
+        columns = (config or table.config).columns
+
+        with self._open_content(table) as content:
+            reader = csv.reader(io.TextIOWrapper(content, encoding='utf-8', newline=''))
+            headers = next(reader, None)
+            if headers is None:
+                return
+            converters = _column_converters(headers, columns)
+            numeric = {header: 'float64' for header, converter in zip(headers, converters)
+                       if converter is _parse_real}
+
+            batch = []
+            for line, row in enumerate(reader, start=2):
+                try:
+                    batch.append([convert(value) for convert, value in zip(converters, row)])
+                except ValueError as e:
+                    raise ValueError("Could not parse line {} of table {}: {}"
+                                     .format(line, table.uid, e))
+                if len(batch) == batch_size:
+                    yield self._build_batch(batch, headers, numeric, as_data_frame)
+                    batch = []
+            if batch:
+                yield self._build_batch(batch, headers, numeric, as_data_frame)
+
+    @staticmethod
+    def _build_batch(rows: List[list], headers: List[str], numeric: dict, as_data_frame: bool):
+        if as_data_frame:
+            import pandas as pd
+            return pd.DataFrame(rows, columns=headers, dtype=object).astype(numeric)
+        return [dict(zip(headers, row)) for row in rows]
+
+    @contextmanager
+    def _open_content(self, table: GemTable) -> Iterator[BinaryIO]:
+        """Open the contents of a Table as a binary stream, through the table cache if any."""
+        cache = self.session.table_cache
+        content = None
+        if cache is not None and table.version is not None:
+            content = cache.open(table.uid, table.version)
+            if content is None:
+                with self._read_raw(table, stream=True) as response:
+                    response.raise_for_status()
+                    cache.put_stream(table.uid, table.version,
+                                     response.iter_content(_DOWNLOAD_CHUNK_SIZE))
+                # None if the table is too big for the cache, and so was evicted right away
+                content = cache.open(table.uid, table.version)
+
+        if content is not None:
+            with content:
+                yield content
+        else:
+            with self._read_raw(table, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                yield response.raw
@@ -0,0 +1,161 @@
+"""Assembly of material histories from the response of the material-history endpoint."""
+from typing import Dict, List, Set, Tuple, Union
+
+from gemd.entity.base_entity import BaseEntity
+from gemd.entity.link_by_uid import LinkByUID
+from gemd.entity.object.ingredient_run import IngredientRun as GEMDIngredientRun
+from gemd.entity.object.ingredient_spec import IngredientSpec as GEMDIngredientSpec
+from gemd.entity.object.material_run import MaterialRun as GEMDMaterialRun
+from gemd.entity.object.material_spec import MaterialSpec as GEMDMaterialSpec
+from gemd.entity.object.measurement_run import MeasurementRun as GEMDMeasurementRun
+from gemd.util import writable_sort_order
+
+_Key = Tuple[str, str]
+
+# The objects that link to an object whose history they are part of, but that it does not
+# link to, by the field that holds the link: ingredients belong to their process, and
+# measurements to their material
+_DEPENDENT_FIELDS = {
+    GEMDIngredientRun.typ: 'process',
+    GEMDIngredientSpec.typ: 'process',
+    GEMDMeasurementRun.typ: 'material',
+}
+
+# Lazily built histories stop at the material of an ingredient: every chain of links from a
+# material to its ancestors, whether through runs or specs, passes through one
+_INGREDIENTS = (GEMDIngredientRun, GEMDIngredientSpec)
+_INGREDIENT_TYPES = {ingredient.typ for ingredient in _INGREDIENTS}
+
+
+def _key(scope: str, uid: str) -> _Key:
+    # Scopes are case-insensitive
+    return scope.lower(), uid
+
+
+class MaterialHistory:
+    """
+    The history of a terminal material, built from the response of the material-history API.
+
+    Objects are built straight from the response, resolving links through an index of the
+    uids of every object in the history.  With ``lazy=False``, every object is built the
+    first time one is asked for.  With ``lazy=True``, a material run is built when it is
+    asked for, along with its process, the ingredients of that process, its measurements,
+    and the specs and templates they reference.  The materials that went into those
+    ingredients, both runs and specs, are left as links until they are asked for with
+    :meth:`get`, at which point the ingredients are updated to point to them.  So building
+    a material takes the same time however long its history is.
+
+    Parameters
+    ----------
+    data: dict
+        The response of the material-history endpoint, with the terminal material under
+        ``root`` and every other object under ``context``.
+    lazy: bool
+        Whether to build the ancestors of a material only when they are asked for.
+
+    """
+
+    def __init__(self, data: dict, *, lazy: bool = True):
+        from citrine.resources.data_concepts import DataConcepts
+        self.lazy = lazy
+        self._json = DataConcepts.get_json_support()
+        self._records: List[dict] = data['context'] + [data['root']]
+        self._index: Dict[_Key, dict] = {}
+        self._dependents: Dict[_Key, List[dict]] = {}
+        for record in self._records:
+            for scope, uid in record.get('uids', {}).items():
+                self._index[_key(scope, uid)] = record
+            field = _DEPENDENT_FIELDS.get(record.get('type'))
+            link = record.get(field) if field is not None else None
+            if isinstance(link, dict) and link.get('type') == LinkByUID.typ:
+                self._dependents.setdefault(_key(link['scope'], link['id']), []).append(record)
+        root_scope, root_id = next(iter(data['root']['uids'].items()))
+        self._root = LinkByUID(scope=root_scope, id=root_id)
+        self._objects: Dict[_Key, BaseEntity] = {}
+        self._started: Set[int] = set()
+        self._waiting: Dict[_Key, List[BaseEntity]] = {}
+        self._complete = False
+
+    @property
+    def root(self) -> GEMDMaterialRun:
+        """The terminal material."""
+        return self.get(self._root)
+
+    def get(self, link: Union[LinkByUID, BaseEntity]) -> BaseEntity:
+        """
+        Return an object in the history, building it if it has not been built yet.
+
+        Parameters
+        ----------
+        link: Union[LinkByUID, BaseEntity]
+            A link to the object, such as the ``material`` of an ingredient whose material
+            has not been built yet.
+
+        Returns
+        -------
+        BaseEntity
+            The object, with its links to other objects in the history resolved.
+
+        """
+        if isinstance(link, BaseEntity):
+            link = LinkByUID.from_entity(link)
+        if not self.lazy and not self._complete:
+            self._build_all()
+        key = _key(link.scope, link.id)
+        if key not in self._objects:
+            record = self._index.get(key)
+            if record is None:
+                raise KeyError("{}:{} is not part of this history".format(link.scope, link.id))
+            self._build(record)
+        return self._objects[key]
+
+    def _build_all(self):
+        # In writable order, every link is to an object that was built before it
+        self._complete = True
+        for record in sorted(self._records, key=lambda x: writable_sort_order(x['type'])):
+            if id(record) not in self._started:
+                self._build(record)
+
+    def _build(self, record: dict) -> BaseEntity:
+        self._started.add(id(record))
+        obj = self._load(record)
+        if not self.lazy:
+            return obj
+        keys = [_key(scope, uid) for scope, uid in obj.uids.items()]
+        for key in keys:
+            for dependent in self._dependents.get(key, ()):
+                if id(dependent) not in self._started:
+                    self._build(dependent)
+        if isinstance(obj, _INGREDIENTS) and isinstance(obj.material, LinkByUID):
+            key = _key(obj.material.scope, obj.material.id)
+            if key in self._index:
+                self._waiting.setdefault(key, []).append(obj)
+        elif isinstance(obj, (GEMDMaterialRun, GEMDMaterialSpec)):
+            for key in keys:
+                for ingredient in self._waiting.pop(key, ()):
+                    ingredient.material = obj
+        return obj
+
+    def _load(self, value, *, defer: bool = False):
+        """Build the objects in a part of the response, as GEMDJson.loads would."""
+        if isinstance(value, dict):
+            if value.get('type') == LinkByUID.typ:
+                return self._resolve(value, defer=defer)
+            is_ingredient = value.get('type') in _INGREDIENT_TYPES
+            loaded = {k: self._load(v, defer=is_ingredient and k == 'material')
+                      for k, v in value.items()}
+            return self._json._load_and_index(loaded, self._objects, True)
+        if isinstance(value, list):
+            return [self._load(x) for x in value]
+        return value
+
+    def _resolve(self, value: dict, *, defer: bool) -> Union[BaseEntity, LinkByUID]:
+        key = _key(value['scope'], value['id'])
+        obj = self._objects.get(key)
+        if obj is not None:
+            return obj
+        link = LinkByUID(scope=value['scope'], id=value['id'])
+        record = self._index.get(key)
+        if not self.lazy or defer or record is None or id(record) in self._started:
+            return link
+        return self._build(record)
@@ -1,5 +1,4 @@
 """Resources that represent material run data objects."""
-import json
 import os
 from logging import getLogger
 from typing import List, Dict, Optional, Type, Iterator, Union
@@ -11,6 +10,7 @@ from citrine._serialization.properties import Optional as PropertyOptional
 from citrine._serialization.properties import String, LinkOrElse, Mapping, Object
 from citrine._utils.functions import format_escaped_url
 from citrine.resources.data_concepts import DataConcepts, _make_link_by_uid
+from citrine.resources.material_history import MaterialHistory
 from citrine.resources.material_spec import MaterialSpecCollection
 from citrine.resources.object_runs import ObjectRun, ObjectRunCollection
 from gemd.entity.file_link import FileLink
@@ -19,8 +19,6 @@ from gemd.entity.object.material_run import MaterialRun as GEMDMaterialRun
 from gemd.entity.object.material_spec import MaterialSpec as GEMDMaterialSpec
 from gemd.entity.template.material_template import MaterialTemplate as GEMDMaterialTemplate
 from gemd.entity.object.process_run import ProcessRun as GEMDProcessRun
-from gemd.json import GEMDEncoder
-from gemd.util import writable_sort_order
 
 logger = getLogger(__name__)
 
@@ -110,7 +108,8 @@ class MaterialRunCollection(ObjectRunCollection[MaterialRun]):
         return MaterialRun
 
     def get_history(self, *, id: Union[str, UUID, LinkByUID, MaterialRun],
-                    scope: Optional[str] = None) -> Type[MaterialRun]:
+                    scope: Optional[str] = None,
+                    lazy: bool = False) -> Union[MaterialRun, MaterialHistory]:
         """
         Get the history associated with a terminal material.
 
@@ -126,13 +125,18 @@ class MaterialRunCollection(ObjectRunCollection[MaterialRun]):
             [DEPRECATED] use a LinkByUID to specify a custom scope
             The scope of the uid. The lookup will be most efficient if you use the Citrine ID
             of the material, which is the default if scope=None.
+        lazy: bool
+            Whether to return a :class:`~citrine.resources.material_history.MaterialHistory`
+            that only builds the ancestors of a material when they are asked for, rather than
+            building the whole history up front.  This is much faster for long histories of
+            which only a part is used.  Default: False
 
         Returns
         -------
-        MaterialRun
+        Union[MaterialRun, MaterialHistory]
             A material run that has all of its fields fully populated with the processes,
             ingredients, measurements, and other materials that were involved in the history
-            of the object.
+            of the object.  If lazy is True, the history, whose ``root`` is that material run.
 
         """
         link = _make_link_by_uid(id, scope)
@@ -140,20 +144,8 @@ class MaterialRunCollection(ObjectRunCollection[MaterialRun]):
         path = base_path + format_escaped_url("/material-history/{}/{}", link.scope, link.id)
         data = self.session.get_resource(path)
 
-        # Add the root to the context and sort by writable order
-        blob = dict()
-        blob["context"] = sorted(
-            data['context'] + [data['root']],
-            key=lambda x: writable_sort_order(x["type"])
-        )
-        terminal_scope, terminal_id = next(iter(data['root']['uids'].items()))
-        # Add a link to the root as the "object"
-        blob["object"] = LinkByUID(scope=terminal_scope, id=terminal_id)
-
-        # Serialize using normal json (with the GEMDEncoder) and then deserialize with the
-        # GEMDEncoder encoder in order to rebuild the material history
-        return MaterialRun.get_json_support().loads(
-            json.dumps(blob, cls=GEMDEncoder, sort_keys=True))
+        history = MaterialHistory(data, lazy=lazy)
+        return history if lazy else history.root
 
     def get_by_process(self,
                        uid: Union[UUID, str, LinkByUID, GEMDProcessRun], *,
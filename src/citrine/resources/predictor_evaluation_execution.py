@@ -133,7 +133,9 @@ class PredictorEvaluationExecutionCollection(Collection["PredictorEvaluationExec
         return self._paginator.paginate(page_fetcher=fetcher,
                                         collection_builder=self._build_collection_elements,
                                         page=page,
-                                        per_page=per_page)
+                                        per_page=per_page,
+                                        concurrency=self.session.page_fetch_concurrency,
+                                        session=self.session)
 
     def delete(self, uid: Union[UUID, str]) -> Response:
         """Predictor Evaluation Executions cannot be deleted; they can be archived instead."""
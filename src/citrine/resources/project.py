@@ -641,7 +641,9 @@ class ProjectCollection(Collection[Project]):
         return self._paginator.paginate(page_fetcher=self._fetch_page_search,
                                         collection_builder=self._build_collection_elements,
                                         per_page=per_page,
-                                        search_params=search_params)
+                                        search_params=search_params,
+                                        concurrency=self.session.page_fetch_concurrency,
+                                        session=self.session)
 
     def delete(self, uid: Union[UUID, str]) -> Response:
         """
@@ -61,3 +61,31 @@ def test_bad_object_serde():
 
 def test_object_str_representation():
     assert "<Object[NominalReal] 'foo'>" == str(Object(NominalReal, 'foo'))
+
+
+def test_serialization_plan_is_shared():
+    """Test that Object properties for the same class share one compiled plan."""
+    assert Object.for_class(SampleClass) is Object.for_class(SampleClass)
+    assert Object(SampleClass).fields is Object(SampleClass, 'other').fields
+    assert set(Object.for_class(SampleClass).fields) == {'prop_string', 'prop_value', 'prop_object'}
+
+
+def test_serialization_path_update():
+    """Test that reassigning the serialization path is honored by ser/de."""
+    prop = String('foo')
+    prop.serialization_path = 'bar.baz'
+    assert prop.serialize_to_dict({}, 'value') == {'bar': {'baz': 'value'}}
+    assert prop.deserialize_from_dict({'bar': {'baz': 'value'}}) == 'value'
+
+
+def test_base_class_lookup_is_memoized():
+    """Test that the base class lookup behind overridden properties is memoized per class."""
+    from citrine._serialization import properties
+    from citrine.resources.material_run import MaterialRun
+    from gemd.entity.object.material_run import MaterialRun as GEMDMaterialRun
+
+    run = MaterialRun("foo")
+    assert run.name == "foo"
+    assert properties._base_class_memo[(MaterialRun, 'name')] is GEMDMaterialRun
+    assert properties._get_base_class(MaterialRun("bar"), 'name') is GEMDMaterialRun
+    assert properties._get_base_class(run, 'not_a_field') is None
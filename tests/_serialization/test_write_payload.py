@@ -0,0 +1,108 @@
+"""Tests of the single-pass serialization of objects for registration."""
+from uuid import uuid4
+
+import pytest
+from gemd.entity.attribute import Condition, Parameter, Property, PropertyAndConditions
+from gemd.entity.bounds import CategoricalBounds, RealBounds
+from gemd.entity.link_by_uid import LinkByUID
+from gemd.entity.object import ProcessSpec as GEMDProcessSpec
+from gemd.entity.value import NominalReal, NominalCategorical
+
+from citrine._serialization.write_payload import WritePayload
+from citrine._utils.functions import scrub_none, replace_objects_with_links
+from citrine.resources.condition_template import ConditionTemplate
+from citrine.resources.data_concepts import DataConceptsCollection
+from citrine.resources.file_link import FileLink
+from citrine.resources.ingredient_run import IngredientRun
+from citrine.resources.material_run import MaterialRun
+from citrine.resources.material_spec import MaterialSpec
+from citrine.resources.measurement_run import MeasurementRun
+from citrine.resources.parameter_template import ParameterTemplate
+from citrine.resources.process_run import ProcessRun
+from citrine.resources.process_spec import ProcessSpec
+from citrine.resources.process_template import ProcessTemplate
+from citrine.resources.property_template import PropertyTemplate
+
+
+def _uids():
+    return {'id': str(uuid4())}
+
+
+def _graph():
+    """A material history with every kind of reference a model can hold."""
+    bounds = RealBounds(0, 100, 'degC')
+    temperature = ConditionTemplate('temperature', bounds=bounds, uids=_uids())
+    knob = ParameterTemplate('knob', bounds=CategoricalBounds(['a', 'b']), uids=_uids())
+    density = PropertyTemplate('density', bounds=RealBounds(0, 10, 'g/cm^3'),
+                               uids={'custom': 'density'})
+    process_template = ProcessTemplate('bake', uids=_uids(), tags=['a::b'],
+                                       conditions=[[temperature, bounds]],
+                                       parameters=[knob])
+    process_spec = ProcessSpec('bake', uids=_uids(), template=process_template,
+                               conditions=[Condition('temperature', template=temperature,
+                                                     value=NominalReal(50, 'degC'))])
+    material_spec = MaterialSpec('cake', uids=_uids(), process=process_spec,
+                                 properties=[PropertyAndConditions(
+                                     Property('density', template=density,
+                                              value=NominalReal(1, 'g/cm^3')))])
+    process_run = ProcessRun('bake', uids=_uids(), spec=process_spec, notes=None,
+                             parameters=[Parameter('knob', template=knob,
+                                                   value=NominalCategorical('a'))])
+    material_run = MaterialRun('cake', uids=_uids(), process=process_run,
+                               spec=LinkByUID('id', material_spec.uids['id']),
+                               file_links=[FileLink('photo.jpg', 'https://a.io/photo.jpg')])
+    ingredient = IngredientRun(uids=_uids(), material=material_run,
+                               process=ProcessRun('eat', uids=_uids()),
+                               mass_fraction=NominalReal(0.5, ''))
+    measurement = MeasurementRun('weigh', uids=_uids(), material=material_run,
+                                 properties=[Property('density', template=density,
+                                                      value=NominalReal(1, 'g/cm^3'))])
+    gemd_spec = GEMDProcessSpec('gemd', uids=_uids(), template=process_template)
+    return [temperature, knob, density, process_template, process_spec, material_spec,
+            process_run, material_run, ingredient, measurement, gemd_spec]
+
+
+@pytest.mark.parametrize('model', _graph(), ids=lambda model: type(model).__name__)
+def test_matches_dump_scrub_and_link(model):
+    expected = replace_objects_with_links(scrub_none(model.dump()))
+    assert WritePayload('id', link_scope='id').dump(model) == expected
+
+
+def test_objects_without_uids_are_not_modified():
+    process = ProcessRun('bake')
+    first = MaterialRun('first', process=process)
+    second = MaterialRun('second', process=process, spec=MaterialSpec('spec', uids=_uids()))
+    payload = WritePayload('temp', link_scope='id')
+
+    first_data, second_data = payload.dump(first), payload.dump(second)
+
+    assert first.uids == {} and second.uids == {} and process.uids == {}
+    new_uids = {id(entity): uid for entity, uid in payload.new_uids}
+    assert set(new_uids) == {id(first), id(second), id(process)}
+    assert first_data['uids'] == {'temp': new_uids[id(first)]}
+    # Both links to the process use the one new uid
+    link = {'type': 'link_by_uid', 'scope': 'temp', 'id': new_uids[id(process)]}
+    assert first_data['process'] == link and second_data['process'] == link
+    assert second_data['spec']['scope'] == 'id'
+
+
+def test_dump_for_write_assigns_ids_unless_dry_run():
+    process = ProcessRun('bake')
+    run = MaterialRun('cake', process=process)
+
+    dry, = DataConceptsCollection._dump_for_write([run], dry_run=True)
+    assert run.uids == {} and process.uids == {}
+    temp_scope, = dry['uids']
+    assert temp_scope != 'id' and dry['process']['scope'] == temp_scope
+
+    written, = DataConceptsCollection._dump_for_write([run], dry_run=False)
+    assert written['uids'] == run.uids == {'id': run.uids['id']}
+    assert written['process'] == {'type': 'link_by_uid', 'scope': 'id',
+                                  'id': process.uids['id']}
+
+
+def test_invalid_values_raise():
+    run = MaterialRun('cake')
+    run._name = None
+    with pytest.raises(ValueError):
+        WritePayload('id', link_scope='id').dump(run)
@@ -0,0 +1,39 @@
+import pytest
+
+from citrine._utils.batching import AdaptiveBatchLimit, split_by_size
+
+
+def test_adaptive_batch_limit():
+    limit = AdaptiveBatchLimit(max_objects=100, target_latency=1.0)
+    assert limit.limit == 100
+
+    # Slow batches halve the limit, down to a single object
+    limit.record(100, 2.0)
+    assert limit.limit == 50
+    limit.shrink(3)
+    assert limit.limit == 1
+    limit.shrink(1)
+    assert limit.limit == 1
+
+    # Fast, full batches grow it back up to the ceiling
+    for _ in range(30):
+        limit.record(limit.limit, 0.1)
+    assert limit.limit == 100
+
+    # Fast batches that were not full, or that were only moderately fast, leave it alone
+    limit.record(100, 2.0)
+    limit.record(10, 0.1)
+    limit.record(50, 0.9)
+    assert limit.limit == 50
+
+    with pytest.raises(ValueError):
+        AdaptiveBatchLimit(max_objects=0, target_latency=1.0)
+
+
+def test_split_by_size():
+    items = ['a', 'b', 'c', 'd', 'e']
+    assert split_by_size(items, [1, 2, 3, 4, 5], 5) == [['a', 'b'], ['c'], ['d'], ['e']]
+    assert split_by_size(items, [1] * 5, 100) == [items]
+    # Oversized items go in chunks by themselves
+    assert split_by_size(items, [1, 10, 1, 1, 10], 3) == [['a'], ['b'], ['c', 'd'], ['e']]
+    assert split_by_size([], [], 10) == []
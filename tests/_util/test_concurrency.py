@@ -0,0 +1,46 @@
+import threading
+
+import pytest
+
+from citrine._utils.concurrency import read_ahead
+
+
+def test_read_ahead_preserves_order():
+    assert list(read_ahead(iter(range(100)), depth=3)) == list(range(100))
+    assert list(read_ahead(iter([]), depth=1)) == []
+
+
+def test_read_ahead_bad_depth():
+    with pytest.raises(ValueError):
+        list(read_ahead(iter(range(3)), depth=0))
+
+
+def test_read_ahead_reraises():
+    def source():
+        yield 1
+        raise KeyError("boom")
+
+    results = read_ahead(source(), depth=2)
+    assert next(results) == 1
+    with pytest.raises(KeyError):
+        next(results)
+
+
+def test_read_ahead_is_bounded_and_stops_early():
+    produced = []
+    finished = threading.Event()
+
+    def source():
+        try:
+            for i in range(1000):
+                produced.append(i)
+                yield i
+        finally:
+            finished.set()
+
+    results = read_ahead(source(), depth=2)
+    assert next(results) == 0
+    results.close()
+    assert finished.wait(timeout=5)
+    # The producer can only have been a few items ahead when the consumer stopped
+    assert len(produced) <= 5
@@ -0,0 +1,75 @@
+import json
+import math
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from gemd.entity.link_by_uid import LinkByUID
+from gemd.entity.value import NominalReal
+from gemd.enumeration import SampleType
+from gemd.json import GEMDEncoder
+
+from citrine._utils.json_codec import JsonCodec, OrjsonCodec
+from citrine.resources.process_spec import ProcessSpec
+
+CODECS = [JsonCodec()]
+try:
+    CODECS.append(OrjsonCodec())
+except ImportError:  # pragma: no cover
+    pass
+
+
+@pytest.mark.parametrize('codec', CODECS, ids=lambda codec: codec.name)
+def test_round_trip(codec):
+    uid = uuid4()
+    when = datetime(2021, 3, 14, 1, 59, 26, 535, tzinfo=timezone.utc)
+    link = LinkByUID('id', str(uid))
+    data = {'id': uid, 'created': when, 'link': link, 'type': SampleType.EXPERIMENTAL,
+            'objects': [{'name': 'cake', 'count': 3, 'fraction': 0.5, 'tags': []}], 1: None}
+
+    encoded = codec.dumps(data)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == codec.loads(encoded.decode('utf-8')) == {
+        'id': str(uid), 'created': when.isoformat(), 'link': link.as_dict(),
+        'type': 'experimental', 'objects': data['objects'], '1': None}
+
+
+@pytest.mark.parametrize('codec', CODECS, ids=lambda codec: codec.name)
+def test_matches_gemd_encoder(codec):
+    spec = ProcessSpec('bake', uids={'id': str(uuid4())}, tags=['a::b'])
+    assert codec.loads(codec.dumps(spec.dump())) == \
+        json.loads(json.dumps(spec.dump(), cls=GEMDEncoder))
+
+
+@pytest.mark.parametrize('codec', CODECS, ids=lambda codec: codec.name)
+def test_errors(codec):
+    with pytest.raises(TypeError):
+        codec.dumps({'a': object()})
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b'{"a": ')
+
+
+@pytest.mark.parametrize('codec', CODECS, ids=lambda codec: codec.name)
+@pytest.mark.parametrize('value', [float('nan'), float('inf'), -float('inf')])
+def test_non_finite_floats_raise(codec, value):
+    with pytest.raises(ValueError):
+        codec.dumps({'v': NominalReal(value, '')})
+    with pytest.raises(ValueError):
+        codec.dumps([None, value])
+    assert codec.loads(b'{"v": null}') == {'v': None}
+
+
+@pytest.mark.parametrize('codec', CODECS, ids=lambda codec: codec.name)
+def test_falls_back_to_the_standard_library(codec):
+    # orjson cannot encode integers outside 64 bits (and decodes them as floats)
+    assert json.loads(codec.dumps({'n': 2 ** 70 + 1})) == {'n': 2 ** 70 + 1}
+    assert codec.loads(codec.dumps({'n': None, 'm': 1})) == {'n': None, 'm': 1}
+    assert math.isnan(codec.loads(b'{"v": NaN}')['v'])
+
+
+def test_orjson_encodes_nulls_itself():
+    pytest.importorskip('orjson')
+    orjson_codec = OrjsonCodec()
+    # Not re-encoded by the standard library, which would add whitespace
+    assert orjson_codec.dumps({'n': None, 'm': [1, None]}) == b'{"n":null,"m":[1,null]}'
@@ -0,0 +1,84 @@
+from uuid import uuid4
+
+import pytest
+
+from citrine._utils import object_cache
+from citrine._utils.object_cache import ObjectCache
+
+PROJECT = uuid4()
+
+
+def spec(name, **uids):
+    return {'type': 'process_spec', 'name': name, 'uids': uids}
+
+
+def test_get_by_any_uid():
+    cache = ObjectCache()
+    data = spec('a', id='1', lims='A-1')
+    cache.put(PROJECT, data)
+
+    assert cache.get(PROJECT, 'id', '1') is data
+    assert cache.get(PROJECT, 'LIMS', 'A-1') is data  # Scopes are case-insensitive
+    assert cache.get(PROJECT, 'lims', 'A-2') is None
+    assert cache.get(uuid4(), 'id', '1') is None  # Other projects are separate
+    assert cache.get(PROJECT, 'id', '1', accept=lambda d: d['type'] == 'material_spec') is None
+    assert (cache.stats.hits, cache.stats.misses) == (2, 3)
+    assert cache.stats.hit_rate == 0.4
+
+    cache.put(PROJECT, {'type': 'process_spec', 'uids': {}})  # Nothing to key it on
+    assert len(cache) == 2
+
+    with pytest.raises(ValueError):
+        ObjectCache(max_size=0)
+
+
+def test_lru_eviction():
+    cache = ObjectCache(max_size=2)
+    cache.put(PROJECT, spec('a', id='1'))
+    cache.put(PROJECT, spec('b', id='2'))
+    cache.get(PROJECT, 'id', '1')
+    cache.put(PROJECT, spec('c', id='3'))
+
+    assert cache.get(PROJECT, 'id', '2') is None
+    assert cache.get(PROJECT, 'id', '1')['name'] == 'a'
+    assert cache.get(PROJECT, 'id', '3')['name'] == 'c'
+    assert cache.stats.evictions == 1
+
+
+def test_ttl(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(object_cache, 'monotonic', lambda: now[0])
+    cache = ObjectCache(ttl=10)
+    cache.put(PROJECT, spec('a', id='1'))
+    now[0] = 9.0
+    assert cache.get(PROJECT, 'id', '1') is not None
+    now[0] = 10.0
+    assert cache.get(PROJECT, 'id', '1') is None
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+
+    cache = ObjectCache(ttl=None)
+    cache.put(PROJECT, spec('a', id='1'))
+    now[0] = 1e9
+    assert cache.get(PROJECT, 'id', '1') is not None
+
+
+def test_invalidation():
+    cache = ObjectCache()
+    cache.put(PROJECT, spec('a', id='1', lims='A-1'))
+    cache.put(PROJECT, spec('b', id='2'))
+
+    cache.invalidate(PROJECT, 'lims', 'A-1')
+    assert cache.get(PROJECT, 'id', '1') is None
+    cache.invalidate_all(PROJECT, [('id', '2'), ('id', '3')])
+    assert len(cache) == 0
+    assert cache.stats.invalidations == 2
+
+    # Storing a new version replaces every key of the old one
+    cache.put(PROJECT, spec('a', id='1', lims='A-1'))
+    cache.put(PROJECT, spec('a2', id='1'))
+    assert cache.get(PROJECT, 'lims', 'A-1') is None
+    assert cache.get(PROJECT, 'id', '1')['name'] == 'a2'
+
+    cache.clear()
+    assert len(cache) == 0
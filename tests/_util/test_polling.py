@@ -0,0 +1,54 @@
+import pytest
+
+from citrine._utils.polling import poll_as_completed
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.mark.parametrize('concurrency', [1, 4])
+def test_poll_as_completed(concurrency):
+    clock = Clock()
+    remaining = [3, 1, 2]
+    polled = []
+
+    def poll(position):
+        polled.append((clock.now, position))
+        remaining[position] -= 1
+        return remaining[position]
+
+    finished = poll_as_completed(3, poll, lambda position, left: None if left == 0 else 2.0,
+                                 first_delay=lambda position: position / 10, timeout=60,
+                                 concurrency=concurrency, timeout_error=RuntimeError,
+                                 clock=clock, sleep=clock.sleep)
+
+    assert list(finished) == [(1, 0), (2, 0), (0, 0)]
+    assert polled == [(0.0, 0), (0.1, 1), (0.2, 2), (2.0, 0), (2.2, 2), (4.0, 0)]
+
+
+def test_poll_as_completed_timeout():
+    clock = Clock()
+    polled = []
+
+    def poll(position):
+        polled.append((clock.now, position))
+        return position == 1
+
+    finished = poll_as_completed(4, poll, lambda position, done: None if done else 4.0,
+                                 first_delay=lambda position: 0.0, timeout=10, concurrency=1,
+                                 timeout_error=lambda running: KeyError(running),
+                                 clock=clock, sleep=clock.sleep)
+
+    assert next(finished) == (1, True)
+    with pytest.raises(KeyError, match=r'\[0, 2, 3\]'):
+        next(finished)
+    # The last poll of each is made at the deadline
+    assert [t for t, position in polled if position == 0] == [0.0, 4.0, 8.0, 10.0]
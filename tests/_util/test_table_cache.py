@@ -0,0 +1,55 @@
+import os
+from uuid import uuid4
+
+import pytest
+
+from citrine._utils.table_cache import TableCache
+
+
+def test_get_and_put(tmp_path):
+    cache = TableCache(str(tmp_path))
+    uid = uuid4()
+    assert cache.get(uid, 1) is None
+    cache.put(uid, 1, b'a,b\n')
+    assert cache.get(uid, 1) == b'a,b\n'
+    assert cache.get(str(uid), 1) == b'a,b\n'
+    assert cache.get(uid, 2) is None
+
+    # Another cache on the same directory (e.g., in another process) sees the same tables
+    assert TableCache(str(tmp_path)).get(uid, 1) == b'a,b\n'
+    assert not [name for name in os.listdir(str(tmp_path)) if name.startswith('.tmp-')]
+
+    cache.clear()
+    assert cache.get(uid, 1) is None
+    assert cache.size == 0
+
+
+def test_evicts_least_recently_read(tmp_path):
+    cache = TableCache(str(tmp_path / "tables"), max_size=35)
+    uids = [uuid4() for _ in range(3)]
+    for i, uid in enumerate(uids):
+        cache.put(uid, 1, b'x' * 10)
+        os.utime(cache._path(uid, 1), (i, i))
+    assert cache.get(uids[0], 1) is not None  # Now the most recently read
+
+    cache.put(uuid4(), 1, b'y' * 10)
+    assert cache.size == 30
+    assert cache.get(uids[0], 1) is not None
+    assert cache.get(uids[1], 1) is None
+    assert cache.get(uids[2], 1) is not None
+
+
+def test_failed_write_leaves_nothing(tmp_path, monkeypatch):
+    cache = TableCache(str(tmp_path))
+
+    def fail(src, dst):
+        raise OSError("disk full")
+    monkeypatch.setattr(os, 'replace', fail)
+    with pytest.raises(OSError):
+        cache.put(uuid4(), 1, b'a,b\n')
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        TableCache(max_size=0)
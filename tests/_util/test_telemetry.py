@@ -0,0 +1,58 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from citrine._utils.telemetry import RequestRecord, RequestTelemetry, current_tags, operation, \
+    tagged, template_path
+
+
+def test_template_path():
+    assert template_path('/projects/6b608f78-e341-422c-8076-35adc8828545/material-runs/id/'
+                         'A1B2C3D4-0000-4000-8000-000000000000') == \
+        'projects/{id}/material-runs/id/{id}'
+    assert template_path('projects/1/display-tables/2/versions/3') == \
+        'projects/{id}/display-tables/{id}/versions/{id}'
+    assert template_path('/material-runs/lims/ABC-1') == 'material-runs/lims/ABC-1'
+
+
+def test_operations():
+    assert current_tags() == ()
+    with operation('register_all'):
+        with operation('list'):
+            assert current_tags() == ('register_all', 'list')
+        # Other threads do not inherit operations unless they are passed along
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(current_tags).result() == ()
+            assert executor.submit(tagged('list', current_tags)).result() == \
+                ('register_all', 'list')
+    assert current_tags() == ()
+
+
+def test_aggregates():
+    records = []
+    telemetry = RequestTelemetry(listeners=[records.append])
+    telemetry.record(RequestRecord('GET', 'projects/{id}', status=200, latency=0.02,
+                                   bytes_received=100, tags=('list',)))
+    telemetry.record(RequestRecord('GET', 'projects/{id}', status=404, latency=0.2,
+                                   bytes_received=10, error='NotFound', tags=('list', 'list')))
+    telemetry.record(RequestRecord('PUT', 'projects/{id}/material-runs/batch', status=200,
+                                   latency=100.0, bytes_sent=5000, retries=2, token_refreshes=1,
+                                   tags=('register_all',)))
+    assert len(records) == 3
+
+    snapshot = telemetry.snapshot()
+    json.dumps(snapshot)  # Can be exported as is
+    assert snapshot['total']['count'] == 3
+    assert snapshot['total']['retries'] == 2
+    get = snapshot['endpoints']['GET projects/{id}']
+    assert (get['count'], get['errors'], get['bytes_received']) == (2, 1, 110)
+    assert get['statuses'] == {'200': 1, '404': 1}
+    assert get['latency_histogram']['0.025'] == 1
+    assert get['latency_histogram']['0.25'] == 1
+    assert snapshot['endpoints']['PUT projects/{id}/material-runs/batch']['latency_histogram'][
+        'inf'] == 1
+    # A request is counted once per operation, however deeply it is nested
+    assert snapshot['operations']['list']['count'] == 2
+    assert snapshot['operations']['register_all']['max_latency'] == 100.0
+
+    telemetry.reset()
+    assert telemetry.snapshot()['total']['count'] == 0
@@ -9,8 +9,11 @@ import time
 from citrine.informatics.executions.design_execution import DesignExecution
 from citrine.informatics.executions.predictor_evaluation_execution import (
     PredictorEvaluationExecution)
+from citrine._rest.asynchronous_object import AsynchronousObject
 from citrine.jobs.waiting import (
+    AsynchronousObjectMonitor,
     wait_for_asynchronous_object,
+    wait_for_asynchronous_objects,
     wait_while_executing,
     wait_while_validating,
     ConditionTimeoutError
@@ -89,3 +92,84 @@ def test_wait_for_asynchronous_object(sleep_mock, time_mock):
 
     assert str(exception.value) == ("Timeout of 1.0 seconds reached, "
         "but task 123456 is still in progress")
+
+
+class FakeAsyncObject(AsynchronousObject):
+    _in_progress_statuses = ['VALIDATING', 'INPROGRESS']
+
+    def __init__(self, uid, status):
+        self.uid = uid
+        self.status = status
+
+
+class ScriptedCollection:
+    """Returns each object with the next of its scripted statuses, and records the get times."""
+
+    def __init__(self, clock, statuses):
+        self.clock = clock
+        self.statuses = {uid: list(script) for uid, script in statuses.items()}
+        self.get_times = {uid: [] for uid in statuses}
+
+    def get(self, uid):
+        self.get_times[uid].append(self.clock[0])
+        script = self.statuses[uid]
+        status = script.pop(0) if len(script) > 1 else script[0]
+        return FakeAsyncObject(uid, status)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = [0.0]
+
+    def fake_sleep(seconds):
+        clock[0] += seconds
+    monkeypatch.setattr(time, 'time', lambda: clock[0])
+    monkeypatch.setattr(time, 'sleep', fake_sleep)
+    return clock
+
+
+def test_monitor_as_completed(clock):
+    predictors = ScriptedCollection(clock, {
+        'p1': ['VALIDATING'] * 4 + ['READY'],
+        'p2': ['VALIDATING', 'INVALID'],
+    })
+    executions = ScriptedCollection(clock, {
+        'e1': ['INPROGRESS', 'SUCCEEDED'],
+    })
+    monitor = AsynchronousObjectMonitor(
+        [(FakeAsyncObject('p1', 'VALIDATING'), predictors),
+         (FakeAsyncObject('p2', 'VALIDATING'), predictors)],
+        interval=2.0, max_interval=5.0)
+    monitor.add(FakeAsyncObject('e1', 'INPROGRESS'), executions)
+
+    finished = [(resource.uid, resource.status) for resource in monitor.as_completed()]
+
+    assert finished == [('p2', 'INVALID'), ('e1', 'SUCCEEDED'), ('p1', 'READY')]
+    # Each object is fetched once per poll, and the interval grows while the status is unchanged
+    assert predictors.get_times == {'p1': [0.0, 2.0, 5.0, 9.5, 14.5], 'p2': [0.0, 2.0]}
+    assert executions.get_times == {'e1': [0.0, 2.0]}
+
+
+def test_wait_for_asynchronous_objects(clock):
+    collection = ScriptedCollection(clock, {
+        'a': ['INPROGRESS', 'INPROGRESS', 'SUCCEEDED'],
+        'b': ['SUCCEEDED'],
+    })
+    resources = [(FakeAsyncObject(uid, 'INPROGRESS'), collection) for uid in ['a', 'b']]
+
+    finished = wait_for_asynchronous_objects(resources=resources, interval=1.0)
+
+    assert [(resource.uid, resource.status) for resource in finished] == \
+        [('a', 'SUCCEEDED'), ('b', 'SUCCEEDED')]
+
+
+def test_monitor_timeout(clock):
+    collection = ScriptedCollection(clock, {'stuck': ['INPROGRESS'], 'done': ['SUCCEEDED']})
+    monitor = AsynchronousObjectMonitor(
+        [(FakeAsyncObject(uid, 'INPROGRESS'), collection) for uid in ['stuck', 'done']],
+        timeout=10.0, interval=3.0)
+
+    with pytest.raises(ConditionTimeoutError, match='tasks stuck are still in progress'):
+        monitor.wait()
+    # The last inquiry is made at the deadline
+    assert collection.get_times['stuck'] == [0.0, 3.0, 7.5, 10.0]
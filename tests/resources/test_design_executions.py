@@ -113,3 +113,54 @@ def test_list(collection: DesignExecutionCollection, session):
 def test_delete(collection):
     with pytest.raises(NotImplementedError):
         collection.delete(uuid.uuid4())
+
+
+def test_candidates_table(workflow_execution: DesignExecution, session, example_candidates):
+    np = pytest.importorskip('numpy')
+    first, = example_candidates['response']
+    second = {
+        "material_id": str(uuid.uuid4()),
+        "identifiers": [],
+        "primary_score": -1.5,
+        "material": {'vars': {
+            'Temperature': {'type': 'R', 'm': 300.0, 's': 2.5},
+            'Flour': {'type': 'C', 'cp': {'wheat': 60.0, 'flour': 40.0}},
+            'Water': {'type': 'M', 'q': {'milk': 10.0}},
+        }}
+    }
+    session.set_responses({'response': [first, second]}, {'response': []})
+
+    table = workflow_execution.candidates_table(per_page=2)
+
+    assert session.calls[0].params == {'per_page': 2}
+    assert list(table) == [
+        'material_id', 'rank', 'primary_score', 'Temperature~mean', 'Temperature~std',
+        'Flour~flour', 'Water~water', 'Salt', 'Yeast', 'Flour~wheat', 'Water~milk'
+    ]
+    assert list(table['material_id']) == [first['material_id'], second['material_id']]
+    assert list(table['rank']) == [1, 2]
+    assert table['Temperature~mean'].dtype == np.float64
+    assert list(table['Temperature~std']) == [0.0, 2.5]
+    assert list(table['Flour~flour']) == [100.0, 40.0]
+    assert np.isnan(table['Flour~wheat'][0])
+    assert list(table['Water~water']) == [72.5, 0.0]
+    assert list(table['Salt']) == ['NaCl', None]
+
+
+def test_candidates_table_as_data_frame(workflow_execution: DesignExecution, session, example_candidates):
+    pytest.importorskip('pandas')
+    session.set_responses(example_candidates, {'response': []})
+
+    df = workflow_execution.candidates_table(as_data_frame=True)
+
+    assert df.shape == (1, 9)
+    assert df['Temperature~mean'][0] == 475.8
+
+
+def test_candidates_table_bad_type(workflow_execution: DesignExecution, session, example_candidates):
+    pytest.importorskip('numpy')
+    example_candidates['response'][0]['material']['vars']['Temperature']['type'] = 'X'
+    session.set_response(example_candidates)
+
+    with pytest.raises(ValueError):
+        workflow_execution.candidates_table()
@@ -1,15 +1,19 @@
+import hashlib
+import os
 from collections import namedtuple
 from uuid import uuid4
 
 import pytest
 import requests_mock
 from botocore.exceptions import ClientError
+from requests.exceptions import HTTPError
+from citrine.resources import file_link
 from citrine.resources.file_link import FileCollection, FileLink, _Uploader, \
     FileProcessingType
-from mock import patch, Mock, call
+from mock import patch, Mock
 
 from tests.utils.factories import FileLinkDataFactory, _UploaderFactory
-from tests.utils.session import FakeSession, FakeS3Client, FakeCall
+from tests.utils.session import FakeSession, FakeS3Client, FakeCall, FakeMultipartS3Client
 
 
 @pytest.fixture
@@ -153,6 +157,70 @@ def test_upload(mock_isfile, mock_stat, mock_open, mock_boto3_client, collection
     assert session.num_calls == 2 * len(dest_names)
 
 
+@pytest.fixture
+def multipart_file(tmp_path, monkeypatch):
+    """A file of 3.5 parts, with parts small enough for a test."""
+    monkeypatch.setattr(file_link, '_MIN_PART_SIZE', 4)
+    monkeypatch.setattr(file_link, '_PART_RETRY_DELAY', 0)
+    path = tmp_path / 'spectrum.dat'
+    path.write_bytes(b'0123456789abcd')
+    return str(path)
+
+
+def upload_responses(upload_id='111'):
+    uploads_response = {
+        's3_region': 'us-east-1',
+        's3_bucket': 'temp-bucket',
+        'temporary_credentials': {
+            'access_key_id': '1234',
+            'secret_access_key': 'abbb8777',
+            'session_token': 'hefheuhuhhu83772333',
+        },
+        'uploads': [{'s3_key': '66377378', 'upload_id': upload_id}]
+    }
+    file_info_response = {'file_info': {'file_id': '12345', 'version': '2'}}
+    return uploads_response, file_info_response
+
+
+def test_multipart_upload(collection, session, multipart_file):
+    """Large files are uploaded in parts, retrying parts that fail."""
+    s3_client = FakeMultipartS3Client(failures={2: 2})
+    session.set_responses(*upload_responses())
+    with patch('citrine.resources.file_link.boto3_client', return_value=s3_client):
+        file_link = collection.upload(file_path=multipart_file, part_size=4, concurrency=2)
+
+    assert file_link.filename == 'spectrum.dat'
+    assert s3_client.completed == b'0123456789abcd'
+    assert s3_client.created[0]['Metadata'] == {"X-Citrine-Upload-Id": '111'}
+    assert session.last_call.json == {'s3_version': '7'}
+
+    with pytest.raises(ValueError):
+        collection.upload(file_path=multipart_file, part_size=1)
+
+
+@pytest.mark.parametrize('failure, error', [(10, RuntimeError),
+                                            (OSError('disk'), OSError),
+                                            (KeyboardInterrupt(), KeyboardInterrupt)])
+def test_multipart_upload_aborts(collection, session, multipart_file, failure, error):
+    """However a multipart upload fails, the parts that were stored are discarded."""
+    s3_client = FakeMultipartS3Client(failures={3: failure})
+    session.set_responses(*upload_responses())
+    with patch('citrine.resources.file_link.boto3_client', return_value=s3_client):
+        with pytest.raises(error):
+            collection.upload(file_path=multipart_file, part_size=4, concurrency=1)
+        assert s3_client.aborted == ['multipart-1']
+        assert s3_client.parts == {}
+        assert session.num_calls == 1
+
+        # Uploading again starts from the beginning
+        s3_client.failures = {}
+        session.set_responses(*upload_responses('222'))
+        collection.upload(file_path=multipart_file, part_size=4)
+        assert set(s3_client.parts) == {('multipart-2', n) for n in range(1, 5)}
+        assert s3_client.completed == b'0123456789abcd'
+        assert session.last_call.path.endswith('/uploads/222/complete')
+
+
 def test_upload_missing_file(collection):
     with pytest.raises(ValueError):
         collection.upload(file_path='this-file-does-not-exist.xls')
@@ -345,8 +413,7 @@ def test_list_file_links(collection, session, valid_data):
         [file for file in files_iterator]
 
 
-@patch("citrine.resources.file_link.write_file_locally")
-def test_file_download(mock_write_file_locally, collection, session):
+def test_file_download(collection, session, tmp_path):
     """
     Test that downloading a file works as expected.
 
@@ -361,7 +428,7 @@ def test_file_download(mock_write_file_locally, collection, session):
     session.set_response({
         'pre_signed_read_link': pre_signed_url,
     })
-    local_path = 'Users/me/some/new/directory/'
+    local_path = str(tmp_path / 'Users/me/some/new/directory') + '/'
 
     with requests_mock.mock() as mock_get:
         mock_get.get(pre_signed_url, text='0101001')
@@ -376,8 +443,143 @@ def test_file_download(mock_write_file_locally, collection, session):
             path=url + '/content-link'
         )
         assert expected_call == session.last_call
-        assert mock_write_file_locally.call_count == 1
-        assert mock_write_file_locally.call_args == call(b'0101001', local_path + file.filename)
+        with open(local_path + file.filename, 'rb') as f:
+            assert f.read() == b'0101001'
+        assert not os.path.exists(local_path + file.filename + '.part')
+
+
+def ranged_content(content: bytes, failures=(), etag='"v1"'):
+    """
+    A requests_mock callback that serves byte ranges, failing the first request for some.
+
+    A failure is a status of 500, or the exception in `failures` for that range.
+    """
+    failures = dict(failures) if isinstance(failures, dict) else dict.fromkeys(failures)
+
+    def callback(request, context):
+        context.headers['ETag'] = etag
+        if 'Range' not in request.headers or request.headers.get('If-Range', etag) != etag:
+            context.status_code = 200
+            return content
+        first, _, last = request.headers['Range'][len('bytes='):].partition('-')
+        first, last = int(first), int(last or len(content) - 1)
+        if first in failures:
+            error = failures.pop(first)
+            if error is not None:
+                raise error
+            context.status_code = 500
+            return b''
+        context.status_code = 206
+        context.headers['Content-Range'] = 'bytes {}-{}/{}'.format(first, last, len(content))
+        return content[first:last + 1]
+    return callback
+
+
+def test_file_download_ranges(collection, session, tmp_path):
+    """Large files are downloaded as several ranges, and failed downloads can be resumed."""
+    content = b'0123456789'
+    pre_signed_url = "http://files.citrine.io/secret-codes/jiifema987pjfsda"
+    file = FileLink.build(FileLinkDataFactory(filename='spectrum.dat'))
+    local_path = str(tmp_path / 'spectrum.dat')
+
+    with requests_mock.mock() as mock_get:
+        mock_get.get(pre_signed_url, content=ranged_content(content))
+        session.set_response({'pre_signed_read_link': pre_signed_url})
+        collection.download(file_link=file, local_path=local_path, part_size=3, concurrency=3)
+        with open(local_path, 'rb') as f:
+            assert f.read() == content
+        assert sorted(r.headers['Range'] for r in mock_get.request_history) == \
+            ['bytes=0-2', 'bytes=3-5', 'bytes=6-8', 'bytes=9-9']
+
+    os.remove(local_path)
+    with requests_mock.mock() as mock_get:
+        mock_get.get(pre_signed_url, content=ranged_content(content, failures=[6]))
+        session.set_response({'pre_signed_read_link': pre_signed_url})
+        with pytest.raises(HTTPError):
+            collection.download(file_link=file, local_path=local_path, part_size=3, concurrency=3)
+        # Only the ranges before the failure are kept
+        with open(local_path + '.part', 'rb') as f:
+            assert f.read() == content[:6]
+
+        mock_get.reset_mock()
+        session.set_response({'pre_signed_read_link': pre_signed_url})
+        collection.download(file_link=file, local_path=local_path, part_size=3, concurrency=3,
+                            resume=True)
+        with open(local_path, 'rb') as f:
+            assert f.read() == content
+        assert sorted(r.headers['Range'] for r in mock_get.request_history) == \
+            ['bytes=6-8', 'bytes=9-9']
+        assert {r.headers['If-Range'] for r in mock_get.request_history} == {'"v1"'}
+        assert os.listdir(str(tmp_path)) == ['spectrum.dat']
+
+        # A single stream picks up from the partial file too
+        with open(local_path + '.part', 'wb') as f:
+            f.write(content[:4])
+        with open(local_path + '.part.etag', 'w') as f:
+            f.write('"v1"')
+        mock_get.reset_mock()
+        session.set_response({'pre_signed_read_link': pre_signed_url})
+        collection.download(file_link=file, local_path=local_path, concurrency=1, resume=True)
+        with open(local_path, 'rb') as f:
+            assert f.read() == content
+        assert [r.headers['Range'] for r in mock_get.request_history] == ['bytes=4-']
+
+
+def test_file_download_interrupted(collection, session, tmp_path):
+    """However a download stops, the partial file only holds a prefix of the file."""
+    content = b'0123456789'
+    pre_signed_url = "http://files.citrine.io/secret-codes/jiifema987pjfsda"
+    file = FileLink.build(FileLinkDataFactory(filename='spectrum.dat'))
+    local_path = str(tmp_path / 'spectrum.dat')
+
+    with requests_mock.mock() as mock_get:
+        mock_get.get(pre_signed_url,
+                     content=ranged_content(content, failures={9: KeyboardInterrupt()}))
+        session.set_response({'pre_signed_read_link': pre_signed_url})
+        with pytest.raises(KeyboardInterrupt):
+            collection.download(file_link=file, local_path=local_path, part_size=3, concurrency=3)
+        with open(local_path + '.part', 'rb') as f:
+            assert f.read() == content[:9]
+
+        # The file changed since, so it is downloaded again as a whole
+        changed = b'abcdefghijklmnop'
+        mock_get.get(pre_signed_url, content=ranged_content(changed, etag='"v2"'))
+        session.set_response({'pre_signed_read_link': pre_signed_url})
+        collection.download(file_link=file, local_path=local_path, part_size=3, concurrency=3,
+                            resume=True)
+        with open(local_path, 'rb') as f:
+            assert f.read() == changed
+        assert mock_get.last_request.headers['If-Range'] == '"v1"'
+
+        # A partial file without an ETag cannot be checked, so it is not resumed
+        with open(local_path + '.part', 'wb') as f:
+            f.write(b'xyz')
+        mock_get.reset_mock()
+        session.set_response({'pre_signed_read_link': pre_signed_url})
+        collection.download(file_link=file, local_path=local_path, concurrency=1, resume=True)
+        with open(local_path, 'rb') as f:
+            assert f.read() == changed
+        assert 'Range' not in mock_get.last_request.headers
+
+
+def test_file_download_checksum(collection, session, tmp_path):
+    pre_signed_url = "http://files.citrine.io/secret-codes/jiifema987pjfsda"
+    file = FileLink.build(FileLinkDataFactory(filename='spectrum.dat'))
+    local_path = str(tmp_path / 'spectrum.dat')
+
+    with requests_mock.mock() as mock_get:
+        mock_get.get(pre_signed_url, content=b'0101001')
+        session.set_response({'pre_signed_read_link': pre_signed_url})
+        collection.download(file_link=file, local_path=local_path,
+                            checksum=hashlib.md5(b'0101001').hexdigest(), checksum_algorithm='md5')
+        assert os.path.isfile(local_path)
+        os.remove(local_path)
+
+        session.set_response({'pre_signed_read_link': pre_signed_url})
+        with pytest.raises(RuntimeError):
+            collection.download(file_link=file, local_path=local_path, checksum='0' * 64)
+        assert not os.path.exists(local_path)
+        assert not os.path.exists(local_path + '.part')
 
 
 def test_process_file(collection, session):
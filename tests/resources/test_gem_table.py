@@ -3,9 +3,13 @@ from uuid import UUID, uuid4
 
 import pytest
 import requests_mock
+from gemd.entity.link_by_uid import LinkByUID
 from mock import patch, call
 
+from citrine._utils.table_cache import TableCache
 from citrine.exceptions import JobFailureError, PollingTimeoutError
+from citrine.gemtables.columns import IdentityColumn, MeanColumn, StdDevColumn
+from citrine.gemtables.variables import TerminalMaterialIdentifier, AttributeByTemplate
 from citrine.resources.table_config import TableConfig
 from citrine.resources.gemtables import GemTableCollection, GemTable
 from tests.utils.factories import GemTableDataFactory, ListGemTableVersionsDataFactory
@@ -293,6 +297,98 @@ def test_read_table_into_memory_from_collection(table, session, collection):
         assert returned == content
 
 
+def test_read_table_through_cache(table, session, collection, tmp_path):
+    session.table_cache = TableCache(str(tmp_path / "cache"))
+    remote_url = "http://otherhost:4572/anywhere"
+    retrieved_table = table(remote_url)
+    with requests_mock.mock() as mock_get:
+        mock_get.get(remote_url, text='a,b\n1,2\n')
+        assert collection.read_to_memory(retrieved_table) == 'a,b\n1,2\n'
+        collection.read(table=retrieved_table, local_path=str(tmp_path / "out" / "table.csv"))
+        assert collection.read_to_memory(retrieved_table) == 'a,b\n1,2\n'
+        assert mock_get.call_count == 1
+    assert (tmp_path / "out" / "table.csv").read_bytes() == b'a,b\n1,2\n'
+
+    # Another version of the same table is a different entry, and failed downloads are not kept
+    other_version = GemTable.build(dict(retrieved_table.dump(), version=3))
+    with requests_mock.mock() as mock_get:
+        mock_get.get(remote_url, status_code=403, text='denied')
+        collection.read_to_memory(other_version)
+        collection.read_to_memory(other_version)
+        assert mock_get.call_count == 2
+
+
+@pytest.fixture
+def typed_config():
+    return TableConfig(
+        name='foo', description='bar', datasets=[], rows=[],
+        variables=[TerminalMaterialIdentifier(name='name', headers=['name'], scope='id'),
+                   AttributeByTemplate(name='density', headers=['density'],
+                                       template=LinkByUID(scope='templates', id='density'))],
+        columns=[IdentityColumn(data_source='name'), MeanColumn(data_source='density'),
+                 StdDevColumn(data_source='density')]
+    )
+
+
+TYPED_CSV = 'name~id,density~Mean (g/cc),density~Std (g/cc)\n' \
+            'a,1.5,0.1\n' \
+            '"b, with a\nnewline",2,\n' \
+            ',3e-1,0\n'
+
+
+def test_read_batches(table, collection, typed_config):
+    remote_url = "http://otherhost:4572/anywhere"
+    with requests_mock.mock() as mock_get:
+        mock_get.get(remote_url, text=TYPED_CSV)
+        batches = list(collection.read_batches(table(remote_url), batch_size=2,
+                                               config=typed_config))
+    assert batches == [
+        [{'name~id': 'a', 'density~Mean (g/cc)': 1.5, 'density~Std (g/cc)': 0.1},
+         {'name~id': 'b, with a\nnewline', 'density~Mean (g/cc)': 2.0, 'density~Std (g/cc)': None}],
+        [{'name~id': None, 'density~Mean (g/cc)': 0.3, 'density~Std (g/cc)': 0.0}],
+    ]
+
+    # Without a matching config, everything is text
+    with requests_mock.mock() as mock_get:
+        mock_get.get(remote_url, text=TYPED_CSV)
+        typed_config.columns = typed_config.columns[:2]
+        rows, = collection.read_batches(table(remote_url), config=typed_config)
+    assert rows[0]['density~Mean (g/cc)'] == '1.5'
+
+    with requests_mock.mock() as mock_get:
+        mock_get.get(remote_url, text='')
+        assert list(collection.read_batches(table(remote_url), config=typed_config)) == []
+
+    with pytest.raises(ValueError):
+        next(collection.read_batches(table(remote_url), batch_size=0))
+
+
+def test_read_batches_as_data_frame(table, collection, session, typed_config, tmp_path):
+    pd = pytest.importorskip('pandas')
+    session.table_cache = TableCache(str(tmp_path))
+    remote_url = "http://otherhost:4572/anywhere"
+    cached_table = table(remote_url)
+    with requests_mock.mock() as mock_get:
+        mock_get.get(remote_url, text=TYPED_CSV)
+        for _ in range(2):
+            first, second = collection.read_batches(cached_table, batch_size=2,
+                                                    as_data_frame=True, config=typed_config)
+        assert mock_get.call_count == 1
+
+    assert list(first.dtypes) == [object, 'float64', 'float64']
+    assert first['density~Mean (g/cc)'].tolist() == [1.5, 2.0]
+    assert pd.isna(first['density~Std (g/cc)'][1])
+    assert second['name~id'].tolist() == [None]
+
+
+def test_read_batches_bad_value(table, collection, typed_config):
+    remote_url = "http://otherhost:4572/anywhere"
+    with requests_mock.mock() as mock_get:
+        mock_get.get(remote_url, text='name~id,density~Mean,density~Std\na,heavy,0\n')
+        with pytest.raises(ValueError, match='line 2'):
+            list(collection.read_batches(table(remote_url), config=typed_config))
+
+
 def test_gem_table_entity_dict():
     table = GemTable.build(GemTableDataFactory())
     entity = table.access_control_dict()
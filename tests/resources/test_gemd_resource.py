@@ -1,3 +1,4 @@
+import json
 import random
 from uuid import uuid4, UUID
 from os.path import basename
@@ -5,11 +6,13 @@ from os.path import basename
 import pytest
 
 from gemd.entity.bounds.integer_bounds import IntegerBounds
+from gemd.entity.attribute import Property, PropertyAndConditions
 from gemd.entity.link_by_uid import LinkByUID
 from gemd.entity.object.material_spec import MaterialSpec as GemdMaterialSpec
 from gemd.entity.object.process_spec import ProcessSpec as GemdProcessSpec
 
-from citrine.exceptions import PollingTimeoutError, JobFailureError, NotFound
+from citrine.exceptions import PollingTimeoutError, JobFailureError, NotFound, PayloadTooLarge
+from citrine.resources import gemd_resource
 from citrine.resources.api_error import ApiError, ValidationError
 from citrine.resources.condition_template import ConditionTemplateCollection, ConditionTemplate
 from citrine.resources.data_concepts import DataConcepts
@@ -29,6 +32,7 @@ from citrine.resources.process_spec import ProcessSpecCollection, ProcessSpec
 from citrine.resources.process_template import ProcessTemplateCollection, ProcessTemplate
 from citrine.resources.property_template import PropertyTemplateCollection, PropertyTemplate
 from citrine._utils.functions import format_escaped_url
+from citrine._utils.object_cache import ObjectCache
 
 from tests.utils.factories import MaterialRunDataFactory, MaterialSpecDataFactory
 from tests.utils.factories import JobSubmissionResponseFactory
@@ -86,6 +90,66 @@ def test_list(gemd_collection, session):
         assert samples[i]['uids']['id'] == gems[i].uids['id']
 
 
+def test_get_many(gemd_collection, session):
+    first, second = MaterialRunDataFactory(), MaterialSpecDataFactory()
+    missing = str(uuid4())
+    session.set_responses(second, NotFound("path"), first)
+
+    results = gemd_collection.get_many(
+        [second['uids']['id'], LinkByUID('id', missing), UUID(first['uids']['id']),
+         LinkByUID('ID', second['uids']['id'])],
+        concurrency=1)
+
+    # Each distinct object is fetched once, and results are in the order they were asked for
+    assert session.num_calls == 3
+    assert [call.path.rsplit('/', 1)[-1] for call in session.calls] == \
+        [second['uids']['id'], missing, first['uids']['id']]
+    assert isinstance(results[0], MaterialSpec) and isinstance(results[3], MaterialSpec)
+    assert results[0].uids == results[3].uids and results[0] is not results[3]
+    assert isinstance(results[1], NotFound)
+    assert isinstance(results[2], MaterialRun) and results[2].name == first['name']
+
+
+def test_get_many_concurrent(gemd_collection, session, monkeypatch):
+    samples = {sample['uids']['id']: sample for sample in sample_gems(20)}
+
+    def get_resource(path, **kwargs):
+        session.calls.append(FakeCall('GET', path))
+        uid = path.rsplit('/', 1)[-1]
+        if uid not in samples:
+            raise NotFound(path)
+        return samples[uid]
+    monkeypatch.setattr(session, 'get_resource', get_resource)
+
+    uids = list(samples) + [str(uuid4())]
+    results = gemd_collection.get_many(uids, concurrency=4)
+
+    assert session.num_calls == len(uids)
+    assert [result.uids['id'] for result in results[:-1]] == uids[:-1]
+    assert isinstance(results[-1], NotFound)
+
+    with pytest.raises(ValueError):
+        gemd_collection.get_many(uids, concurrency=0)
+
+
+def test_get_many_uses_object_cache(gemd_collection, session):
+    session.object_cache = ObjectCache()
+    dataset = str(gemd_collection.dataset_id)
+    cached = MaterialRunDataFactory(dataset=dataset)
+    fetched = MaterialRunDataFactory(dataset=dataset)
+    session.object_cache.put(gemd_collection.project_id, cached)
+    session.set_response(fetched)
+
+    results = gemd_collection.get_many([cached['uids']['id'], fetched['uids']['id']])
+
+    assert session.num_calls == 1
+    assert [result.uids for result in results] == [cached['uids'], fetched['uids']]
+    assert session.object_cache.get(gemd_collection.project_id, 'id',
+                                    fetched['uids']['id']) is not None
+    assert gemd_collection.get_many([fetched['uids']['id']]) == [results[1]]
+    assert session.num_calls == 1
+
+
 def test_register(gemd_collection):
     """Check that register routes to the correct collections"""
     expected = {
@@ -227,6 +291,179 @@ def test_register_all_object_update(gemd_collection):
     assert material.uids == registered_material.uids
 
 
+def test_register_all_concurrent(gemd_collection):
+    """Check that concurrent registration keeps the tier order, result order and uid write-back"""
+    bounds = IntegerBounds(0, 1)
+    templates = [PropertyTemplate("prop {}".format(i), bounds=bounds) for i in range(75)]
+    materials = [MaterialTemplate("mat {}".format(i), properties=[[templates[i % 75], bounds]])
+                 for i in range(120)]
+    models = materials + templates
+
+    registered = gemd_collection.register_all(models, concurrency=4)
+    assert [x.name for x in registered] == [x.name for x in templates + materials]
+    for prewrite, postwrite in zip(templates + materials, registered):
+        assert len(prewrite.uids) == 1
+        assert prewrite.uids == postwrite.uids
+
+    # Every property template batch is stored before any material template batch is sent
+    call_basenames = [call.path.split('/')[-2] for call in gemd_collection.session.calls]
+    assert call_basenames == ['property-templates'] * 2 + ['material-templates'] * 3
+
+
+def test_register_all_concurrent_failure(gemd_collection, session):
+    """A failed batch stops registration before the next tier"""
+    bounds = IntegerBounds(0, 1)
+    templates = [PropertyTemplate("prop {}".format(i), bounds=bounds) for i in range(75)]
+    materials = [MaterialTemplate("mat", properties=[[templates[0], bounds]])]
+    session.set_response(NotFound("path"))
+
+    with pytest.raises(NotFound):
+        gemd_collection.register_all(templates + materials, concurrency=2)
+    assert all(call.path.endswith('/property-templates/batch') for call in session.calls)
+
+    with pytest.raises(ValueError):
+        gemd_collection.register_all(templates, concurrency=0)
+
+
+def test_register_all_adaptive_batches(gemd_collection, session):
+    """Batches are capped by objects and bytes, and split when the server rejects them"""
+    bounds = IntegerBounds(0, 1)
+    templates = [PropertyTemplate("prop {}".format(i), bounds=bounds) for i in range(20)]
+
+    gemd_collection.register_all(templates, max_batch_objects=8)
+    assert [len(call.json['objects']) for call in session.calls] == [8, 8, 4]
+
+    session.calls.clear()
+    size = len(session.json_codec.dumps(templates[0].dump()))
+    gemd_collection.register_all(templates, max_batch_objects=100, max_batch_bytes=5 * size)
+    assert [len(call.json['objects']) for call in session.calls] == [5, 5, 5, 5]
+
+    session.calls.clear()
+    session.set_responses(PayloadTooLarge("path"), PayloadTooLarge("path"))
+    registered = gemd_collection.register_all(templates, max_batch_objects=100)
+    assert [len(call.json['objects']) for call in session.calls] == [20, 10, 5, 5, 10]
+    assert [x.name for x in registered] == [x.name for x in templates]
+
+    session.set_response(PayloadTooLarge("path"))
+    with pytest.raises(PayloadTooLarge):
+        gemd_collection.register_all(templates[:1])
+
+
+def test_register_all_slow_batches(gemd_collection, session, monkeypatch):
+    """Slow responses reduce the number of objects in later batches, even of the same type"""
+    bounds = IntegerBounds(0, 1)
+    properties = [PropertyTemplate("prop {}".format(i), bounds=bounds) for i in range(80)]
+    clock = iter(range(0, 1000, 30))  # Every batch takes 30 seconds
+    monkeypatch.setattr(gemd_resource, 'monotonic', lambda: next(clock))
+
+    gemd_collection.register_all(properties, max_batch_objects=40)
+    assert [len(call.json['objects']) for call in session.calls] == [40, 20, 10, 5, 2, 1, 1, 1]
+
+    session.calls.clear()
+    gemd_collection.register_all(properties, max_batch_objects=40, target_batch_latency=60)
+    assert [len(call.json['objects']) for call in session.calls] == [40, 40]
+
+
+def test_register_all_concurrent_slow_batches(gemd_collection, session, monkeypatch):
+    """With concurrency, only the first batches of a tier are cut before any are measured"""
+    bounds = IntegerBounds(0, 1)
+    properties = [PropertyTemplate("prop {}".format(i), bounds=bounds) for i in range(200)]
+    clock = iter(range(0, 100000, 30))
+    monkeypatch.setattr(gemd_resource, 'monotonic', lambda: next(clock))
+
+    registered = gemd_collection.register_all(properties, max_batch_objects=40, concurrency=2)
+    # Requests may be sent out of order, and the second batch may be cut after the first
+    # is measured
+    sizes = sorted((len(call.json['objects']) for call in session.calls), reverse=True)
+    assert sizes[0] == 40 and sizes[2] <= 20 and sum(sizes) == 200
+    assert [x.name for x in registered] == [x.name for x in properties]
+
+
+def test_register_stream_resolves_links_first(gemd_collection, session):
+    """Objects are held back until the objects they link to have been written"""
+    process_template = ProcessTemplate("pt")
+    process_spec = ProcessSpec("ps", template=process_template)
+    material_spec = MaterialSpec("ms", process=process_spec)
+    process_run = ProcessRun("pr", spec=process_spec)
+    material_run = MaterialRun("mr", spec=material_spec, process=process_run)
+
+    stream = [material_run, process_run, material_spec, process_spec, process_template]
+    registered = list(gemd_collection.register_stream(stream, batch_size=1))
+    assert [x.name for x in registered] == ["pt", "ps", "pr", "ms", "mr"]
+    for obj in stream:
+        assert len(obj.uids) == 1
+    assert [call.path.split('/')[-2] for call in session.calls] == [
+        'process-templates', 'process-specs', 'process-runs', 'material-specs', 'material-runs']
+
+
+def test_register_stream_is_incremental(gemd_collection, session):
+    """Batches are written while the stream is still being read"""
+    template = PropertyTemplate("prop", bounds=IntegerBounds(0, 1))
+    template.uids = {'id': str(uuid4())}  # Already registered
+    reads_at_write = []
+
+    def stream():
+        for i in range(30):
+            spec = ProcessSpec("spec {}".format(i))
+            yield MaterialSpec("material {}".format(i), process=spec,
+                               properties=[PropertyAndConditions(Property("prop", template=template))])
+            yield spec
+            reads_at_write.append(session.num_calls)
+
+    registered = list(gemd_collection.register_stream(stream(), batch_size=10))
+    assert len(registered) == 60
+    assert [len(call.json['objects']) for call in session.calls] == [10] * 6
+    # Writing started after the first 10 pairs were read, not after all 30
+    assert reads_at_write[8] == 0
+    assert reads_at_write[9] == 2
+    # Links to an object that was already registered do not hold anything back
+    assert all(call.path.split('/')[-2] != 'property-templates' for call in session.calls)
+
+
+def test_register_stream_flushes_partial_batches(gemd_collection, session):
+    """Partial batches are written when too many objects are pending, or at the end"""
+    specs = [ProcessSpec("spec {}".format(i)) for i in range(5)]
+    materials = [MaterialSpec("material {}".format(i), process=spec) for i, spec in enumerate(specs)]
+
+    list(gemd_collection.register_stream(specs + materials, batch_size=50, max_pending=2))
+    assert [len(call.json['objects']) for call in session.calls] == [3, 2, 1, 3, 1]
+
+    # A link to an object that never arrives is written as by register_all
+    session.calls.clear()
+    orphan = MaterialSpec("orphan", process=ProcessSpec("missing"))
+    registered = list(gemd_collection.register_stream([orphan, specs[0]]))
+    assert [x.name for x in registered] == ["spec 0", "orphan"]
+
+
+def test_register_stream_releases_links_to_objects_with_uids(gemd_collection, session):
+    """Past max_pending, links to unread objects that have uids stop holding objects back"""
+    process = ProcessSpec("process", uids={'lims': 'P-1'})  # Stored, but not in the stream
+    pending_at_write = []
+
+    def stream():
+        for i in range(20):
+            yield MaterialSpec("material {}".format(i), process=process)
+            pending_at_write.append(session.num_calls)
+
+    registered = list(gemd_collection.register_stream(stream(), batch_size=50, max_pending=5))
+    assert len(registered) == 20
+    assert pending_at_write[4] == 0 and pending_at_write[5] == 1  # Written before the end
+    assert all(call.path.split('/')[-2] == 'material-specs' for call in session.calls)
+    assert process.uids == {'lims': 'P-1'}
+
+
+def test_register_stream_does_not_assign_ids_to_unread_objects(gemd_collection, session):
+    """Writing an object does not make the objects it refers to look stored"""
+    process = ProcessRun("process")
+    ingredient = IngredientRun(process=process)
+    material = MaterialRun("material", process=process)
+    ingredient.material = material
+
+    stream = iter([process, ingredient, material])
+    registered = list(gemd_collection.register_stream(stream, batch_size=1))
+    assert [x.typ for x in registered] == ['process_run', 'material_run', 'ingredient_run']
+
+
 def test_delete(gemd_collection, session):
     """
     Check that delete routes to the correct collections
@@ -418,6 +655,21 @@ def test_batch_delete(gemd_collection, session):
     assert first_failure == (LinkByUID('somescope', 'abcd-1234'), expected_api_error)
 
 
+def test_batch_delete_invalidates_cache(gemd_collection, session):
+    session.object_cache = ObjectCache()
+    project_id = gemd_collection.project_id
+    spec = ProcessSpec("spec", uids={'id': str(uuid4()), 'lims': 'P-1'})
+    for data in [{'uids': {'id': 'a'}}, {'uids': {'id': 'b'}}, {'uids': dict(spec.uids)}]:
+        session.object_cache.put(project_id, data)
+
+    session.set_responses({'job_id': '1234'}, {'job_type': 'batch_delete', 'status': 'Success',
+                                               'tasks': [], 'output': {'failures': '[]'}})
+    gemd_collection.batch_delete(['a', spec])
+    assert session.object_cache.get(project_id, 'id', 'a') is None
+    assert session.object_cache.get(project_id, 'lims', 'P-1') is None
+    assert session.object_cache.get(project_id, 'id', 'b') is not None
+
+
 def test_batch_delete_bad_input(gemd_collection):
     with pytest.raises(TypeError):
         gemd_collection.batch_delete([False])
@@ -1,7 +1,10 @@
 import pytest
+from threading import Lock
 from uuid import UUID
 
-from citrine.jobs.job import TaskNode, JobStatusResponse, JobSubmissionResponse
+from citrine.exceptions import JobFailureError, PollingTimeoutError
+from citrine.jobs import job as job_module
+from citrine.jobs.job import TaskNode, JobStatusResponse, JobSubmissionResponse, JobGroup
 import citrine.resources.job as oldjobs
 from citrine.resources.gemtables import GemTableCollection
 from citrine.resources.project import Project
@@ -97,4 +100,91 @@ def test_build_job(collection: GemTableCollection, table_config: TableConfig):
 
 def test_renamed_classes_are_the_same():
     # Mostly make code coverage happy
-    assert oldjobs.JobSubmissionResponse == JobSubmissionResponse
\ No newline at end of file
+    assert oldjobs.JobSubmissionResponse == JobSubmissionResponse
+
+class JobStatusSession:
+    """Reports each job as running until it has been polled `polls[job_id]` times."""
+
+    def __init__(self, clock, polls, failures=()):
+        self.clock = clock
+        self.polls = polls
+        self.failures = set(failures)
+        self.poll_times = {job_id: [] for job_id in polls}
+        self.lock = Lock()
+
+    def ensure_pool_size(self, connections):
+        pass
+
+    def get_resource(self, path, params):
+        job_id = params['job_id']
+        with self.lock:
+            self.poll_times[job_id].append(self.clock[0])
+            done = len(self.poll_times[job_id]) >= self.polls[job_id]
+        if not done:
+            status = 'Running'
+        else:
+            status = 'Failure' if job_id in self.failures else 'Success'
+        return {'job_type': 'dave_job_type', 'status': status, 'tasks': []}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A fake clock that sleep advances, with the jitter taken out of the polling delays."""
+    clock = [0.0]
+
+    def fake_sleep(seconds):
+        clock[0] += seconds
+    monkeypatch.setattr(job_module, 'monotonic', lambda: clock[0])
+    monkeypatch.setattr(job_module, 'sleep', fake_sleep)
+    monkeypatch.setattr(job_module.random, 'uniform', lambda a, b: b)
+    return clock
+
+
+def test_job_group_as_completed(clock):
+    session = JobStatusSession(clock, {'a': 3, 'b': 1, 'c': 2}, failures=['c'])
+    group = JobGroup(session, 'project', ['a', 'b'], max_delay=10)
+    group.add('c')
+
+    finished = [(job_id, status.status) for job_id, status in group.as_completed()]
+
+    assert finished == [('b', 'Success'), ('c', 'Failure'), ('a', 'Success')]
+    # Each job backs off exponentially, from the initial delay
+    assert session.poll_times == {'a': [1.0, 2.0, 4.0], 'b': [1.0], 'c': [1.0, 2.0]}
+
+    submission = JobSubmissionResponse.build({'job_id': '12345678-1234-1234-1234-123456789ccc'})
+    assert JobGroup(session, 'project', [submission]).job_ids == [submission.job_id]
+
+    with pytest.raises(JobFailureError):
+        JobGroup(session, 'project', ['c'], concurrency=1).wait()
+    session.poll_times = {job_id: [] for job_id in session.polls}
+    statuses = JobGroup(session, 'project', ['a', 'b'], concurrency=1).wait()
+    assert [status.status for status in statuses] == ['Success', 'Success']
+
+
+def test_job_group_timeout(clock):
+    session = JobStatusSession(clock, {'done': 1, 'stuck': 100})
+    group = JobGroup(session, 'project', ['stuck', 'done'], timeout=5, concurrency=1)
+
+    finished = []
+    with pytest.raises(PollingTimeoutError, match='stuck'):
+        for job_id, _ in group.as_completed():
+            finished.append(job_id)
+
+    assert finished == ['done']
+    # The last poll is made at the deadline
+    assert session.poll_times['stuck'] == [1.0, 2.0, 4.0, 5.0]
+
+
+def test_get_by_build_jobs(collection: GemTableCollection, session, clock):
+    table_id = '12345678-1234-1234-1234-123456789aaa'
+    session.set_responses(
+        {'job_type': 'foo', 'status': 'In Progress', 'tasks': []},
+        {'job_type': 'foo', 'status': 'Success', 'tasks': [],
+         'output': {'display_table_id': table_id, 'display_table_version': '2'}},
+        {'id': table_id, 'version': 2, 'signed_download_url': 'https://example.com/table.csv'},
+    )
+
+    tables = list(collection.get_by_build_jobs(['12345678-1234-1234-1234-123456789ccc']))
+
+    assert [(str(table.uid), table.version) for table in tables] == [(table_id, 2)]
+    assert session.num_calls == 3
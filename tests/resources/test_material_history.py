@@ -0,0 +1,151 @@
+import json
+from uuid import uuid4
+
+import pytest
+from gemd.entity.attribute import Property
+from gemd.entity.bounds import RealBounds
+from gemd.entity.link_by_uid import LinkByUID
+from gemd.entity.value import NominalReal
+from gemd.json import GEMDEncoder
+from gemd.util import writable_sort_order
+
+from citrine.resources.ingredient_run import IngredientRun
+from citrine.resources.material_history import MaterialHistory
+from citrine.resources.material_run import MaterialRun
+from citrine.resources.material_spec import MaterialSpec
+from citrine.resources.measurement_run import MeasurementRun
+from citrine.resources.process_run import ProcessRun
+from citrine.resources.process_spec import ProcessSpec
+from citrine.resources.property_template import PropertyTemplate
+
+
+def _uids():
+    return {'id': str(uuid4())}
+
+
+def _material(name, ingredients=(), spec=None):
+    process = ProcessRun(name, uids=_uids())
+    material = MaterialRun(name, uids=_uids(), process=process, spec=spec)
+    for ingredient in ingredients:
+        IngredientRun(uids=_uids(), material=ingredient, process=process)
+    return material
+
+
+@pytest.fixture
+def history_data():
+    """The material-history response for a cake made from batter, made from flour and eggs."""
+    density = PropertyTemplate('density', bounds=RealBounds(0, 10, 'g/cm^3'), uids=_uids())
+    spec = MaterialSpec('cake', uids=_uids(), process=ProcessSpec('bake', uids=_uids()))
+    flour, eggs = _material('flour'), _material('eggs')
+    batter = _material('batter', [flour, eggs])
+    cake = _material('cake', [batter], spec=spec)
+    MeasurementRun('weigh', uids=_uids(), material=cake,
+                   properties=[Property('density', template=density,
+                                        value=NominalReal(1.1, 'g/cm^3'))])
+    blob = json.loads(MaterialRun.get_json_support().dumps(cake))
+    root = next(x for x in blob['context'] if x['uids'] == cake.uids)
+    return {'root': root, 'context': [x for x in blob['context'] if x is not root]}
+
+
+def _legacy_history(data):
+    """How get_history assembled the history before MaterialHistory."""
+    blob = {
+        'context': sorted(data['context'] + [data['root']],
+                          key=lambda x: writable_sort_order(x['type'])),
+        'object': LinkByUID(*next(iter(data['root']['uids'].items())))
+    }
+    return MaterialRun.get_json_support().loads(json.dumps(blob, cls=GEMDEncoder, sort_keys=True))
+
+
+def _dumps(material):
+    return MaterialRun.get_json_support().dumps(material)
+
+
+def test_eager_history_matches_json_round_trip(history_data):
+    expected = _legacy_history(json.loads(json.dumps(history_data)))
+    snapshot = json.dumps(history_data)
+
+    cake = MaterialHistory(history_data, lazy=False).root
+
+    assert _dumps(cake) == _dumps(expected)
+    assert json.dumps(history_data) == snapshot  # The response is not modified
+    batter = cake.process.ingredients[0].material
+    assert {i.material.name for i in batter.process.ingredients} == {'flour', 'eggs'}
+    assert cake.measurements[0].properties[0].template.name == 'density'
+    assert cake.spec.process.name == 'bake'
+
+
+def test_lazy_history_builds_ancestors_when_asked(history_data):
+    history = MaterialHistory(history_data, lazy=True)
+
+    cake = history.root
+    assert history.root is cake
+    assert cake.spec.process.name == 'bake'
+    assert cake.measurements[0].name == 'weigh'
+    ingredient, = cake.process.ingredients
+    assert isinstance(ingredient.material, LinkByUID)
+    n_built = len(history._objects)
+
+    batter = history.get(ingredient.material)
+    assert ingredient.material is batter
+    assert batter.name == 'batter' and batter.process.output_material is batter
+    assert all(isinstance(i.material, LinkByUID) for i in batter.process.ingredients)
+    assert len(history._objects) > n_built
+
+    for i in batter.process.ingredients:
+        history.get(i.material)
+    assert _dumps(cake) == _dumps(_legacy_history(history_data))
+
+
+def test_history_get_unknown_object(history_data):
+    with pytest.raises(KeyError):
+        MaterialHistory(history_data).get(LinkByUID('id', str(uuid4())))
+
+
+def _chain_data(steps):
+    """The material-history response for a linear history of runs and specs, oldest first."""
+    def record(typ, name, **links):
+        uid = str(uuid4())
+        data = {'type': typ, 'name': name, 'uids': {'id': uid}}
+        data.update({field: {'type': 'link_by_uid', 'scope': 'id', 'id': target['uids']['id']}
+                     for field, target in links.items()})
+        return data
+
+    records = []
+    material_spec = material_run = None
+    for i in range(steps):
+        process_spec = record('process_spec', 'step {}'.format(i))
+        process_run = record('process_run', 'step {}'.format(i), spec=process_spec)
+        records += [process_spec, process_run]
+        if material_spec is not None:
+            ingredient_spec = record('ingredient_spec', 'step {}'.format(i - 1),
+                                     material=material_spec, process=process_spec)
+            records += [ingredient_spec,
+                        record('ingredient_run', 'step {}'.format(i - 1), spec=ingredient_spec,
+                               material=material_run, process=process_run)]
+        material_spec = record('material_spec', 'step {}'.format(i), process=process_spec)
+        material_run = record('material_run', 'step {}'.format(i), process=process_run,
+                              spec=material_spec)
+        records += [material_spec, material_run]
+    return {'root': records[-1], 'context': records[:-1]}
+
+
+@pytest.mark.parametrize('lazy', [True, False])
+def test_deep_history(lazy):
+    steps = 400
+    history = MaterialHistory(_chain_data(steps), lazy=lazy)
+
+    run = history.root
+    if lazy:
+        assert len(history._objects) < 10  # Neither ancestor runs nor specs are built
+    spec = run.spec
+    for _ in range(steps - 1):
+        ingredient, = run.process.ingredients
+        run = history.get(ingredient.material)
+        assert ingredient.material is run
+        ingredient, = spec.process.ingredients
+        spec = history.get(ingredient.material)
+        assert ingredient.material is spec
+        assert run.spec is spec
+    assert run.name == spec.name == 'step 0'
+    assert run.process.ingredients == [] and spec.process.ingredients == []
@@ -1,11 +1,14 @@
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 from citrine._session import Session
+from citrine._utils.object_cache import ObjectCache
 from citrine._utils.functions import scrub_none
 from citrine.exceptions import BadRequest
 from citrine.resources.api_error import ValidationError
+from citrine.resources.material_history import MaterialHistory
 from citrine.resources.material_run import MaterialRunCollection
+from citrine.resources.material_spec import MaterialSpecCollection
 from gemd.entity.bounds.integer_bounds import IntegerBounds
 from gemd.entity.object.material_run import MaterialRun as GEMDRun
 
@@ -104,6 +107,18 @@ def test_get_history(collection, session):
     assert 'Historic MR' == run.name
 
 
+def test_get_history_lazy(collection, session):
+    session.set_response({
+        'context': [],
+        'root': MaterialRunDataFactory(name='Historic MR')
+    })
+
+    history = collection.get_history(id='1234', lazy=True)
+
+    assert isinstance(history, MaterialHistory)
+    assert 'Historic MR' == history.root.name
+
+
 def test_get_material_run(collection, session):
     # Given
     run_data = MaterialRunDataFactory(name='Cake 2')
@@ -123,6 +138,69 @@ def test_get_material_run(collection, session):
     assert 'Cake 2' == run.name
 
 
+def test_get_material_run_cached(collection, session):
+    session.object_cache = ObjectCache()
+    run_data = MaterialRunDataFactory(name='Cake 2', dataset=str(collection.dataset_id))
+    mr_id = run_data['uids']['id']
+    session.set_response(run_data)
+
+    assert collection.get(mr_id).name == 'Cake 2'
+    assert collection.get(mr_id).name == 'Cake 2'
+    assert collection.get(LinkByUIDFactory(id=mr_id)).name == 'Cake 2'
+    assert 1 == session.num_calls
+    assert (session.object_cache.stats.hits, session.object_cache.stats.misses) == (2, 1)
+
+    # The cached object is not in a different dataset, or of a different type
+    other_dataset = MaterialRunCollection(collection.project_id, uuid4(), session)
+    other_dataset.get(mr_id)
+    MaterialSpecCollection(collection.project_id, collection.dataset_id, session).get(mr_id)
+    assert 3 == session.num_calls
+
+    # Deleting it drops it, and a dry run does not
+    collection.get(mr_id)
+    collection.delete(mr_id, dry_run=True)
+    collection.get(mr_id)
+    assert 4 == session.num_calls
+    collection.delete(mr_id)
+    session.set_response(run_data)
+    collection.get(mr_id)
+    assert 6 == session.num_calls
+
+
+def test_register_material_run_cached(collection, session):
+    session.object_cache = ObjectCache()
+    run = MaterialRunFactory(name='Cake')
+    session.set_response(MaterialRunDataFactory(name='Dry', dataset=str(collection.dataset_id),
+                                                uids={'id': str(uuid4())}))
+    collection.register(run, dry_run=True)
+    assert len(session.object_cache) == 0
+
+    responses = [MaterialRunDataFactory(dataset=str(collection.dataset_id)) for _ in range(2)]
+    session.set_response({'objects': responses})
+    collection.register_all([run, MaterialRunFactory()])
+    session.set_response({'contents': [MaterialRunDataFactory(dataset=str(collection.dataset_id))]})
+    listed, = collection.list()
+    assert len(session.object_cache) == 3
+
+    session.calls.clear()
+    for uid in [responses[0]['uids']['id'], responses[1]['uids']['id'], listed.uid]:
+        collection.get(uid)
+    assert session.num_calls == 0
+
+    # Updating an object replaces it
+    updated = collection.build(responses[0])
+    updated.name = 'Updated'
+    session.set_response(dict(responses[0], name='Updated'))
+    collection.update(updated)
+    assert collection.get(updated.uid).name == 'Updated'
+    assert session.num_calls == 1
+
+    # An asynchronous update drops it
+    session.set_response({'job_id': str(uuid4())})
+    collection.async_update(updated, wait_for_response=False)
+    assert session.object_cache.get(collection.project_id, 'id', updated.uid) is None
+
+
 def test_list_material_runs(collection, session):
     # Given
     sample_run = MaterialRunDataFactory()
@@ -0,0 +1,218 @@
+"""Test the AsyncCollection verbs against a fake asynchronous session."""
+from uuid import UUID, uuid4
+
+import pytest
+from gemd.entity.bounds.integer_bounds import IntegerBounds
+
+from citrine._async_session import AsyncSession
+from citrine._rest.async_collection import AsyncCollection
+from citrine._utils.object_cache import ObjectCache
+from citrine._utils.telemetry import current_tags
+from citrine.exceptions import NotFound, PollingTimeoutError, JobFailureError
+from citrine.resources.gemd_resource import GEMDResourceCollection
+from citrine.resources.file_link import FileCollection
+from citrine.resources.material_run import MaterialRunCollection
+from citrine.resources.predictor_evaluation_execution import \
+    PredictorEvaluationExecutionCollection
+from citrine.resources.project import ProjectCollection
+from citrine.resources.property_template import PropertyTemplate
+from citrine.resources.material_template import MaterialTemplate
+from tests.test_async_session import run
+from tests.utils.factories import MaterialRunFactory, MaterialRunDataFactory, ProjectDataFactory
+from tests.utils.session import FakeSession, FakeCall
+
+PROJECT_ID = UUID('6b608f78-e341-422c-8076-35adc8828545')
+DATASET_ID = UUID('8da51e93-8b55-4dd3-8489-af8f65d4ad9a')
+
+
+class FakeAsyncSession:
+    """Awaitable wrapper around a FakeSession, so calls can be inspected the usual way."""
+
+    cursor_paged_resource = staticmethod(AsyncSession.cursor_paged_resource)
+
+    def __init__(self, session: FakeSession):
+        self.fake = session
+
+    async def get_resource(self, path, **kwargs):
+        return self.fake.get_resource(path, **kwargs)
+
+    async def post_resource(self, path, json, **kwargs):
+        return self.fake.post_resource(path, json, **kwargs)
+
+    async def put_resource(self, path, json, **kwargs):
+        return self.fake.put_resource(path, json, **kwargs)
+
+    async def delete_resource(self, path, **kwargs):
+        return self.fake.delete_resource(path, **kwargs)
+
+
+class TaggingAsyncSession(FakeAsyncSession):
+    """Also records the operations that each request is attributed to."""
+
+    def __init__(self, session: FakeSession):
+        super().__init__(session)
+        self.tags = []
+
+    async def get_resource(self, path, **kwargs):
+        self.tags.append(current_tags())
+        return await super().get_resource(path, **kwargs)
+
+    async def put_resource(self, path, json, **kwargs):
+        self.tags.append(current_tags())
+        return await super().put_resource(path, json, **kwargs)
+
+
+@pytest.fixture
+def session() -> FakeSession:
+    return FakeSession()
+
+
+@pytest.fixture
+def runs(session) -> AsyncCollection:
+    collection = MaterialRunCollection(PROJECT_ID, DATASET_ID, session)
+    return AsyncCollection(collection, FakeAsyncSession(session))
+
+
+def collect(async_iterator):
+    async def consume():
+        return [x async for x in async_iterator]
+    return run(consume())
+
+
+def test_get(runs, session):
+    session.set_response(MaterialRunDataFactory(name='async run'))
+    assert run(runs.get(uuid4())).name == 'async run'
+    assert session.last_call.method == 'GET'
+
+
+def test_list_data_concepts(runs, session):
+    session.set_responses({'contents': [MaterialRunDataFactory(name='a')], 'next': 'x'},
+                          {'contents': [MaterialRunDataFactory(name='b')]})
+    assert [r.name for r in collect(runs.list(per_page=1))] == ['a', 'b']
+    assert session.last_call.params['cursor'] == 'x'
+
+
+def test_register_and_register_all(runs, session):
+    session.set_response(MaterialRunDataFactory(name='registered'))
+    assert run(runs.register(MaterialRunFactory())).name == 'registered'
+
+    models = [MaterialRunFactory(name='1'), MaterialRunFactory(name='2')]
+    session.set_response({'objects': [m.dump() for m in models]})
+    assert [r.name for r in run(runs.register_all(models))] == ['1', '2']
+    assert session.last_call.path.endswith('/material-runs/batch')
+
+
+def test_register_all_gemd_resources(session):
+    collection = GEMDResourceCollection(PROJECT_ID, DATASET_ID, session)
+    gemd = AsyncCollection(collection, FakeAsyncSession(session))
+    prop = PropertyTemplate("prop", bounds=IntegerBounds(0, 1))
+    material = MaterialTemplate("material", properties=[[prop, IntegerBounds(0, 1)]])
+
+    registered = run(gemd.register_all([material, prop]))
+    assert [type(r) for r in registered] == [PropertyTemplate, MaterialTemplate]
+    # Templates are written before the objects that reference them
+    assert [c.path.split('/')[-2] for c in session.calls] == ['property-templates',
+                                                              'material-templates']
+    assert material.uids and prop.uids
+
+
+def test_delete(runs, session):
+    uid = uuid4()
+    run(runs.delete(uid, dry_run=True))
+    assert session.last_call == FakeCall(
+        method='DELETE',
+        path='projects/{}/datasets/{}/material-runs/id/{}'.format(PROJECT_ID, DATASET_ID, uid),
+        params={'dry_run': True})
+
+
+def test_offset_paged_collection(session):
+    projects = AsyncCollection(ProjectCollection(session), FakeAsyncSession(session))
+    data = ProjectDataFactory.create_batch(3)
+    session.set_responses({'projects': data[:2]}, {'projects': data[2:]})
+    assert [p.name for p in collect(projects.list(per_page=2))] == [d['name'] for d in data]
+
+    session.set_response({'project': data[0]})
+    assert run(projects.get(data[0]['id'])).name == data[0]['name']
+
+    session.set_response({'project': data[0]})
+    assert run(projects.register(ProjectCollection(session).build(data[0]))).name == data[0]['name']
+
+    with pytest.raises(NotImplementedError):
+        run(projects.register_all([]))
+
+
+def test_object_cache_is_shared_with_sync_verbs(runs, session):
+    session.object_cache = ObjectCache()
+    sync_runs = runs.collection
+    stored = MaterialRunDataFactory(name='stored', dataset=str(DATASET_ID))
+    uid = stored['uids']['id']
+
+    # Objects read or written asynchronously are served to the sync verbs from the cache
+    session.set_response(stored)
+    assert run(runs.get(uid)).name == 'stored'
+    assert sync_runs.get(uid).name == 'stored'
+    assert session.num_calls == 1
+
+    updated = dict(stored, name='updated')
+    session.set_response(updated)
+    run(runs.register(sync_runs.build(updated)))
+    assert sync_runs.get(uid).name == 'updated'
+    assert run(runs.get(uid)).name == 'updated'
+
+    session.set_response({'objects': [dict(stored, name='batch')]})
+    run(runs.register_all([sync_runs.build(stored)]))
+    assert sync_runs.get(uid).name == 'batch'
+    assert session.num_calls == 3
+
+    # A dry run does not change the cache, and a deletion drops the object from it
+    session.set_response(dict(stored, name='dry run'))
+    run(runs.register(sync_runs.build(stored), dry_run=True))
+    assert sync_runs.get(uid).name == 'batch'
+    run(runs.delete(uid))
+    session.set_response(NotFound('gone'))
+    with pytest.raises(NotFound):
+        sync_runs.get(uid)
+
+
+def test_list_is_restricted_to_reproducible_paging(session):
+    executions = PredictorEvaluationExecutionCollection(PROJECT_ID, session, uuid4())
+    files = FileCollection(PROJECT_ID, DATASET_ID, session)
+    for collection in [executions, files]:
+        with pytest.raises(NotImplementedError):
+            collect(AsyncCollection(collection, FakeAsyncSession(session)).list())
+    assert session.num_calls == 0
+
+
+def test_poll_for_job_completion(runs, session):
+    job_id = uuid4()
+    session.set_responses({'job_type': 'x', 'status': 'Running', 'tasks': []},
+                          {'job_type': 'x', 'status': 'Success', 'tasks': []})
+    assert run(runs.poll_for_job_completion(job_id, polling_delay=0)).status == 'Success'
+
+    session.set_response({'job_type': 'x', 'status': 'Running', 'tasks': []})
+    with pytest.raises(PollingTimeoutError):
+        run(runs.poll_for_job_completion(job_id, timeout=0, polling_delay=0))
+
+    session.set_response({'job_type': 'x', 'status': 'Failure', 'tasks': [
+        {'id': 'a', 'task_type': 't', 'status': 'Failure', 'dependencies': [],
+         'failure_reason': 'nope'}]})
+    with pytest.raises(JobFailureError):
+        run(runs.poll_for_job_completion(job_id))
+
+
+def test_requests_are_tagged(session):
+    fake = TaggingAsyncSession(session)
+    runs = AsyncCollection(MaterialRunCollection(PROJECT_ID, DATASET_ID, session), fake)
+    projects = AsyncCollection(ProjectCollection(session), fake)
+    gemd = AsyncCollection(GEMDResourceCollection(PROJECT_ID, DATASET_ID, session), fake)
+
+    session.set_responses({'contents': [MaterialRunDataFactory()]}, {'projects': []},
+                          {'job_type': 'x', 'status': 'Success', 'tasks': []})
+    assert len(collect(runs.list())) == 1
+    assert collect(projects.list()) == []
+    run(runs.poll_for_job_completion(uuid4()))
+    run(gemd.register_all([PropertyTemplate("a", bounds=IntegerBounds(0, 1)),
+                           PropertyTemplate("b", bounds=IntegerBounds(0, 1))]))
+    assert fake.tags == [('list',), ('list',), ('poll_job',), ('register_all',)]
+    # The consumer of a listing is not attributed to it
+    assert current_tags() == ()
@@ -50,6 +50,44 @@ def test_pagination_deduplicates_repeated_intermediate_values():
     assert list(result) == [a, b, c]
 
 
+def test_parallel_pagination_preserves_order():
+    elements = [DummyResource(str(i)) for i in range(23)]
+    fetcher = paged_fetcher(elements)
+    result = Paginator().paginate(fetcher, lambda x: x, per_page=5, concurrency=4)
+    assert list(result) == elements
+    # The first page is requested without a page number, then 2, 3, ...
+    assert sorted(fetcher.pages_requested, key=lambda p: p or 1)[:5] == [None, 2, 3, 4, 5]
+
+
+def test_parallel_pagination_deduplicates_and_stops_on_repeats():
+    # The backend ignores pagination and returns the same page every time
+    fetcher = paged_fetcher([a, b], ignore_page=True)
+    result = Paginator().paginate(fetcher, lambda x: x, per_page=2, concurrency=3)
+    assert list(result) == [a, b]
+
+    pages = [[a, b], [b, c], [c]]
+    fetcher = Mock(side_effect=lambda page, per_page: (pages[(page or 1) - 1] if (page or 1) <= 3 else [], ""))
+    result = Paginator().paginate(fetcher, lambda x: x, per_page=2, concurrency=2)
+    assert list(result) == [a, b, c]
+
+
+def test_parallel_pagination_single_page():
+    fetcher = paged_fetcher([a, b, c])
+    result = Paginator().paginate(fetcher, lambda x: x, page=2, per_page=1, concurrency=4)
+    assert list(result) == [b]
+    assert fetcher.pages_requested == [2]
+
+
+def paged_fetcher(elements, ignore_page=False):
+    """A thread-safe fetcher that serves `elements` in pages selected by the page number."""
+    def fetch(page, per_page):
+        fetch.pages_requested.append(page)
+        start = 0 if ignore_page else ((page or 1) - 1) * per_page
+        return elements[start:start + per_page], ""
+    fetch.pages_requested = []
+    return fetch
+
+
 def mocked_fetcher(*args):
     """
     Take a list of arguments, and return them (wrapped in a list) in subsequent calls to this mock.
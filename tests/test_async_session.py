@@ -0,0 +1,199 @@
+import asyncio
+import gzip
+import json
+from datetime import datetime, timedelta
+
+import aiohttp
+import pytest
+import requests_mock
+
+from citrine._async_session import AsyncSession, AsyncResponse, _encode_params
+from citrine._session import Session
+from citrine._utils.telemetry import RequestTelemetry, operation
+from citrine.exceptions import NotFound, BadRequest
+from tests.test_session import refresh_token
+from tests.utils.session import make_fake_cursor_request_function
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def json_response(method, status_code, body, headers=None):
+    return AsyncResponse(method, status_code, 'Reason', headers or {}, json.dumps(body).encode())
+
+
+class FakeTransport:
+    """Records the requests an AsyncSession sends and replays canned responses."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    async def __call__(self, method, uri, **kwargs):
+        self.calls.append((method, uri, kwargs))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def session():
+    session = Session(refresh_token='12345', scheme='http', host='citrine-testing.fake')
+    session.access_token = 'token'
+    session.access_token_expiration = datetime.utcnow() + timedelta(minutes=3)
+    return session
+
+
+@pytest.fixture
+def async_session(session):
+    async_session = AsyncSession(session)
+    async_session._backoff = lambda attempt: 0
+    return async_session
+
+
+def test_get_resource(async_session):
+    async_session._send = FakeTransport(json_response('GET', 200, {'foo': 'bar'}))
+    assert run(async_session.get_resource('/foo', params={'flag': True, 'tags': ['a', 'b']})) \
+        == {'foo': 'bar'}
+
+    method, uri, kwargs = async_session._send.calls[0]
+    assert (method, uri) == ('GET', 'http://citrine-testing.fake/api/v1/foo')
+    assert kwargs['params'] == [('flag', 'True'), ('tags', 'a'), ('tags', 'b')]
+    assert kwargs['headers']['Authorization'] == 'Bearer token'
+
+
+def test_put_resource_sends_json(async_session):
+    async_session._send = FakeTransport(json_response('PUT', 200, {'ok': 1}))
+    assert run(async_session.put_resource('foo', json={'a': 1}, version='v2')) == {'ok': 1}
+    method, uri, kwargs = async_session._send.calls[0]
+    assert uri == 'http://citrine-testing.fake/api/v2/foo'
+    assert json.loads(kwargs['data']) == {'a': 1}
+
+
+def test_large_bodies_are_compressed(session, async_session):
+    session.telemetry = RequestTelemetry()
+    session.request_compression = 'gzip'
+    session.request_compression_threshold = 100
+    body = {'objects': [{'name': 'cake {}'.format(i)} for i in range(100)]}
+    async_session._send = FakeTransport(json_response('PUT', 200, {'ok': 1}),
+                                        json_response('PUT', 200, {'ok': 1}))
+
+    run(async_session.put_resource('foo', json=body))
+    run(async_session.put_resource('foo', json={'a': 1}))
+
+    (_, _, large), (_, _, small) = async_session._send.calls
+    assert large['headers']['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(large['data'])) == body
+    assert 'Content-Encoding' not in small['headers'] and json.loads(small['data']) == {'a': 1}
+    stats = session.telemetry.snapshot()['total']
+    assert stats['bytes_sent'] == len(large['data']) + len(small['data'])
+    assert stats['uncompressed_bytes_sent'] == \
+        len(session.json_codec.dumps(body)) + len(small['data'])
+
+
+def test_tasks_have_their_own_operations(session, async_session):
+    records = []
+    session.telemetry = RequestTelemetry(listeners=[records.append])
+    async_session._send = FakeTransport(*[json_response('GET', 200, {}) for _ in range(3)])
+
+    async def get(name):
+        with operation(name):
+            await asyncio.sleep(0)  # Let the other task start its operation
+            return await async_session.get_resource('/foo')
+
+    async def main():
+        with operation('outer'):
+            await asyncio.gather(get('a'), get('b'))
+        await async_session.get_resource('/foo')
+
+    run(main())
+    assert sorted(record.tags for record in records) == [(), ('outer', 'a'), ('outer', 'b')]
+
+
+def test_error_mapping_is_shared(async_session):
+    async_session._send = FakeTransport(json_response('GET', 404, {}),
+                                        json_response('POST', 400, {'message': 'bad'}))
+    with pytest.raises(NotFound):
+        run(async_session.get_resource('/foo'))
+    with pytest.raises(BadRequest):
+        run(async_session.post_resource('/foo', json={}))
+
+
+def test_retries(session, async_session):
+    session.telemetry = RequestTelemetry()
+    async_session._send = FakeTransport(
+        aiohttp.ClientConnectionError(),
+        json_response('GET', 502, {}),
+        json_response('GET', 200, {'foo': 'bar'}))
+    assert run(async_session.get_resource('/foo')) == {'foo': 'bar'}
+    assert len(async_session._send.calls) == 3
+    stats = session.telemetry.snapshot()['endpoints']['GET foo']
+    assert (stats['count'], stats['retries'], stats['statuses']) == (1, 2, {'200': 1})
+
+    # POST is not idempotent, so retryable statuses are not retried
+    async_session._send = FakeTransport(json_response('POST', 502, {}))
+    with pytest.raises(Exception):
+        run(async_session.post_resource('/foo', json={}))
+    assert len(async_session._send.calls) == 1
+
+
+def test_refreshes_expired_token_once(session, async_session):
+    session.access_token_expiration = datetime.utcnow() - timedelta(minutes=1)
+    async_session._send = FakeTransport(*[json_response('GET', 200, {'n': i}) for i in range(5)])
+
+    async def many_gets():
+        return await asyncio.gather(*[async_session.get_resource('/foo') for _ in range(5)])
+
+    with requests_mock.Mocker() as m:
+        m.post('http://citrine-testing.fake/api/v1/tokens/refresh',
+               json=refresh_token(datetime.utcnow() + timedelta(hours=1)))
+        results = run(many_gets())
+        assert m.call_count == 1
+
+    assert len(results) == 5
+    assert all(call[2]['headers']['Authorization'] == 'Bearer ' + session.access_token
+               for call in async_session._send.calls)
+
+
+def test_invalid_token_is_refreshed(session, async_session):
+    async_session._send = FakeTransport(json_response('GET', 401, {'reason': 'invalid-token'}),
+                                        json_response('GET', 200, {'foo': 'bar'}))
+    with requests_mock.Mocker() as m:
+        m.post('http://citrine-testing.fake/api/v1/tokens/refresh',
+               json=refresh_token(datetime.utcnow() + timedelta(hours=1)))
+        assert run(async_session.get_resource('/foo')) == {'foo': 'bar'}
+    assert async_session._send.calls[1][2]['headers']['Authorization'] != 'Bearer token'
+
+
+def test_cursor_paged_resource():
+    full_result_set = list(range(26))
+    fake_request = make_fake_cursor_request_function(full_result_set)
+
+    async def fake_async_request(*args, **kwargs):
+        return fake_request(*args, **kwargs)
+
+    async def collect():
+        return [x async for x in AsyncSession.cursor_paged_resource(fake_async_request, 'foo',
+                                                                     per_page=10)]
+
+    assert run(collect()) == full_result_set
+
+
+def test_encode_params():
+    assert _encode_params(None) == []
+    assert _encode_params({'a': None, 'b': 1}) == [('b', '1')]
+
+
+def test_close(async_session):
+    async def use_and_close():
+        async with async_session:
+            async_session._get_client()
+        return async_session._client
+
+    assert run(use_and_close()) is None
@@ -1,4 +1,7 @@
 import platform
+import subprocess
+import sys
+
 from citrine import Citrine
 
 
@@ -32,3 +35,12 @@ def test_citrine_user_agent():
             # enforce them to be ints.  It's common to see strings used
             # as the patch version
             assert len(product_version.split('.')) == 3
+
+
+def test_citrine_import_is_lazy():
+    # The resources, gemd, boto3 and asyncio are loaded when they are first used
+    heavy = ['citrine.resources.project', 'gemd.json', 'boto3', 'asyncio']
+    script = 'import sys, citrine; print([m for m in {!r} if m in sys.modules])'.format(heavy)
+    output = subprocess.run([sys.executable, '-c', script], check=True,
+                            stdout=subprocess.PIPE, universal_newlines=True).stdout
+    assert output.strip() == '[]'
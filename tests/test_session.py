@@ -1,4 +1,8 @@
+import gzip
 import json
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 
 import jwt
 import pytest
@@ -9,15 +13,20 @@ from citrine.exceptions import (
     WorkflowConflictException,
     WorkflowNotReadyException,
     RetryableException,
-    BadRequest)
+    BadRequest,
+    PayloadTooLarge)
 
 from datetime import datetime, timedelta
 import pytz
+from uuid import uuid4
 import mock
 import requests
 import requests_mock
 from urllib.parse import urlsplit
+from citrine._rest.paginator import Paginator
 from citrine._session import Session
+from citrine._utils.json_codec import JsonCodec
+from citrine._utils.telemetry import RequestTelemetry, operation
 from citrine.exceptions import UnauthorizedRefreshToken, Unauthorized, NotFound
 from tests.utils.session import make_fake_cursor_request_function
 
@@ -96,6 +105,16 @@ class SessionTests(unittest.TestCase):
         with pytest.raises(WorkflowConflictException):
             Session().checked_request('method', 'path')
 
+    @mock.patch.object(Session, '_refresh_access_token')
+    @mock.patch.object(requests.Session, 'request')
+    def test_status_code_413(self, mock_request, _):
+        resp = mock.Mock()
+        resp.status_code = 413
+        resp.text = 'Request entity too large'
+        mock_request.return_value = resp
+        with pytest.raises(PayloadTooLarge):
+            Session().checked_request('method', 'path')
+
     @mock.patch.object(Session, '_refresh_access_token')
     @mock.patch.object(requests.Session, 'request')
     def test_status_code_425(self, mock_request, _):
@@ -245,6 +264,27 @@ def test_cursor_paged_resource():
     assert list(Session.cursor_paged_resource(fake_request, 'foo', forward=True, per_page=40)) == full_result_set
 
 
+def test_cursor_paged_resource_prefetch():
+    full_result_set = list(range(26))
+
+    fake_request = make_fake_cursor_request_function(full_result_set)
+
+    # reading ahead should not affect final result either
+    for prefetch in (1, 3):
+        assert list(Session.cursor_paged_resource(fake_request, 'foo', per_page=5, prefetch=prefetch)) == full_result_set
+
+    # errors from a page fetched in the background surface to the caller
+    def failing_request(*_, params=None, **__):
+        if 'cursor' in params:
+            raise NotFound('foo')
+        return fake_request(params=params)
+
+    results = Session.cursor_paged_resource(failing_request, 'foo', per_page=5, prefetch=2)
+    assert [next(results) for _ in range(5)] == full_result_set[:5]
+    with pytest.raises(NotFound):
+        next(results)
+
+
 def test_bad_json_response(session: Session):
     with requests_mock.Mocker() as m:
         m.delete('http://citrine-testing.fake/api/v1/bar/something', status_code=200)
@@ -282,3 +322,178 @@ def test_base_url_assembly():
             assert str(base.port) == scenario.get('port', default_base.port)
         else:
             assert base.port is None
+
+
+def test_telemetry(session: Session):
+    session.telemetry = RequestTelemetry()
+    session.access_token_expiration = datetime.utcnow() - timedelta(minutes=1)
+    token_refresh_response = refresh_token(datetime.utcnow() + timedelta(minutes=3))
+    project_id = '6b608f78-e341-422c-8076-35adc8828545'
+
+    with requests_mock.Mocker() as m:
+        m.post('http://citrine-testing.fake/api/v1/tokens/refresh', json=token_refresh_response)
+        m.post('http://citrine-testing.fake/api/v1/projects/{}/foo'.format(project_id),
+               json={'foo': 'bar'})
+        m.get('http://citrine-testing.fake/api/v1/projects/{}/missing'.format(project_id),
+              status_code=404)
+
+        with operation('register_all'):
+            session.post_resource('/projects/{}/foo'.format(project_id), json={'a': 1})
+        with pytest.raises(NotFound):
+            session.get_resource('/projects/{}/missing'.format(project_id))
+
+    snapshot = session.telemetry.snapshot()
+    post = snapshot['endpoints']['POST projects/{id}/foo']
+    assert post['count'] == 1
+    assert post['token_refreshes'] == 1
+    assert post['bytes_sent'] == len(session.json_codec.dumps({'a': 1}))
+    assert post['bytes_received'] == len(b'{"foo": "bar"}')
+    missing = snapshot['endpoints']['GET projects/{id}/missing']
+    assert (missing['errors'], missing['statuses'], missing['token_refreshes']) == (1, {'404': 1}, 0)
+    assert list(snapshot['operations']) == ['register_all']
+
+
+def test_request_compression(session: Session):
+    session.telemetry = RequestTelemetry()
+    session.request_compression_threshold = 100
+    body = {'objects': [{'name': 'cake {}'.format(i)} for i in range(100)]}
+    compressed_response = gzip.compress(json.dumps(body).encode())
+
+    with requests_mock.Mocker() as m:
+        m.put('http://citrine-testing.fake/api/v1/foo', content=compressed_response,
+              headers={'Content-Encoding': 'gzip',
+                       'Content-Length': str(len(compressed_response))})
+
+        # Off by default
+        assert session.put_resource('/foo', json=body) == body
+        assert 'Content-Encoding' not in m.last_request.headers
+        assert 'gzip' in m.last_request.headers['Accept-Encoding']
+
+        session.request_compression = 'deflate'
+        session.put_resource('/foo', json=body)
+        assert m.last_request.headers['Content-Encoding'] == 'deflate'
+        assert json.loads(zlib.decompress(m.last_request.body)) == body
+        deflated_size = len(m.last_request.body)
+
+        session.request_compression = 'gzip'
+        session.put_resource('/foo', json={'a': 1})  # Under the threshold
+        assert 'Content-Encoding' not in m.last_request.headers
+        assert m.last_request.json() == {'a': 1}
+
+    with pytest.raises(ValueError):
+        session.request_compression = 'br'
+
+    stats = session.telemetry.snapshot()['endpoints']['PUT foo']
+    body_size = len(session.json_codec.dumps(body))
+    small_size = len(session.json_codec.dumps({'a': 1}))
+    assert stats['uncompressed_bytes_sent'] == 2 * body_size + small_size
+    assert stats['bytes_sent'] == body_size + deflated_size + small_size
+    assert deflated_size < body_size / 4
+    assert stats['bytes_received'] == 3 * len(compressed_response)
+    assert stats['uncompressed_bytes_received'] == 3 * len(json.dumps(body).encode())
+
+
+def test_json_codec(session: Session):
+    decoded = []
+
+    class RecordingCodec(JsonCodec):
+        def loads(self, data):
+            decoded.append(data)
+            return super().loads(data)
+
+    session.json_codec = RecordingCodec()
+    uid = uuid4()
+    with requests_mock.Mocker() as m:
+        m.post('http://citrine-testing.fake/api/v1/foo', json={'id': str(uid)})
+        assert session.post_resource('/foo', json={'id': uid}) == {'id': str(uid)}
+        assert m.last_request.json() == {'id': str(uid)}
+        assert m.last_request.headers['Content-Type'] == 'application/json'
+    assert decoded == [json.dumps({'id': str(uid)}).encode()]
+
+
+def test_telemetry_cursor_paging(session: Session):
+    session.telemetry = RequestTelemetry()
+    with requests_mock.Mocker() as m:
+        m.get('http://citrine-testing.fake/api/v2/things', [
+            {'json': {'contents': [1, 2], 'next': 'abc'}},
+            {'json': {'contents': [3]}},
+        ])
+        assert list(session.cursor_paged_resource(session.get_resource, '/things')) == [1, 2, 3]
+
+    assert session.telemetry.snapshot()['operations']['list']['count'] == 2
+
+
+def test_concurrent_refreshes_are_single_flight(session: Session):
+    session.access_token_expiration = datetime.utcnow() - timedelta(minutes=1)
+    token_refresh_response = refresh_token(datetime.utcnow() + timedelta(minutes=3))
+
+    def slow_refresh(request, context):
+        time.sleep(0.1)  # Long enough for every thread to find the token expired
+        return token_refresh_response
+
+    with requests_mock.Mocker() as m:
+        refresh = m.post('http://citrine-testing.fake/api/v1/tokens/refresh', json=slow_refresh)
+        m.get('http://citrine-testing.fake/api/v1/foo', json={'foo': 'bar'})
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: session.get_resource('/foo'), range(8)))
+
+    assert results == [{'foo': 'bar'}] * 8
+    assert refresh.call_count == 1
+
+
+def test_background_token_refresher(session: Session):
+    # Due for a proactive refresh, though requests would still use the current token
+    session.access_token = 'current'
+    session.access_token_expiration = datetime.utcnow() + timedelta(seconds=30)
+    token_refresh_response = refresh_token(datetime.utcnow() + timedelta(minutes=30))
+
+    with requests_mock.Mocker() as m:
+        refresh = m.post('http://citrine-testing.fake/api/v1/tokens/refresh',
+                         json=token_refresh_response)
+        session.start_token_refresher(lead_time=60)
+        session.start_token_refresher(lead_time=60)  # Already running
+        deadline = time.monotonic() + 5
+        while session.access_token == 'current' and time.monotonic() < deadline:
+            time.sleep(0.01)
+        thread, _ = session._token_refresher
+        session.close()
+
+    assert session.access_token == token_refresh_response['access_token']
+    assert refresh.call_count == 1
+    assert session._token_refresher is None
+    assert not thread.is_alive()
+    session.stop_token_refresher()  # Already stopped
+
+
+def test_connection_pool_configuration():
+    session = Session(refresh_token='12345', scheme='http', host='citrine-testing.fake',
+                      pool_maxsize=4, pool_block=True, keep_alive=False)
+    adapter = session.get_adapter('http://citrine-testing.fake')
+    assert adapter._pool_maxsize == 4
+    assert adapter._pool_block
+    assert session.headers['Connection'] == 'close'
+
+    retired = adapter.poolmanager
+    retired.connection_from_url('http://citrine-testing.fake')
+    session.ensure_pool_size(16)
+    # The pool is resized in place, and the connections of the old one are closed
+    assert session.get_adapter('https://citrine-testing.fake') is adapter
+    assert adapter._pool_maxsize == 16
+    assert adapter.poolmanager.connection_pool_kw['maxsize'] == 16
+    assert adapter.poolmanager.connection_pool_kw['block']
+    assert len(retired.pools) == 0
+    session.ensure_pool_size(2)  # Never shrinks
+    assert session.get_adapter('http://citrine-testing.fake')._pool_maxsize == 16
+
+    # Listings grow the pool when they fan out, rather than when the attribute is set
+    session.page_fetch_concurrency = 20
+    assert adapter._pool_maxsize == 16
+    elements = Paginator().paginate(page_fetcher=lambda page, per_page: ([], ''),
+                                    collection_builder=lambda elements: elements,
+                                    concurrency=session.page_fetch_concurrency,
+                                    session=session)
+    assert list(elements) == []
+    assert adapter._pool_maxsize == 20
+
+    with pytest.raises(ValueError):
+        Session(refresh_token='12345', pool_maxsize=0)
@@ -1,11 +1,18 @@
-from json import dumps
+from json import dumps, loads
+from threading import Lock
 from typing import Callable, Iterator, List
 from urllib.parse import urlencode
 
+from citrine._utils.json_codec import EncodedJson, JsonCodec
 from citrine.exceptions import NonRetryableHttpException
 from citrine.resources.api_error import ValidationError
 
 
+def _decoded(json):
+    """The JSON body of a request, decoded if it was sent already encoded."""
+    return loads(json.data) if isinstance(json, EncodedJson) else json
+
+
 class FakeCall:
     """Encapsulates a call to a FakeSession."""
 
@@ -44,6 +51,14 @@ class FakeSession:
         self.s3_use_ssl = True
         self.s3_addressing_style = 'auto'
         self.use_idempotent_dataset_put = False
+        self.cursor_prefetch_pages = 0
+        self.page_fetch_concurrency = 1
+        self.object_cache = None
+        self.table_cache = None
+        self.telemetry = None
+        self.request_compression = None
+        self.request_compression_threshold = 64 * 1024
+        self.json_codec = JsonCodec()
 
     def set_response(self, resp):
         self.responses = [resp]
@@ -76,10 +91,12 @@ class FakeSession:
         return self._get_response()
 
     def checked_post(self, path: str, json: dict, **kwargs) -> dict:
+        json = _decoded(json)
         self.calls.append(FakeCall('POST', path, json, params=kwargs.get('params')))
         return self._get_response(default_response=json)
 
     def checked_put(self, path: str, json: dict, **kwargs) -> dict:
+        json = _decoded(json)
         self.calls.append(FakeCall('PUT', path, json, params=kwargs.get('params')))
         return self._get_response(default_response=json)
 
@@ -101,10 +118,14 @@ class FakeSession:
             raise response
         return response
 
+    def ensure_pool_size(self, connections: int) -> None:
+        pass
+
     @staticmethod
     def cursor_paged_resource(base_method: Callable[..., dict], path: str,
                               forward: bool = True, per_page: int = 100,
-                              version: str = 'v2', **kwargs) -> Iterator[dict]:
+                              version: str = 'v2', prefetch: int = 0,
+                              **kwargs) -> Iterator[dict]:
         """
         Returns a flat generator of results for an API query.
 
@@ -173,6 +194,45 @@ class FakeS3Client:
         return self.put_object_output
 
 
+class FakeMultipartS3Client:
+    """A fake S3 client that supports multipart uploads, and can fail some part uploads."""
+
+    def __init__(self, failures: dict = None):
+        # part number -> times to fail, or an exception to raise once instead
+        self.failures = dict(failures or {})
+        self.created = []
+        self.parts = {}
+        self.completed = None
+        self.aborted = []
+        self._lock = Lock()
+
+    def create_multipart_upload(self, **kwargs):
+        self.created.append(kwargs)
+        return {'UploadId': 'multipart-{}'.format(len(self.created))}
+
+    def upload_part(self, *, PartNumber, Body, UploadId, **kwargs):
+        from botocore.exceptions import ClientError
+        with self._lock:
+            failure = self.failures.get(PartNumber, 0)
+            if isinstance(failure, BaseException):
+                del self.failures[PartNumber]
+                raise failure
+            if failure > 0:
+                self.failures[PartNumber] -= 1
+                raise ClientError(error_response={}, operation_name='UploadPart')
+            self.parts[(UploadId, PartNumber)] = Body
+        return {'ETag': 'etag-{}'.format(PartNumber)}
+
+    def abort_multipart_upload(self, *, UploadId, **kwargs):
+        self.aborted.append(UploadId)
+        self.parts = {key: body for key, body in self.parts.items() if key[0] != UploadId}
+
+    def complete_multipart_upload(self, *, UploadId, MultipartUpload, **kwargs):
+        self.completed = b''.join(self.parts[(UploadId, part['PartNumber'])]
+                                  for part in MultipartUpload['Parts'])
+        return {'VersionId': '7'}
+
+
 class FakeRequestResponse:
     """A fake version of a requests.request() response."""
 